@@ -11,14 +11,23 @@ This script demonstrates all the features of the task management system:
 
 import asyncio
 import json
+from collections import defaultdict
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.columns import Columns
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
+
+from rich.console import Console, Group
+from rich.text import Text
 
 from src.models.task import (
     ComplexityLevel,
@@ -35,100 +44,143 @@ from src.storage.networkx_graph import NetworkXGraphStorage
 
 console = Console()
 
+# Number of tasks handed to a single bulk insert
+BULK_CHUNK_SIZE = 256
 
-async def create_demo_project(service: TaskService) -> dict:
-    """Create a comprehensive demo project with realistic tasks."""
-    console.print(Panel.fit("🏗️ Creating Demo Project: Web Application", style="bold blue"))
-    
+# Write the JSON export compactly; set to True for an indented, diff-friendly file
+PRETTY_EXPORT = False
+
+# Pre-rendered markup for values shown in tables and panels
+PRIORITY_TAG = {
+    p: f"[{c}]{p}[/{c}]"
+    for p, c in {"P0": "red", "P1": "orange3", "P2": "yellow", "P3": "blue"}.items()
+}
+STATUS_TAG = {
+    s: f"[{c}]{s}[/{c}]"
+    for s, c in {
+        "COMPLETED": "green", "IN_PROGRESS": "blue", "PENDING": "yellow", "BLOCKED": "red"
+    }.items()
+}
+STATUS_EMOJI = {"PENDING": "⏳", "IN_PROGRESS": "🔄", "COMPLETED": "✅"}
+
+# Static part of the closing summary, parsed from markup once
+SUMMARY_TEXT = Text.from_markup(
+    "[bold green]🎉 System demonstration completed successfully![/bold green]\n\n"
+    "[bold]Key Features Demonstrated:[/bold]\n"
+    "• ✅ Comprehensive task creation with metadata\n"
+    "• ✅ Dependency graph management and cycle prevention\n"
+    "• ✅ Topological sorting for execution order\n"
+    "• ✅ Advanced filtering and querying\n"
+    "• ✅ Real-time project statistics and analytics\n"
+    "• ✅ Status tracking and workflow management\n"
+    "• ✅ Data persistence and export capabilities\n"
+    "• ✅ Integration between graph and table storage\n"
+)
+
+# (dependent, dependency) task names for the demo dependency graph
+DEP_BY_NAME: list[tuple[str, str]] = [
+    # Backend depends on infrastructure
+    ("Authentication and Authorization System", "Project Setup and Configuration"),
+    ("Authentication and Authorization System", "Database Schema Design and Setup"),
+    ("RESTful API Framework and Core Endpoints", "Authentication and Authorization System"),
+    
+    # Frontend depends on backend
+    ("React Application Setup and Architecture", "RESTful API Framework and Core Endpoints"),
+    ("User Interface Components and Styling", "React Application Setup and Architecture"),
+    
+    # Testing depends on implementation
+    ("Backend Testing Suite", "RESTful API Framework and Core Endpoints"),
+    ("Frontend Testing and Quality Assurance", "User Interface Components and Styling"),
+    
+    # Deployment depends on everything
+    ("Production Deployment Configuration", "Backend Testing Suite"),
+    ("Production Deployment Configuration", "Frontend Testing and Quality Assurance"),
+]
+
+
+def _val(value):
+    """Return the value of an enum member, or the value itself if already plain."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _short(text, limit=30):
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _rf(path, type, description):
+    """Build a RelatedFile from a trusted literal, skipping Pydantic validation."""
+    return RelatedFile.model_construct(path=path, type=type, description=description)
+
+
+# Demo project task templates, grouped by phase. Templates are trusted
+# literals, so both tasks and related files are built with model_construct.
+TASK_TEMPLATES: dict[str, tuple[dict, ...]] = {
     # Phase 1: Infrastructure and Setup
-    infrastructure_tasks = [
-        Task(
-            name="Project Setup and Configuration",
-            description="Initialize project structure, set up development environment, and configure CI/CD pipeline",
-            implementation_guide=(
+    "Infrastructure": (
+        {
+            "name": "Project Setup and Configuration",
+            "description": "Initialize project structure, set up development environment, and configure CI/CD pipeline",
+            "implementation_guide": (
                 "1. Create Git repository with proper .gitignore and README\n"
                 "2. Set up Python virtual environment with requirements.txt\n"
                 "3. Configure pre-commit hooks for code quality\n"
                 "4. Set up GitHub Actions for automated testing and deployment\n"
                 "5. Create development and production environment configurations"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- Repository has proper structure and documentation\n"
                 "- CI/CD pipeline runs successfully\n"
                 "- Development environment can be set up from scratch\n"
                 "- All code quality checks pass"
             ),
-            priority=Priority.P0,
-            complexity=ComplexityLevel.MODERATE,
-            estimated_hours=6,
-            category="DevOps",
-            notes="Foundation task - must be completed first",
-            related_files=[
-                RelatedFile(
-                    path="README.md",
-                    type=RelatedFileType.CREATE,
-                    description="Project documentation and setup instructions"
-                ),
-                RelatedFile(
-                    path=".github/workflows/ci.yml",
-                    type=RelatedFileType.CREATE,
-                    description="GitHub Actions CI/CD configuration"
-                ),
-                RelatedFile(
-                    path="requirements.txt",
-                    type=RelatedFileType.CREATE,
-                    description="Python dependencies specification"
-                )
+            "priority": Priority.P0,
+            "complexity": ComplexityLevel.MODERATE,
+            "estimated_hours": 6,
+            "category": "DevOps",
+            "notes": "Foundation task - must be completed first",
+            "related_files": [
+                _rf("README.md", RelatedFileType.CREATE, "Project documentation and setup instructions"),
+                _rf(".github/workflows/ci.yml", RelatedFileType.CREATE, "GitHub Actions CI/CD configuration"),
+                _rf("requirements.txt", RelatedFileType.CREATE, "Python dependencies specification")
             ]
-        ),
+        },
         
-        Task(
-            name="Database Schema Design and Setup",
-            description="Design and implement PostgreSQL database schema with proper indexing and constraints",
-            implementation_guide=(
+        {
+            "name": "Database Schema Design and Setup",
+            "description": "Design and implement PostgreSQL database schema with proper indexing and constraints",
+            "implementation_guide": (
                 "1. Analyze application requirements and design ERD\n"
                 "2. Create database schema with tables, relationships, and constraints\n"
                 "3. Add appropriate indexes for query optimization\n"
                 "4. Set up database migrations system\n"
                 "5. Create sample data for development and testing"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- Database schema supports all application features\n"
                 "- All foreign key relationships are properly defined\n"
                 "- Indexes are optimized for expected query patterns\n"
                 "- Migration system works correctly\n"
                 "- Sample data covers all major use cases"
             ),
-            priority=Priority.P0,
-            complexity=ComplexityLevel.COMPLEX,
-            estimated_hours=12,
-            category="Database",
-            related_files=[
-                RelatedFile(
-                    path="database/schema.sql",
-                    type=RelatedFileType.CREATE,
-                    description="Database schema definition"
-                ),
-                RelatedFile(
-                    path="database/migrations/",
-                    type=RelatedFileType.CREATE,
-                    description="Database migration scripts directory"
-                ),
-                RelatedFile(
-                    path="database/sample_data.sql",
-                    type=RelatedFileType.CREATE,
-                    description="Sample data for development"
-                )
+            "priority": Priority.P0,
+            "complexity": ComplexityLevel.COMPLEX,
+            "estimated_hours": 12,
+            "category": "Database",
+            "related_files": [
+                _rf("database/schema.sql", RelatedFileType.CREATE, "Database schema definition"),
+                _rf("database/migrations/", RelatedFileType.CREATE, "Database migration scripts directory"),
+                _rf("database/sample_data.sql", RelatedFileType.CREATE, "Sample data for development")
             ]
-        ),
-    ]
+        },
+    ),
     
     # Phase 2: Backend Development
-    backend_tasks = [
-        Task(
-            name="Authentication and Authorization System",
-            description="Implement JWT-based authentication with role-based access control and session management",
-            implementation_guide=(
+    "Backend": (
+        {
+            "name": "Authentication and Authorization System",
+            "description": "Implement JWT-based authentication with role-based access control and session management",
+            "implementation_guide": (
                 "1. Set up JWT token generation and validation\n"
                 "2. Create user registration and login endpoints\n"
                 "3. Implement role-based access control (RBAC)\n"
@@ -136,7 +188,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "5. Create session management and logout functionality\n"
                 "6. Add rate limiting and security middleware"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- Users can register, login, and logout successfully\n"
                 "- JWT tokens are generated and validated correctly\n"
                 "- Role-based permissions work as expected\n"
@@ -144,38 +196,22 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Security measures prevent common attacks\n"
                 "- API endpoints are properly protected"
             ),
-            priority=Priority.P1,
-            complexity=ComplexityLevel.COMPLEX,
-            estimated_hours=16,
-            category="Backend",
-            related_files=[
-                RelatedFile(
-                    path="src/auth/models.py",
-                    type=RelatedFileType.CREATE,
-                    description="Authentication data models"
-                ),
-                RelatedFile(
-                    path="src/auth/handlers.py",
-                    type=RelatedFileType.CREATE,
-                    description="Authentication request handlers"
-                ),
-                RelatedFile(
-                    path="src/middleware/auth.py",
-                    type=RelatedFileType.CREATE,
-                    description="Authentication middleware"
-                ),
-                RelatedFile(
-                    path="tests/test_auth.py",
-                    type=RelatedFileType.CREATE,
-                    description="Authentication system tests"
-                )
+            "priority": Priority.P1,
+            "complexity": ComplexityLevel.COMPLEX,
+            "estimated_hours": 16,
+            "category": "Backend",
+            "related_files": [
+                _rf("src/auth/models.py", RelatedFileType.CREATE, "Authentication data models"),
+                _rf("src/auth/handlers.py", RelatedFileType.CREATE, "Authentication request handlers"),
+                _rf("src/middleware/auth.py", RelatedFileType.CREATE, "Authentication middleware"),
+                _rf("tests/test_auth.py", RelatedFileType.CREATE, "Authentication system tests")
             ]
-        ),
+        },
         
-        Task(
-            name="RESTful API Framework and Core Endpoints",
-            description="Build FastAPI-based REST API with proper error handling, validation, and documentation",
-            implementation_guide=(
+        {
+            "name": "RESTful API Framework and Core Endpoints",
+            "description": "Build FastAPI-based REST API with proper error handling, validation, and documentation",
+            "implementation_guide": (
                 "1. Set up FastAPI application with proper configuration\n"
                 "2. Create base API structure with versioning\n"
                 "3. Implement request/response models with Pydantic\n"
@@ -184,7 +220,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "6. Generate interactive API documentation\n"
                 "7. Add request validation and sanitization"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- API follows RESTful conventions and best practices\n"
                 "- All endpoints have proper request/response validation\n"
                 "- Error handling provides meaningful messages\n"
@@ -192,41 +228,25 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Logging captures all important events\n"
                 "- API versioning strategy is implemented"
             ),
-            priority=Priority.P1,
-            complexity=ComplexityLevel.COMPLEX,
-            estimated_hours=14,
-            category="Backend",
-            related_files=[
-                RelatedFile(
-                    path="src/api/main.py",
-                    type=RelatedFileType.CREATE,
-                    description="FastAPI application setup"
-                ),
-                RelatedFile(
-                    path="src/api/routes/",
-                    type=RelatedFileType.CREATE,
-                    description="API route definitions directory"
-                ),
-                RelatedFile(
-                    path="src/api/models.py",
-                    type=RelatedFileType.CREATE,
-                    description="API request/response models"
-                ),
-                RelatedFile(
-                    path="src/api/exceptions.py",
-                    type=RelatedFileType.CREATE,
-                    description="Custom exception handlers"
-                )
+            "priority": Priority.P1,
+            "complexity": ComplexityLevel.COMPLEX,
+            "estimated_hours": 14,
+            "category": "Backend",
+            "related_files": [
+                _rf("src/api/main.py", RelatedFileType.CREATE, "FastAPI application setup"),
+                _rf("src/api/routes/", RelatedFileType.CREATE, "API route definitions directory"),
+                _rf("src/api/models.py", RelatedFileType.CREATE, "API request/response models"),
+                _rf("src/api/exceptions.py", RelatedFileType.CREATE, "Custom exception handlers")
             ]
-        ),
-    ]
+        },
+    ),
     
     # Phase 3: Frontend Development
-    frontend_tasks = [
-        Task(
-            name="React Application Setup and Architecture",
-            description="Set up modern React application with TypeScript, routing, and state management",
-            implementation_guide=(
+    "Frontend": (
+        {
+            "name": "React Application Setup and Architecture",
+            "description": "Set up modern React application with TypeScript, routing, and state management",
+            "implementation_guide": (
                 "1. Create React app with TypeScript and modern tooling\n"
                 "2. Set up React Router for client-side routing\n"
                 "3. Configure state management with Redux Toolkit\n"
@@ -234,7 +254,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "5. Configure build pipeline and optimization\n"
                 "6. Add development tools and debugging setup"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- React application builds and runs without errors\n"
                 "- TypeScript configuration is properly set up\n"
                 "- Routing works correctly for all planned pages\n"
@@ -242,38 +262,22 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Component library provides consistent UI elements\n"
                 "- Build pipeline produces optimized production bundle"
             ),
-            priority=Priority.P1,
-            complexity=ComplexityLevel.MODERATE,
-            estimated_hours=8,
-            category="Frontend",
-            related_files=[
-                RelatedFile(
-                    path="frontend/src/App.tsx",
-                    type=RelatedFileType.CREATE,
-                    description="Main React application component"
-                ),
-                RelatedFile(
-                    path="frontend/src/store/",
-                    type=RelatedFileType.CREATE,
-                    description="Redux store configuration"
-                ),
-                RelatedFile(
-                    path="frontend/src/components/",
-                    type=RelatedFileType.CREATE,
-                    description="Reusable UI components"
-                ),
-                RelatedFile(
-                    path="frontend/src/pages/",
-                    type=RelatedFileType.CREATE,
-                    description="Application page components"
-                )
+            "priority": Priority.P1,
+            "complexity": ComplexityLevel.MODERATE,
+            "estimated_hours": 8,
+            "category": "Frontend",
+            "related_files": [
+                _rf("frontend/src/App.tsx", RelatedFileType.CREATE, "Main React application component"),
+                _rf("frontend/src/store/", RelatedFileType.CREATE, "Redux store configuration"),
+                _rf("frontend/src/components/", RelatedFileType.CREATE, "Reusable UI components"),
+                _rf("frontend/src/pages/", RelatedFileType.CREATE, "Application page components")
             ]
-        ),
+        },
         
-        Task(
-            name="User Interface Components and Styling",
-            description="Create responsive UI components with modern styling and accessibility features",
-            implementation_guide=(
+        {
+            "name": "User Interface Components and Styling",
+            "description": "Create responsive UI components with modern styling and accessibility features",
+            "implementation_guide": (
                 "1. Design and implement core UI components\n"
                 "2. Set up responsive design with CSS Grid and Flexbox\n"
                 "3. Add dark/light theme support\n"
@@ -282,7 +286,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "6. Add animations and micro-interactions\n"
                 "7. Optimize for mobile and tablet devices"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- All components are responsive across device sizes\n"
                 "- Accessibility standards are met (WCAG 2.1 AA)\n"
                 "- Theme switching works seamlessly\n"
@@ -290,36 +294,24 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Animations enhance user experience\n"
                 "- Components are properly tested and documented"
             ),
-            priority=Priority.P2,
-            complexity=ComplexityLevel.MODERATE,
-            estimated_hours=6,
-            category="Frontend",
-            related_files=[
-                RelatedFile(
-                    path="frontend/src/styles/",
-                    type=RelatedFileType.CREATE,
-                    description="CSS/SCSS styling files"
-                ),
-                RelatedFile(
-                    path="frontend/src/components/ui/",
-                    type=RelatedFileType.CREATE,
-                    description="UI component library"
-                ),
-                RelatedFile(
-                    path="frontend/src/themes/",
-                    type=RelatedFileType.CREATE,
-                    description="Theme configuration files"
-                )
+            "priority": Priority.P2,
+            "complexity": ComplexityLevel.MODERATE,
+            "estimated_hours": 6,
+            "category": "Frontend",
+            "related_files": [
+                _rf("frontend/src/styles/", RelatedFileType.CREATE, "CSS/SCSS styling files"),
+                _rf("frontend/src/components/ui/", RelatedFileType.CREATE, "UI component library"),
+                _rf("frontend/src/themes/", RelatedFileType.CREATE, "Theme configuration files")
             ]
-        ),
-    ]
+        },
+    ),
     
     # Phase 4: Testing and Quality Assurance
-    testing_tasks = [
-        Task(
-            name="Backend Testing Suite",
-            description="Implement comprehensive testing for backend API with unit, integration, and e2e tests",
-            implementation_guide=(
+    "Testing": (
+        {
+            "name": "Backend Testing Suite",
+            "description": "Implement comprehensive testing for backend API with unit, integration, and e2e tests",
+            "implementation_guide": (
                 "1. Set up pytest testing framework with fixtures\n"
                 "2. Create unit tests for all business logic\n"
                 "3. Add integration tests for API endpoints\n"
@@ -328,7 +320,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "6. Create performance and load tests\n"
                 "7. Set up test coverage reporting"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- Test coverage is above 90% for critical code paths\n"
                 "- All API endpoints have comprehensive tests\n"
                 "- Database operations are tested with real database\n"
@@ -336,33 +328,21 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Performance tests validate response times\n"
                 "- Tests run reliably in CI/CD pipeline"
             ),
-            priority=Priority.P1,
-            complexity=ComplexityLevel.MODERATE,
-            estimated_hours=8,
-            category="Testing",
-            related_files=[
-                RelatedFile(
-                    path="tests/unit/",
-                    type=RelatedFileType.CREATE,
-                    description="Unit test directory"
-                ),
-                RelatedFile(
-                    path="tests/integration/",
-                    type=RelatedFileType.CREATE,
-                    description="Integration test directory"
-                ),
-                RelatedFile(
-                    path="tests/conftest.py",
-                    type=RelatedFileType.CREATE,
-                    description="Pytest configuration and fixtures"
-                )
+            "priority": Priority.P1,
+            "complexity": ComplexityLevel.MODERATE,
+            "estimated_hours": 8,
+            "category": "Testing",
+            "related_files": [
+                _rf("tests/unit/", RelatedFileType.CREATE, "Unit test directory"),
+                _rf("tests/integration/", RelatedFileType.CREATE, "Integration test directory"),
+                _rf("tests/conftest.py", RelatedFileType.CREATE, "Pytest configuration and fixtures")
             ]
-        ),
+        },
         
-        Task(
-            name="Frontend Testing and Quality Assurance",
-            description="Implement frontend testing with Jest, React Testing Library, and Cypress",
-            implementation_guide=(
+        {
+            "name": "Frontend Testing and Quality Assurance",
+            "description": "Implement frontend testing with Jest, React Testing Library, and Cypress",
+            "implementation_guide": (
                 "1. Set up Jest and React Testing Library\n"
                 "2. Create unit tests for React components\n"
                 "3. Add integration tests for user workflows\n"
@@ -371,7 +351,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "6. Create accessibility testing automation\n"
                 "7. Set up test coverage and quality gates"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- All components have unit tests with good coverage\n"
                 "- User workflows are tested end-to-end\n"
                 "- Visual regression tests catch UI changes\n"
@@ -379,36 +359,24 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- Tests run reliably in CI/CD pipeline\n"
                 "- Quality gates prevent regression deployments"
             ),
-            priority=Priority.P2,
-            complexity=ComplexityLevel.MODERATE,
-            estimated_hours=8,
-            category="Testing",
-            related_files=[
-                RelatedFile(
-                    path="frontend/src/__tests__/",
-                    type=RelatedFileType.CREATE,
-                    description="Frontend unit tests"
-                ),
-                RelatedFile(
-                    path="cypress/integration/",
-                    type=RelatedFileType.CREATE,
-                    description="End-to-end test specs"
-                ),
-                RelatedFile(
-                    path="cypress/fixtures/",
-                    type=RelatedFileType.CREATE,
-                    description="Test data fixtures"
-                )
+            "priority": Priority.P2,
+            "complexity": ComplexityLevel.MODERATE,
+            "estimated_hours": 8,
+            "category": "Testing",
+            "related_files": [
+                _rf("frontend/src/__tests__/", RelatedFileType.CREATE, "Frontend unit tests"),
+                _rf("cypress/integration/", RelatedFileType.CREATE, "End-to-end test specs"),
+                _rf("cypress/fixtures/", RelatedFileType.CREATE, "Test data fixtures")
             ]
-        ),
-    ]
+        },
+    ),
     
     # Phase 5: Deployment and Operations
-    deployment_tasks = [
-        Task(
-            name="Production Deployment Configuration",
-            description="Set up production deployment with Docker, monitoring, and security configurations",
-            implementation_guide=(
+    "Deployment": (
+        {
+            "name": "Production Deployment Configuration",
+            "description": "Set up production deployment with Docker, monitoring, and security configurations",
+            "implementation_guide": (
                 "1. Create Docker containers for all services\n"
                 "2. Set up Docker Compose for local development\n"
                 "3. Configure production deployment (AWS/GCP/Azure)\n"
@@ -417,7 +385,7 @@ async def create_demo_project(service: TaskService) -> dict:
                 "6. Configure SSL/TLS and security headers\n"
                 "7. Set up backup and disaster recovery"
             ),
-            verification_criteria=(
+            "verification_criteria": (
                 "- Application deploys successfully to production\n"
                 "- All services are properly containerized\n"
                 "- Environment configurations are secure\n"
@@ -425,34 +393,46 @@ async def create_demo_project(service: TaskService) -> dict:
                 "- SSL/TLS is properly configured\n"
                 "- Backup and recovery procedures are tested"
             ),
-            priority=Priority.P2,
-            complexity=ComplexityLevel.COMPLEX,
-            estimated_hours=14,
-            category="DevOps",
-            related_files=[
-                RelatedFile(
-                    path="Dockerfile",
-                    type=RelatedFileType.CREATE,
-                    description="Docker container configuration"
-                ),
-                RelatedFile(
-                    path="docker-compose.yml",
-                    type=RelatedFileType.CREATE,
-                    description="Docker Compose setup"
-                ),
-                RelatedFile(
-                    path="deploy/",
-                    type=RelatedFileType.CREATE,
-                    description="Deployment scripts and configurations"
-                )
+            "priority": Priority.P2,
+            "complexity": ComplexityLevel.COMPLEX,
+            "estimated_hours": 14,
+            "category": "DevOps",
+            "related_files": [
+                _rf("Dockerfile", RelatedFileType.CREATE, "Docker container configuration"),
+                _rf("docker-compose.yml", RelatedFileType.CREATE, "Docker Compose setup"),
+                _rf("deploy/", RelatedFileType.CREATE, "Deployment scripts and configurations")
             ]
-        ),
-    ]
+        },
+    ),
+}
+
+
+def _task_from_template(template):
+    """Build a Task from a trusted template, skipping Pydantic validation.
+    
+    Task keeps enum fields as their values (use_enum_values), so members
+    are unwrapped here as validation would; related files keep theirs.
+    """
+    fields = {field: _val(value) for field, value in template.items()}
+    fields["related_files"] = list(template["related_files"])
+    return Task.model_construct(**fields)
+
+
+async def create_demo_project(service: TaskService) -> dict:
+    """Create a comprehensive demo project with realistic tasks."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
-    # Combine all tasks
-    all_tasks = infrastructure_tasks + backend_tasks + frontend_tasks + testing_tasks + deployment_tasks
+    console.print(Panel.fit("🏗️ Creating Demo Project: Web Application", style="bold blue"))
+    
+    # Build tasks from the trusted templates without re-running validation
+    all_tasks = [
+        _task_from_template(template)
+        for templates in TASK_TEMPLATES.values()
+        for template in templates
+    ]
     
-    # Create tasks in the service
+    # Create tasks and their dependencies under a single live display
     created_tasks = []
     with Progress(
         SpinnerColumn(),
@@ -461,51 +441,28 @@ async def create_demo_project(service: TaskService) -> dict:
     ) as progress:
         task_progress = progress.add_task("Creating project tasks...", total=len(all_tasks))
         
-        for task in all_tasks:
-            created_task = await service.create_task(task)
-            created_tasks.append(created_task)
-            progress.advance(task_progress)
-    
-    # Create dependency relationships
-    dependencies = [
-        # Backend depends on infrastructure
-        (created_tasks[2], created_tasks[0]),  # Auth depends on Project Setup
-        (created_tasks[2], created_tasks[1]),  # Auth depends on Database
-        (created_tasks[3], created_tasks[2]),  # API depends on Auth
-        
-        # Frontend depends on backend
-        (created_tasks[4], created_tasks[3]),  # React Setup depends on API
-        (created_tasks[5], created_tasks[4]),  # UI Components depend on React Setup
+        for start in range(0, len(all_tasks), BULK_CHUNK_SIZE):
+            chunk = all_tasks[start:start + BULK_CHUNK_SIZE]
+            created_tasks.extend(await service.bulk_create_tasks(chunk))
+            progress.advance(task_progress, len(chunk))
         
-        # Testing depends on implementation
-        (created_tasks[6], created_tasks[3]),  # Backend Testing depends on API
-        (created_tasks[7], created_tasks[5]),  # Frontend Testing depends on UI
+        # Create dependency relationships
+        by_name = {task.name: task for task in created_tasks}
+        dependencies = [
+            (by_name[dependent].id, by_name[dependency].id)
+            for dependent, dependency in DEP_BY_NAME
+        ]
         
-        # Deployment depends on everything
-        (created_tasks[8], created_tasks[6]),  # Deployment depends on Backend Testing
-        (created_tasks[8], created_tasks[7]),  # Deployment depends on Frontend Testing
-    ]
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
         dep_progress = progress.add_task("Creating dependencies...", total=len(dependencies))
         
-        for dependent_task, dependency_task in dependencies:
-            await service.add_dependency(dependent_task.id, dependency_task.id)
-            progress.advance(dep_progress)
+        await service.add_dependencies(dependencies)
+        progress.advance(dep_progress, len(dependencies))
     
     # Return project summary
     return {
         "total_tasks": len(created_tasks),
         "phases": {
-            "Infrastructure": len(infrastructure_tasks),
-            "Backend": len(backend_tasks),
-            "Frontend": len(frontend_tasks),
-            "Testing": len(testing_tasks),
-            "Deployment": len(deployment_tasks),
+            phase: len(templates) for phase, templates in TASK_TEMPLATES.items()
         },
         "dependencies": len(dependencies),
         "tasks": created_tasks
@@ -514,6 +471,10 @@ async def create_demo_project(service: TaskService) -> dict:
 
 async def demonstrate_system_features(service: TaskService, project_info: dict):
     """Demonstrate all system features with the created project."""
+    from rich.columns import Columns
+    from rich.panel import Panel
+    from rich.table import Table
+    
     console.print(Panel.fit("🔍 System Features Demonstration", style="bold green"))
     
     # 1. Show execution order
@@ -528,13 +489,12 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     order_table.add_column("Hours", justify="right", width=6)
     
     for i, task in enumerate(execution_order, 1):
-        priority_val = task.priority.value if hasattr(task.priority, 'value') else task.priority
-        priority_color = {"P0": "red", "P1": "orange3", "P2": "yellow", "P3": "blue"}.get(priority_val, "white")
+        priority_val = _val(task.priority)
         order_table.add_row(
             str(i),
             task.name,
             task.category or "-",
-            f"[{priority_color}]{priority_val}[/{priority_color}]",
+            PRIORITY_TAG.get(priority_val, priority_val),
             str(task.estimated_hours) if task.estimated_hours else "-"
         )
     
@@ -545,8 +505,9 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     ready_tasks = await service.get_ready_tasks()
     
     if ready_tasks:
-        for task in ready_tasks:
-            console.print(f"✅ [green]{task.name}[/green] - {task.category}")
+        console.print("\n".join(
+            f"✅ [green]{task.name}[/green] - {task.category}" for task in ready_tasks
+        ))
     else:
         console.print("[yellow]No ready tasks (all have dependencies)[/yellow]")
     
@@ -555,33 +516,49 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     
     # Complete the first few tasks
     tasks_to_complete = execution_order[:3]
+    tasks_to_update = []
+    progress_lines = []
     
     for task in tasks_to_complete:
         task.status = TaskStatus.COMPLETED
-        await service.update_task(task)
-        console.print(f"✅ Completed: [green]{task.name}[/green]")
+        tasks_to_update.append(task)
+        progress_lines.append(f"✅ Completed: [green]{task.name}[/green]")
     
     # Start working on the next task
     if len(execution_order) > 3:
         next_task = execution_order[3]
         next_task.status = TaskStatus.IN_PROGRESS
-        await service.update_task(next_task)
-        console.print(f"🔄 Started: [blue]{next_task.name}[/blue]")
+        tasks_to_update.append(next_task)
+        progress_lines.append(f"🔄 Started: [blue]{next_task.name}[/blue]")
+    
+    # The updates touch distinct tasks, so they can be issued together
+    await asyncio.gather(*(service.update_task(task) for task in tasks_to_update))
+    console.print("\n".join(progress_lines))
     
     # 4. Show updated ready tasks
     console.print("\n[bold cyan]4. Updated Ready Tasks After Progress[/bold cyan]")
     updated_ready = await service.get_ready_tasks()
     
-    for task in updated_ready:
-        console.print(f"⚡ [yellow]{task.name}[/yellow] - Ready to start")
+    if updated_ready:
+        console.print("\n".join(
+            f"⚡ [yellow]{task.name}[/yellow] - Ready to start" for task in updated_ready
+        ))
     
     # 5. Filter and query demonstrations
     console.print("\n[bold cyan]5. Advanced Filtering and Queries[/bold cyan]")
     
+    # Load all tasks once and group them by status and category
+    all_tasks = await service.list_tasks()
+    by_status = defaultdict(list)
+    by_category = defaultdict(list)
+    for task in all_tasks:
+        by_status[task.status].append(task)
+        by_category[task.category].append(task)
+    
     # Filter by status
-    pending_tasks = await service.list_tasks({"status": TaskStatus.PENDING.value})
-    completed_tasks = await service.list_tasks({"status": TaskStatus.COMPLETED.value})
-    in_progress_tasks = await service.list_tasks({"status": TaskStatus.IN_PROGRESS.value})
+    pending_tasks = by_status[TaskStatus.PENDING.value]
+    completed_tasks = by_status[TaskStatus.COMPLETED.value]
+    in_progress_tasks = by_status[TaskStatus.IN_PROGRESS.value]
     
     status_table = Table(title="📊 Status Breakdown")
     status_table.add_column("Status", width=15)
@@ -591,17 +568,17 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     status_table.add_row(
         "[green]COMPLETED[/green]",
         str(len(completed_tasks)),
-        ", ".join([t.name[:30] + "..." if len(t.name) > 30 else t.name for t in completed_tasks[:3]])
+        ", ".join(_short(t.name) for t in completed_tasks[:3])
     )
     status_table.add_row(
         "[blue]IN_PROGRESS[/blue]",
         str(len(in_progress_tasks)),
-        ", ".join([t.name[:30] + "..." if len(t.name) > 30 else t.name for t in in_progress_tasks[:3]])
+        ", ".join(_short(t.name) for t in in_progress_tasks[:3])
     )
     status_table.add_row(
         "[yellow]PENDING[/yellow]",
         str(len(pending_tasks)),
-        ", ".join([t.name[:30] + "..." if len(t.name) > 30 else t.name for t in pending_tasks[:3]])
+        ", ".join(_short(t.name) for t in pending_tasks[:3])
     )
     
     console.print(status_table)
@@ -611,12 +588,11 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     category_panels = []
     
     for category in categories:
-        category_tasks = await service.list_tasks({"category": category})
+        category_tasks = by_category[category]
         
         content = []
         for task in category_tasks[:3]:  # Show first 3 tasks
-            status_val = task.status.value if hasattr(task.status, 'value') else task.status
-            status_emoji = {"PENDING": "⏳", "IN_PROGRESS": "🔄", "COMPLETED": "✅"}.get(status_val, "❓")
+            status_emoji = STATUS_EMOJI.get(_val(task.status), "❓")
             content.append(f"{status_emoji} {task.name}")
         
         if len(category_tasks) > 3:
@@ -647,8 +623,7 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
     ]
     
     for status, count in stats["status_breakdown"].items():
-        color = {"COMPLETED": "green", "IN_PROGRESS": "blue", "PENDING": "yellow", "BLOCKED": "red"}.get(status, "white")
-        stats_content.append(f"  [{color}]{status}[/{color}]: {count}")
+        stats_content.append(f"  {STATUS_TAG.get(status, status)}: {count}")
     
     console.print(Panel(
         "\n".join(stats_content),
@@ -659,12 +634,18 @@ async def demonstrate_system_features(service: TaskService, project_info: dict):
 
 
 async def main():
-    """Main demonstration function."""
+    """Main demonstration function.
+    
+    The demo data is throwaway, so tasks live in an in-memory DuckDB
+    database; nothing is written to disk except the JSON export.
+    """
+    from rich.panel import Panel
+    
     console.print(Panel.fit("🚀 Advanced Task Manager - Complete System Demo", style="bold magenta"))
     console.print("[dim]Demonstrating graph + table storage with comprehensive task management[/dim]\n")
     
-    # Initialize service with temporary database
-    db_path = "demo_tasks.db"
+    # Initialize service with an in-memory database
+    db_path = ":memory:"
     table_storage = DuckDBTableStorage(Task, database_path=db_path)
     graph_storage = NetworkXGraphStorage()
     service = TaskService(table_storage, graph_storage)
@@ -683,47 +664,56 @@ async def main():
         # Export project data
         console.print("\n[bold cyan]7. Data Export Example[/bold cyan]")
         
+        # Timestamps stay as datetimes; orjson formats them natively and the
+        # json fallback converts them through its default hook
         all_tasks = await service.list_tasks()
         export_data = {
             "project": "Web Application Demo",
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": datetime.now(timezone.utc),
             "total_tasks": len(all_tasks),
             "tasks": [
                 {
                     "id": str(task.id),
                     "name": task.name,
                     "description": task.description,
-                    "status": task.status.value if hasattr(task.status, 'value') else task.status,
-                    "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                    "complexity": task.complexity.value if task.complexity and hasattr(task.complexity, 'value') else (task.complexity if task.complexity else None),
+                    "status": _val(task.status),
+                    "priority": _val(task.priority),
+                    "complexity": _val(task.complexity),
                     "estimated_hours": task.estimated_hours,
                     "category": task.category,
-                    "created_at": task.created_at.isoformat(),
+                    "created_at": task.created_at,
                 }
                 for task in all_tasks
             ]
         }
         
-        export_path = Path("demo_project_export.json")
-        with open(export_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+        export_path = Path("demo_project_export.json").absolute()
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE
+            if PRETTY_EXPORT:
+                option |= orjson.OPT_INDENT_2
+            export_path.write_bytes(orjson.dumps(export_data, option=option))
+        else:
+            # json.dump encodes in chunks straight to the file handle
+            with open(export_path, "w") as f:
+                json.dump(
+                    export_data, f,
+                    indent=2 if PRETTY_EXPORT else None,
+                    separators=None if PRETTY_EXPORT else (",", ":"),
+                    default=datetime.isoformat,
+                )
+                f.write("\n")
         
-        console.print(f"📁 Project data exported to: [cyan]{export_path.absolute()}[/cyan]")
+        console.print(f"📁 Project data exported to: [cyan]{export_path}[/cyan]")
         
         # Final summary
+        details = Text(
+            f"Database: in-memory ({db_path})\n"
+            f"Export file: {export_path}",
+            style="dim"
+        )
         console.print(Panel(
-            "[bold green]🎉 System demonstration completed successfully![/bold green]\n\n"
-            "[bold]Key Features Demonstrated:[/bold]\n"
-            "• ✅ Comprehensive task creation with metadata\n"
-            "• ✅ Dependency graph management and cycle prevention\n"
-            "• ✅ Topological sorting for execution order\n"
-            "• ✅ Advanced filtering and querying\n"
-            "• ✅ Real-time project statistics and analytics\n"
-            "• ✅ Status tracking and workflow management\n"
-            "• ✅ Data persistence and export capabilities\n"
-            "• ✅ Integration between graph and table storage\n\n"
-            f"[dim]Database file: {Path(db_path).absolute()}\n"
-            f"Export file: {export_path.absolute()}[/dim]",
+            Group(SUMMARY_TEXT, details),
             title="Demo Complete",
             title_align="left",
             border_style="green"
@@ -731,8 +721,7 @@ async def main():
         
     except Exception as e:
         console.print(f"[red]Demo failed: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        console.print_exception(show_locals=False)
     
     finally:
         # Cleanup
@@ -740,4 +729,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
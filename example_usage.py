@@ -2,8 +2,14 @@
 """Example usage of the storage abstractions with NetworkX and DuckDB."""
 
 import asyncio
+from enum import Enum
 from uuid import uuid4
 
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio loop
+    uvloop = None
+
 from src.models.task import (
     ComplexityLevel,
     GraphEdge,
@@ -19,13 +25,22 @@ from src.storage.duckdb_table import DuckDBTableStorage
 from src.storage.networkx_graph import NetworkXGraphStorage
 
 
-async def demonstrate_graph_storage():
+def make_task(**fields) -> Task:
+    """Build a Task from trusted demo literals, skipping Pydantic validation.
+    
+    Enum members are unwrapped to their values, as Task's use_enum_values
+    would do when validating.
+    """
+    return Task.model_construct(**{
+        field: value.value if isinstance(value, Enum) else value
+        for field, value in fields.items()
+    })
+
+
+async def demonstrate_graph_storage(graph_storage: NetworkXGraphStorage):
     """Demonstrate NetworkX graph storage capabilities."""
-    print("🌐 NetworkX Graph Storage Demo")
-    print("=" * 50)
-    
-    # Create graph storage
-    graph_storage = NetworkXGraphStorage()
+    # Output is buffered and printed once so concurrent demos don't interleave
+    lines = ["🌐 NetworkX Graph Storage Demo", "=" * 50]
     
     # Create some tasks
     task1_id = uuid4()
@@ -37,52 +52,46 @@ async def demonstrate_graph_storage():
     node2 = GraphNode(id=task2_id, data={"name": "Create API"})
     node3 = GraphNode(id=task3_id, data={"name": "Build Frontend"})
     
-    await graph_storage.add_node(node1)
-    await graph_storage.add_node(node2)
-    await graph_storage.add_node(node3)
+    await graph_storage.add_nodes([node1, node2, node3])
     
-    print(f"✅ Added {len(await graph_storage.get_all_nodes())} nodes")
+    lines.append(f"✅ Added {await graph_storage.node_count()} nodes")
     
     # Create dependencies: API depends on Database, Frontend depends on API
     edge1 = GraphEdge(from_id=task2_id, to_id=task1_id)  # API -> Database
     edge2 = GraphEdge(from_id=task3_id, to_id=task2_id)  # Frontend -> API
     
-    await graph_storage.add_edge(edge1)
-    await graph_storage.add_edge(edge2)
+    await graph_storage.add_edges([edge1, edge2])
     
-    print(f"✅ Added {len(await graph_storage.get_all_edges())} dependency edges")
+    lines.append(f"✅ Added {await graph_storage.edge_count()} dependency edges")
     
     # Test cycle prevention
     cycle_edge = GraphEdge(from_id=task1_id, to_id=task3_id)  # Would create cycle
     result = await graph_storage.add_edge(cycle_edge)
-    print(f"🚫 Cycle prevention works: {not result}")
+    lines.append(f"🚫 Cycle prevention works: {not result}")
     
     # Get topological sort (execution order)
     sorted_tasks = await graph_storage.topological_sort()
-    print(f"📋 Execution order: {[str(t)[:8] + '...' for t in sorted_tasks]}")
+    lines.append("📋 Execution order: " + ", ".join(f"{t.hex[:8]}..." for t in sorted_tasks))
     
     # Test advanced features
     path = await graph_storage.get_shortest_path(task3_id, task1_id)
-    print(f"🛣️  Dependency path length: {len(path) if path else 0}")
+    lines.append(f"🛣️  Dependency path length: {len(path) if path else 0}")
     
     # Graph metrics
     metrics = await graph_storage.get_graph_metrics()
-    print(f"📊 Graph metrics: {metrics['node_count']} nodes, {metrics['edge_count']} edges")
+    lines.append(f"📊 Graph metrics: {metrics['node_count']} nodes, {metrics['edge_count']} edges")
     
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
-async def demonstrate_table_storage():
+async def demonstrate_table_storage(table_storage: DuckDBTableStorage):
     """Demonstrate DuckDB table storage capabilities."""
-    print("🗄️  DuckDB Table Storage Demo")
-    print("=" * 50)
+    lines = ["🗄️  DuckDB Table Storage Demo", "=" * 50]
     
-    # Create table storage
-    table_storage = DuckDBTableStorage(Task, database_path=":memory:")
-    
-    # Create sample tasks
+    # Create sample tasks; the literals are trusted, so validation is skipped
     tasks = [
-        Task(
+        make_task(
             name="Setup Database Schema",
             description="Create database tables and indexes for the application",
             implementation_guide="Use PostgreSQL with proper indexing strategy",
@@ -92,14 +101,14 @@ async def demonstrate_table_storage():
             estimated_hours=8,
             category="Backend",
             related_files=[
-                RelatedFile(
+                RelatedFile.model_construct(
                     path="src/database/schema.sql",
                     type=RelatedFileType.CREATE,
                     description="Database schema definition"
                 )
             ]
         ),
-        Task(
+        make_task(
             name="Build REST API",
             description="Implement RESTful API endpoints for task management",
             implementation_guide="Use FastAPI with async/await patterns",
@@ -108,14 +117,13 @@ async def demonstrate_table_storage():
             complexity=ComplexityLevel.COMPLEX,
             estimated_hours=16,
             category="Backend",
-            dependencies=[],  # Will add after database task is created
             related_files=[
-                RelatedFile(
+                RelatedFile.model_construct(
                     path="src/api/routes.py",
                     type=RelatedFileType.CREATE,
                     description="API route definitions"
                 ),
-                RelatedFile(
+                RelatedFile.model_construct(
                     path="src/api/models.py",
                     type=RelatedFileType.TO_MODIFY,
                     description="API data models",
@@ -124,17 +132,17 @@ async def demonstrate_table_storage():
                 )
             ]
         ),
-        Task(
+        make_task(
             name="Create React Frontend",
             description="Build responsive frontend interface using React",
             implementation_guide="Use React 19 with TypeScript and Tailwind CSS",
             status=TaskStatus.PENDING,
             priority=Priority.P1,
             complexity=ComplexityLevel.COMPLEX,
-            estimated_hours=20,
+            estimated_hours=16,
             category="Frontend",
             related_files=[
-                RelatedFile(
+                RelatedFile.model_construct(
                     path="frontend/src/App.tsx",
                     type=RelatedFileType.CREATE,
                     description="Main React application component"
@@ -143,74 +151,59 @@ async def demonstrate_table_storage():
         )
     ]
     
-    # Bulk insert tasks
-    created_tasks = await table_storage.bulk_insert(tasks)
-    print(f"✅ Created {len(created_tasks)} tasks")
-    
-    # Add dependencies after creation
-    api_task = created_tasks[1]
-    api_task.dependencies = [TaskDependency(task_id=created_tasks[0].id)]
-    await table_storage.update(api_task)
-    
-    frontend_task = created_tasks[2]
+    # IDs are assigned on construction, so dependencies can be set before
+    # the insert instead of updating each task afterwards
+    database_task, api_task, frontend_task = tasks
+    api_task.dependencies = [TaskDependency(task_id=database_task.id)]
     frontend_task.dependencies = [TaskDependency(task_id=api_task.id)]
-    await table_storage.update(frontend_task)
-    print("✅ Added task dependencies")
     
-    # Query by status
-    pending_tasks = await table_storage.query({"status": TaskStatus.PENDING.value})
-    print(f"📋 Pending tasks: {len(pending_tasks)}")
-    
-    in_progress_tasks = await table_storage.query({"status": TaskStatus.IN_PROGRESS.value})
-    print(f"🔄 In progress tasks: {len(in_progress_tasks)}")
-    
-    # Query by priority
-    p1_tasks = await table_storage.query({"priority": Priority.P1.value})
-    print(f"🔥 High priority (P1) tasks: {len(p1_tasks)}")
+    # Bulk insert tasks
+    created_tasks = await table_storage.bulk_insert(tasks)
+    lines.append(f"✅ Created {len(created_tasks)} tasks with dependencies")
     
-    # Query by category
-    backend_tasks = await table_storage.query({"category": "Backend"})
-    print(f"⚙️  Backend tasks: {len(backend_tasks)}")
+    # Count by status, priority and category with one grouped query
+    counts = await table_storage.count_facets(["status", "priority", "category"])
+    lines.append(f"📋 Pending tasks: {counts['status'].get(TaskStatus.PENDING.value, 0)}")
+    lines.append(f"🔄 In progress tasks: {counts['status'].get(TaskStatus.IN_PROGRESS.value, 0)}")
+    lines.append(f"🔥 High priority (P1) tasks: {counts['priority'].get(Priority.P1.value, 0)}")
+    lines.append(f"⚙️  Backend tasks: {counts['category'].get('Backend', 0)}")
     
     # Get statistics
     stats = await table_storage.get_statistics()
-    print(f"📊 Total tasks: {stats['total_count']}")
+    lines.append(f"📊 Total tasks: {stats['total_count']}")
     
     # Demonstrate individual retrieval
     task = await table_storage.get_by_id(created_tasks[1].id)
     if task:
-        print(f"🔍 Retrieved task: '{task.name}' with {len(task.related_files)} related files")
+        lines.append(f"🔍 Retrieved task: '{task.name}' with {len(task.related_files)} related files")
     
-    # Close connection
-    table_storage.close()
-    print()
+    lines.append("")
+    print("\n".join(lines))
 
 
-async def demonstrate_integration():
+async def demonstrate_integration(
+    graph_storage: NetworkXGraphStorage, table_storage: DuckDBTableStorage
+):
     """Demonstrate how graph and table storage work together."""
     print("🔗 Integrated Storage Demo")
     print("=" * 50)
     
-    # Create both storage types
-    graph_storage = NetworkXGraphStorage()
-    table_storage = DuckDBTableStorage(Task, database_path=":memory:")
-    
     # Create tasks in table storage first
-    task1 = Task(
+    task1 = make_task(
         name="Database Setup",
         description="Set up PostgreSQL database",
         implementation_guide="Install and configure PostgreSQL",
         complexity=ComplexityLevel.SIMPLE,
         estimated_hours=4
     )
-    task2 = Task(
+    task2 = make_task(
         name="API Development",
         description="Build REST API endpoints",
         implementation_guide="Use FastAPI framework",
         complexity=ComplexityLevel.MODERATE,
         estimated_hours=8
     )
-    task3 = Task(
+    task3 = make_task(
         name="Frontend Integration",
         description="Connect frontend to API",
         implementation_guide="Use Axios for HTTP requests",
@@ -219,44 +212,42 @@ async def demonstrate_integration():
     )
     
     # Store tasks in table
-    await table_storage.create(task1)
-    await table_storage.create(task2)
-    await table_storage.create(task3)
+    await table_storage.bulk_insert([task1, task2, task3])
     
     # Create corresponding graph nodes
-    node1 = GraphNode(id=task1.id, data={"name": task1.name, "complexity": task1.complexity.value})
-    node2 = GraphNode(id=task2.id, data={"name": task2.name, "complexity": task2.complexity.value})
-    node3 = GraphNode(id=task3.id, data={"name": task3.name, "complexity": task3.complexity.value})
+    node1 = GraphNode(id=task1.id, data={"name": task1.name, "complexity": task1.complexity})
+    node2 = GraphNode(id=task2.id, data={"name": task2.name, "complexity": task2.complexity})
+    node3 = GraphNode(id=task3.id, data={"name": task3.name, "complexity": task3.complexity})
     
-    await graph_storage.add_node(node1)
-    await graph_storage.add_node(node2)
-    await graph_storage.add_node(node3)
+    await graph_storage.add_nodes([node1, node2, node3])
     
     # Create dependency graph
-    await graph_storage.add_edge(GraphEdge(from_id=task2.id, to_id=task1.id))  # API depends on DB
-    await graph_storage.add_edge(GraphEdge(from_id=task3.id, to_id=task2.id))  # Frontend depends on API
+    await graph_storage.add_edges([
+        GraphEdge(from_id=task2.id, to_id=task1.id),  # API depends on DB
+        GraphEdge(from_id=task3.id, to_id=task2.id),  # Frontend depends on API
+    ])
     
     # Get execution order from graph
-    execution_order = await graph_storage.topological_sort()
+    execution_order, dependencies_by_id = await graph_storage.topological_sort_with_dependencies()
     print(f"📋 Execution order determined by dependency graph:")
     
+    # Fetch every task on the path with one query
+    tasks_by_id = await table_storage.get_many(execution_order)
+    
     for i, task_id in enumerate(execution_order, 1):
-        task = await table_storage.get_by_id(task_id)
+        task = tasks_by_id.get(task_id)
         if task:
-            dependencies = await graph_storage.get_dependencies(task_id)
-            print(f"  {i}. {task.name} ({task.complexity.value}, {task.estimated_hours}h)")
+            dependencies = dependencies_by_id[task_id]
+            print(f"  {i}. {task.name} ({task.complexity}, {task.estimated_hours}h)")
             if dependencies:
                 print(f"     Depends on: {len(dependencies)} task(s)")
     
     # Calculate total project duration (sum of hours on critical path)
     total_hours = sum(
-        (await table_storage.get_by_id(task_id)).estimated_hours or 0
+        tasks_by_id[task_id].estimated_hours or 0
         for task_id in execution_order
     )
     print(f"⏱️  Total estimated duration: {total_hours} hours")
-    
-    # Cleanup
-    table_storage.close()
     print()
 
 
@@ -266,9 +257,23 @@ async def main():
     print("=" * 70)
     print()
     
-    await demonstrate_graph_storage()
-    await demonstrate_table_storage()
-    await demonstrate_integration()
+    # One graph and one DuckDB connection shared by every demo; each demo
+    # starts from empty storage instead of opening a fresh database
+    graph_storage = NetworkXGraphStorage()
+    table_storage = DuckDBTableStorage(Task, database_path=":memory:")
+    
+    try:
+        # The graph and table demos touch disjoint storages, so run them together
+        await asyncio.gather(
+            demonstrate_graph_storage(graph_storage),
+            demonstrate_table_storage(table_storage),
+        )
+        
+        await graph_storage.clear()
+        await table_storage.clear()
+        await demonstrate_integration(graph_storage, table_storage)
+    finally:
+        table_storage.close()
     
     print("✨ Storage system demonstration complete!")
     print()
@@ -282,4 +287,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -1,27 +1,35 @@
 """Command-line interface for the Advanced Task Manager using Typer."""
 
 import asyncio
-import json
+import re
 import sys
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence,
+    Tuple, TypeVar, Union
+)
 from uuid import UUID
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
 from typing_extensions import Annotated
 
-from src.models.task import ComplexityLevel, Priority, Task, TaskStatus, RelatedFile, RelatedFileType
-from src.services.task_service import TaskService
-from src.storage.duckdb_table import DuckDBTableStorage
-from src.storage.networkx_graph import NetworkXGraphStorage
+# Typer needs the enum classes to build option parsers, so they are the only
+# models imported eagerly. Storage, service and most of rich are imported where
+# they are used to keep `--help` and argument errors fast.
+from src.models.task import ComplexityLevel, Priority, TaskStatus
 
-# Rich console for beautiful output
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    from src.models.task import Task, TaskView
+    from src.services.task_service import TaskService
 
 # Typer app instance
 app = typer.Typer(
@@ -31,19 +39,195 @@ app = typer.Typer(
     add_completion=False
 )
 
+# Display lookups, built once. Task stores enum values as plain strings, which
+# hash and compare equal to the str-based enum members used as keys here.
+_STATUS_COLORS = {
+    TaskStatus.PENDING: "yellow",
+    TaskStatus.IN_PROGRESS: "blue",
+    TaskStatus.COMPLETED: "green",
+    TaskStatus.BLOCKED: "red"
+}
+
+_PRIORITY_COLORS = {
+    Priority.P0: "red",
+    Priority.P1: "orange3",
+    Priority.P2: "yellow",
+    Priority.P3: "blue"
+}
+
+# Keyed by the plain status string that Task (use_enum_values) and field
+# projections hold, so a lookup hashes and compares a str, not an enum member
+_STATUS_EMOJI = {
+    TaskStatus.PENDING.value: "⏳",
+    TaskStatus.IN_PROGRESS.value: "🔄",
+    TaskStatus.COMPLETED.value: "✅",
+    TaskStatus.BLOCKED.value: "🚫"
+}
+
+_STATUS_RENDERED = {
+    status: f"[{color}]{status.value}[/{color}]" for status, color in _STATUS_COLORS.items()
+}
+_PRIORITY_RENDERED = {
+    priority: f"[{color}]{priority.value}[/{color}]"
+    for priority, color in _PRIORITY_COLORS.items()
+}
+_STATUS_TEXT = {status: status.value for status in TaskStatus}
+_PRIORITY_TEXT = {priority: priority.value for priority in Priority}
+_COMPLEXITY_TEXT = {complexity: complexity.value for complexity in ComplexityLevel}
+
+# Answers accepted by the interactive prompts, mapped back to their members
+_PRIORITY_CHOICES = {priority.value: priority for priority in Priority}
+_COMPLEXITY_CHOICES = {complexity.value: complexity for complexity in ComplexityLevel}
+_PRIORITY_CHOICE_LIST = [*_PRIORITY_CHOICES]
+_COMPLEXITY_CHOICE_LIST = [*_COMPLEXITY_CHOICES]
+
+# Canonical hyphenated UUIDs; any other task reference is treated as a name
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Rows rendered per task table page
+DEFAULT_PAGE_SIZE = 50
+
+# Rows parsed and stored together by bulk commands
+DEFAULT_BATCH_SIZE = 10_000
+
+# Seconds an operation may run before a spinner is shown for it
+SPINNER_DELAY = 0.2
+
+T = TypeVar("T")
+
+# Seconds the interactive session reuses a list, ready or order result
+INTERACTIVE_CACHE_TTL = 5.0
+
 # Global service instance
-service: Optional[TaskService] = None
+service: Optional["TaskService"] = None
+
+# Services opened by initialize_service(), keyed by database path
+_services: Dict[str, "TaskService"] = {}
+_services_lock = asyncio.Lock()
+
+
+@app.callback()
+def callback(ctx: typer.Context) -> None:
+    """Create the event loop shared by every coroutine of this invocation."""
+    try:
+        import uvloop
+    except ImportError:  # Optional: falls back to the default asyncio loop
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    ctx.obj = SimpleNamespace(loop=loop)
+    ctx.call_on_close(loop.close)
+    # Close callbacks run last-in first-out, so services close before the loop
+    ctx.call_on_close(lambda: close_services(loop))
+
+
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Rich console for beautiful output, created on first use."""
+    from rich.console import Console
+    
+    return Console()
+
+
+@contextmanager
+def _spinner(description: str, done: str) -> Iterator[Callable[[str], None]]:
+    """Show a spinner with description while the block runs, then done.
+    
+    The block receives a function that replaces the spinner's description.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=get_console()
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield lambda text: progress.update(task, description=text)
+        progress.update(task, description=done)
+
+
+async def _with_spinner(
+    description: str, done: str, awaitable: Awaitable[T], delay: float = SPINNER_DELAY
+) -> T:
+    """Await a result, showing a spinner only if it takes longer than delay.
+    
+    Fast operations skip starting Rich's live display altogether.
+    """
+    task = asyncio.ensure_future(awaitable)
+    finished, _ = await asyncio.wait({task}, timeout=delay)
+    if not finished:
+        with _spinner(description, done):
+            await asyncio.wait({task})
+    return task.result()
+
+
+async def _table_stamp(task_service: "TaskService") -> Tuple[int, Any]:
+    """Task count and latest write time, which change with every table write.
+    
+    Every create, update, patch and import sets the row's updated_at, and
+    deletes change the count, so an unchanged stamp means the graph saved
+    with it still mirrors the table, including edits by other processes.
+    """
+    stats = await task_service.table_storage.get_statistics()
+    return stats["total_count"], stats["latest_updated"]
 
 
-async def initialize_service(db_path: str = "tasks.db") -> TaskService:
-    """Initialize the task service."""
-    table_storage = DuckDBTableStorage(Task, database_path=db_path)
-    graph_storage = NetworkXGraphStorage()
-    return TaskService(table_storage, graph_storage)
+async def initialize_service(db_path: str = "tasks.db") -> "TaskService":
+    """Initialize the task service, reusing it for repeated calls on a database.
+    
+    The dependency graph is loaded from a pickle next to the database and
+    rebuilt from the table unless the snapshot was saved with the table's
+    current stamp, so writes made after the last save (by the MCP server,
+    another CLI run, or before a crash) are never answered from a stale
+    graph.
+    """
+    async with _services_lock:
+        if db_path in _services:
+            return _services[db_path]
+        
+        from src.models.task import Task
+        from src.services.task_service import TaskService
+        from src.storage.duckdb_table import DuckDBTableStorage
+        from src.storage.networkx_graph import NetworkXGraphStorage
+        
+        graph_path = None if db_path == ":memory:" else f"{db_path}.graph.pkl"
+        table_storage = DuckDBTableStorage(Task, database_path=db_path)
+        graph_storage = NetworkXGraphStorage(persist_path=graph_path)
+        task_service = TaskService(table_storage, graph_storage)
+        
+        if graph_storage.snapshot_stamp != await _table_stamp(task_service):
+            await task_service.rebuild_graph()
+        
+        _services[db_path] = task_service
+        return task_service
 
 
-def format_task_table(tasks: List[Task]) -> Table:
-    """Format tasks as a rich table."""
+def close_services(loop: asyncio.AbstractEventLoop) -> None:
+    """Persist the graph of every cached service and close its database."""
+    for task_service in _services.values():
+        stamp = loop.run_until_complete(_table_stamp(task_service))
+        task_service.graph_storage.save(stamp)
+        task_service.table_storage.close()
+    _services.clear()
+
+
+def format_task_table(
+    tasks: Sequence[Union["Task", "TaskView"]], *, max_rows: int = DEFAULT_PAGE_SIZE, page: int = 0
+) -> "Table":
+    """Format one page of tasks as a rich table.
+    
+    Only the rows of the requested zero-based page are laid out; when the
+    list is longer, a caption says which slice is shown.
+    """
+    from rich.table import Table
+    
+    start = page * max_rows
+    page_tasks = tasks[start:start + max_rows]
+    
     table = Table(title="📋 Tasks")
     
     table.add_column("ID", style="dim", width=8)
@@ -54,122 +238,151 @@ def format_task_table(tasks: List[Task]) -> Table:
     table.add_column("Hours", justify="right", width=6)
     table.add_column("Category", width=12)
     
-    status_colors = {
-        TaskStatus.PENDING: "yellow",
-        TaskStatus.IN_PROGRESS: "blue",
-        TaskStatus.COMPLETED: "green", 
-        TaskStatus.BLOCKED: "red"
-    }
-    
-    priority_colors = {
-        Priority.P0: "red",
-        Priority.P1: "orange3",
-        Priority.P2: "yellow",
-        Priority.P3: "blue"
-    }
-    
-    for task in tasks:
-        status_color = status_colors.get(task.status, "white")
-        priority_color = priority_colors.get(task.priority, "white")
-        
+    for task in page_tasks:
         table.add_row(
             str(task.id)[:8] + "...",
             task.name,
-            f"[{status_color}]{task.status.value}[/{status_color}]",
-            f"[{priority_color}]{task.priority.value}[/{priority_color}]",
-            task.complexity.value if task.complexity else "-",
+            _STATUS_RENDERED.get(task.status, task.status),
+            _PRIORITY_RENDERED.get(task.priority, task.priority),
+            _COMPLEXITY_TEXT.get(task.complexity, "-"),
             str(task.estimated_hours) if task.estimated_hours else "-",
             task.category or "-"
         )
     
+    if page_tasks and len(page_tasks) < len(tasks):
+        table.caption = f"[dim]Showing {start + 1}-{start + len(page_tasks)} of {len(tasks)}[/dim]"
+    elif not page_tasks and tasks:
+        table.caption = f"[dim]Page {page + 1} is past the last of {len(tasks)} tasks[/dim]"
+    
     return table
 
 
-def format_task_details(task: Task) -> Panel:
-    """Format task details as a rich panel."""
-    content = []
+def format_task_details(task: "Task") -> "Panel":
+    """Format task details as a rich panel.
+    
+    Lines are assembled as styled Text rather than markup strings, so Rich
+    has nothing to parse and task text containing brackets prints as-is.
+    """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+    
+    def field(label: str, value: object) -> Text:
+        return Text.assemble((f"{label}: ", "bold"), str(value))
+    
+    def section(label: str, body: str) -> List[Text]:
+        return [Text(), Text(f"{label}:", style="bold"), Text(body)]
     
     # Basic info
-    content.append(f"[bold]ID:[/bold] {task.id}")
-    content.append(f"[bold]Status:[/bold] {task.status.value}")
-    content.append(f"[bold]Priority:[/bold] {task.priority.value}")
+    parts = [
+        field("ID", task.id),
+        field("Status", _STATUS_TEXT[task.status]),
+        field("Priority", _PRIORITY_TEXT[task.priority]),
+    ]
     
     if task.complexity:
-        content.append(f"[bold]Complexity:[/bold] {task.complexity.value}")
+        parts.append(field("Complexity", _COMPLEXITY_TEXT[task.complexity]))
     if task.estimated_hours:
-        content.append(f"[bold]Estimated Hours:[/bold] {task.estimated_hours}")
+        parts.append(field("Estimated Hours", task.estimated_hours))
     if task.category:
-        content.append(f"[bold]Category:[/bold] {task.category}")
-    
-    content.append("")
-    content.append(f"[bold]Description:[/bold]")
-    content.append(task.description)
+        parts.append(field("Category", task.category))
     
-    content.append("")
-    content.append(f"[bold]Implementation Guide:[/bold]")
-    content.append(task.implementation_guide)
+    parts.extend(section("Description", task.description))
+    parts.extend(section("Implementation Guide", task.implementation_guide))
     
     if task.verification_criteria:
-        content.append("")
-        content.append(f"[bold]Verification Criteria:[/bold]")
-        content.append(task.verification_criteria)
+        parts.extend(section("Verification Criteria", task.verification_criteria))
     
     if task.dependencies:
-        content.append("")
-        content.append(f"[bold]Dependencies ({len(task.dependencies)}):[/bold]")
-        for dep in task.dependencies:
-            content.append(f"  • {dep.task_id}")
+        parts.append(Text())
+        parts.append(Text(f"Dependencies ({len(task.dependencies)}):", style="bold"))
+        for dep_id in task.dependencies:
+            parts.append(Text(f"  • {dep_id}"))
     
     if task.related_files:
-        content.append("")
-        content.append(f"[bold]Related Files ({len(task.related_files)}):[/bold]")
+        parts.append(Text())
+        parts.append(Text(f"Related Files ({len(task.related_files)}):", style="bold"))
         for file in task.related_files:
             line_info = ""
             if file.line_start and file.line_end:
                 line_info = f" (lines {file.line_start}-{file.line_end})"
-            content.append(f"  • [{file.type.value}] {file.path}{line_info}")
-            content.append(f"    {file.description}")
+            parts.append(Text(f"  • [{file.type.value}] {file.path}{line_info}"))
+            parts.append(Text(f"    {file.description}"))
     
     if task.notes:
-        content.append("")
-        content.append(f"[bold]Notes:[/bold]")
-        content.append(task.notes)
+        parts.extend(section("Notes", task.notes))
     
-    content.append("")
-    content.append(f"[dim]Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
-    content.append(f"Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M')}[/dim]")
+    parts.append(Text())
+    parts.append(Text(
+        f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}\n"
+        f"Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M')}",
+        style="dim"
+    ))
     
     return Panel(
-        "\n".join(content),
+        Group(*parts),
         title=f"📋 {task.name}",
         title_align="left",
         border_style="blue"
     )
 
 
+async def _load_execution_order() -> List[Dict[str, Any]]:
+    """Fetch the fields shown for each task in execution order."""
+    return await service.get_execution_order_fields(
+        ["name", "status", "priority", "description"],
+        max_lengths={"description": 80}
+    )
+
+
+def format_execution_order(tasks: List[Dict[str, Any]]) -> "Table":
+    """Format tasks in execution order as one grid, printed in one call.
+    
+    Each task takes a numbered name line and a dim description line; the
+    description arrives already truncated by the query.
+    """
+    from rich.table import Table
+    from rich.text import Text
+    
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(justify="right")
+    grid.add_column()
+    
+    for i, task in enumerate(tasks, 1):
+        grid.add_row(
+            f"{i}.",
+            Text.assemble(
+                f"{_STATUS_EMOJI.get(task['status'], '❓')} ",
+                (task["name"], "bold"),
+                f" ({task['priority']})"
+            )
+        )
+        grid.add_row("", Text(task["description"], style="dim"))
+    
+    return grid
+
+
 async def ensure_service_initialized(db_path: str = "tasks.db"):
     """Ensure the global service is initialized."""
     global service
     if service is None:
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Initializing task service...", total=None)
-                service = await initialize_service(db_path)
-                progress.update(task, description="✅ Task service ready!")
+            service = await _with_spinner(
+                "Initializing task service...",
+                "✅ Task service ready!",
+                initialize_service(db_path)
+            )
             
-            console.print(f"[green]Connected to database:[/green] {db_path}")
+            get_console().print(f"[green]Connected to database:[/green] {db_path}")
             
         except Exception as e:
-            console.print(f"[red]Failed to initialize service:[/red] {e}")
+            get_console().print(f"[red]Failed to initialize service:[/red] {e}")
             raise typer.Exit(1)
 
 
 @app.command()
 def create(
+    ctx: typer.Context,
     name: Annotated[str, typer.Option("--name", "-n", prompt=True, help="Task name")],
     description: Annotated[str, typer.Option("--description", "-d", prompt=True, help="Task description")],
     implementation_guide: Annotated[str, typer.Option("--implementation-guide", "-i", prompt=True, help="Implementation guide")],
@@ -181,6 +394,8 @@ def create(
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """Create a new task."""
+    from src.models.task import Task
+    
     async def _create():
         await ensure_service_initialized(db_path)
         
@@ -203,31 +418,29 @@ def create(
             
             task = Task(**task_data)
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Creating task...", total=None)
-                created_task = await service.create_task(task)
-                progress.update(task_progress, description="✅ Task created!")
+            created_task = await _with_spinner(
+                "Creating task...", "✅ Task created!", service.create_task(task)
+            )
             
-            console.print(format_task_details(created_task))
+            get_console().print(format_task_details(created_task))
             
         except Exception as e:
-            console.print(f"[red]Error creating task:[/red] {e}")
+            get_console().print(f"[red]Error creating task:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_create())
+    ctx.obj.loop.run_until_complete(_create())
 
 
 @app.command()
 def list(
+    ctx: typer.Context,
     status: Annotated[Optional[TaskStatus], typer.Option("--status", "-s", help="Filter by status")] = None,
     priority: Annotated[Optional[Priority], typer.Option("--priority", "-p", help="Filter by priority")] = None,
     category: Annotated[Optional[str], typer.Option("--category", "-c", help="Filter by category")] = None,
     complexity: Annotated[Optional[ComplexityLevel], typer.Option("--complexity", help="Filter by complexity")] = None,
     limit: Annotated[Optional[int], typer.Option("--limit", "-l", help="Limit number of results")] = None,
+    page: Annotated[int, typer.Option("--page", min=1, help="Page of results to show")] = 1,
+    page_size: Annotated[int, typer.Option("--page-size", min=1, help="Rows per page")] = DEFAULT_PAGE_SIZE,
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """List tasks with optional filters."""
@@ -245,31 +458,33 @@ def list(
             if complexity:
                 filters['complexity'] = complexity.value
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Loading tasks...", total=None)
-                tasks = await service.list_tasks(filters, limit)
-                progress.update(task_progress, description="✅ Tasks loaded!")
+            tasks = await _with_spinner(
+                "Loading tasks...",
+                "✅ Tasks loaded!",
+                service.list_tasks(filters, limit)
+            )
+            # Rendering only reads, so the models are swapped for slotted
+            # views while the table is built; loading still peaks at the
+            # full models, only the list held afterwards is smaller
+            tasks = [task.view() for task in tasks]
             
             if not tasks:
-                console.print("[yellow]No tasks found matching criteria.[/yellow]")
+                get_console().print("[yellow]No tasks found matching criteria.[/yellow]")
                 return
             
-            console.print(format_task_table(tasks))
-            console.print(f"\n[dim]Found {len(tasks)} task(s)[/dim]")
+            get_console().print(format_task_table(tasks, max_rows=page_size, page=page - 1))
+            get_console().print(f"\n[dim]Found {len(tasks)} task(s)[/dim]")
             
         except Exception as e:
-            console.print(f"[red]Error listing tasks:[/red] {e}")
+            get_console().print(f"[red]Error listing tasks:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_list())
+    ctx.obj.loop.run_until_complete(_list())
 
 
 @app.command()
 def show(
+    ctx: typer.Context,
     task_id: Annotated[str, typer.Argument(help="Task ID or name")],
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
@@ -278,30 +493,28 @@ def show(
         await ensure_service_initialized(db_path)
         
         try:
-            # Try to parse as UUID or search by name
-            try:
-                task_uuid = UUID(task_id)
-                task = await service.get_task(task_uuid)
-            except ValueError:
-                # Search by name
-                tasks = await service.list_tasks({'name': task_id})
-                task = tasks[0] if tasks else None
+            # Look up by UUID, or else search by name
+            if _UUID_RE.match(task_id):
+                task = await service.get_task(UUID(task_id))
+            else:
+                task = await service.get_task_by_name(task_id)
             
             if not task:
-                console.print(f"[red]Task '{task_id}' not found.[/red]")
+                get_console().print(f"[red]Task '{task_id}' not found.[/red]")
                 raise typer.Exit(1)
             
-            console.print(format_task_details(task))
+            get_console().print(format_task_details(task))
             
         except Exception as e:
-            console.print(f"[red]Error showing task:[/red] {e}")
+            get_console().print(f"[red]Error showing task:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_show())
+    ctx.obj.loop.run_until_complete(_show())
 
 
 @app.command()
 def update(
+    ctx: typer.Context,
     task_id: Annotated[str, typer.Argument(help="Task ID or name")],
     name: Annotated[Optional[str], typer.Option("--name", "-n", help="New task name")] = None,
     status: Annotated[Optional[TaskStatus], typer.Option("--status", "-s", help="New status")] = None,
@@ -317,57 +530,54 @@ def update(
         await ensure_service_initialized(db_path)
         
         try:
-            # Get existing task
-            try:
+            # Only a name needs a lookup to find the task's ID
+            if _UUID_RE.match(task_id):
                 task_uuid = UUID(task_id)
-                task = await service.get_task(task_uuid)
-            except ValueError:
-                tasks = await service.list_tasks({'name': task_id})
-                task = tasks[0] if tasks else None
-            
-            if not task:
-                console.print(f"[red]Task '{task_id}' not found.[/red]")
-                raise typer.Exit(1)
+            else:
+                task = await service.get_task_by_name(task_id)
+                task_uuid = task.id if task else None
             
-            # Update fields
+            # Collect just the fields given on the command line
+            updates = {}
             if name:
-                task.name = name
+                updates['name'] = name
             if status:
-                task.status = status
+                updates['status'] = status
             if priority:
-                task.priority = priority
+                updates['priority'] = priority
             if complexity:
-                task.complexity = complexity
+                updates['complexity'] = complexity
             if estimated_hours is not None:
-                task.estimated_hours = estimated_hours
+                updates['estimated_hours'] = estimated_hours
             if category:
-                task.category = category
+                updates['category'] = category
             if notes:
-                task.notes = notes
+                updates['notes'] = notes
             
-            # Update timestamp
-            task.update_timestamp()
+            updated_task = None
+            if task_uuid:
+                updated_task = await _with_spinner(
+                    "Updating task...",
+                    "✅ Task updated!",
+                    service.patch_task(task_uuid, updates)
+                )
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Updating task...", total=None)
-                updated_task = await service.update_task(task)
-                progress.update(task_progress, description="✅ Task updated!")
+            if not updated_task:
+                get_console().print(f"[red]Task '{task_id}' not found.[/red]")
+                raise typer.Exit(1)
             
-            console.print(format_task_details(updated_task))
+            get_console().print(format_task_details(updated_task))
             
         except Exception as e:
-            console.print(f"[red]Error updating task:[/red] {e}")
+            get_console().print(f"[red]Error updating task:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_update())
+    ctx.obj.loop.run_until_complete(_update())
 
 
 @app.command()
 def add_dependency(
+    ctx: typer.Context,
     task_id: Annotated[str, typer.Argument(help="Task ID")],
     depends_on_id: Annotated[str, typer.Argument(help="Dependency task ID")],
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
@@ -380,107 +590,136 @@ def add_dependency(
             task_uuid = UUID(task_id)
             depends_on_uuid = UUID(depends_on_id)
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Adding dependency...", total=None)
-                added = await service.add_dependency(task_uuid, depends_on_uuid)
-                progress.update(task_progress, description="✅ Dependency processed!")
+            added = await _with_spinner(
+                "Adding dependency...",
+                "✅ Dependency processed!",
+                service.add_dependency(task_uuid, depends_on_uuid)
+            )
             
             if added:
-                console.print(f"[green]✅ Dependency added:[/green] {task_id} → {depends_on_id}")
+                get_console().print(f"[green]✅ Dependency added:[/green] {task_id} → {depends_on_id}")
             else:
-                console.print(f"[red]❌ Failed to add dependency (would create cycle)[/red]")
+                get_console().print(f"[red]❌ Failed to add dependency (would create cycle)[/red]")
             
         except ValueError as e:
-            console.print(f"[red]Invalid UUID format:[/red] {e}")
+            get_console().print(f"[red]Invalid UUID format:[/red] {e}")
             raise typer.Exit(1)
         except Exception as e:
-            console.print(f"[red]Error adding dependency:[/red] {e}")
+            get_console().print(f"[red]Error adding dependency:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_add_dependency())
+    ctx.obj.loop.run_until_complete(_add_dependency())
 
 
 @app.command()
 def execution_order(
+    ctx: typer.Context,
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """Show tasks in dependency execution order."""
+    from rich.panel import Panel
+    
     async def _execution_order():
         await ensure_service_initialized(db_path)
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Computing execution order...", total=None)
-                tasks = await service.get_execution_order()
-                progress.update(task_progress, description="✅ Order computed!")
+            tasks = await _with_spinner(
+                "Computing execution order...",
+                "✅ Order computed!",
+                _load_execution_order()
+            )
             
             if not tasks:
-                console.print("[yellow]No tasks found.[/yellow]")
+                get_console().print("[yellow]No tasks found.[/yellow]")
                 return
             
-            console.print(Panel.fit("📋 Task Execution Order", style="bold blue"))
-            
-            for i, task in enumerate(tasks, 1):
-                status_emoji = {
-                    TaskStatus.PENDING: "⏳",
-                    TaskStatus.IN_PROGRESS: "🔄",
-                    TaskStatus.COMPLETED: "✅", 
-                    TaskStatus.BLOCKED: "🚫"
-                }.get(task.status, "❓")
-                
-                console.print(f"{i:2d}. {status_emoji} [bold]{task.name}[/bold] ({task.priority.value})")
-                console.print(f"    [dim]{task.description[:80]}{'...' if len(task.description) > 80 else ''}[/dim]")
+            get_console().print(Panel.fit("📋 Task Execution Order", style="bold blue"))
+            get_console().print(format_execution_order(tasks))
             
         except Exception as e:
-            console.print(f"[red]Error getting execution order:[/red] {e}")
+            get_console().print(f"[red]Error getting execution order:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_execution_order())
+    ctx.obj.loop.run_until_complete(_execution_order())
 
 
 @app.command()
 def ready(
+    ctx: typer.Context,
     status: Annotated[Optional[TaskStatus], typer.Option("--status", "-s", help="Filter by status")] = None,
+    page: Annotated[int, typer.Option("--page", min=1, help="Page of results to show")] = 1,
+    page_size: Annotated[int, typer.Option("--page-size", min=1, help="Rows per page")] = DEFAULT_PAGE_SIZE,
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """Show tasks ready to be worked on (no pending dependencies)."""
+    from rich.panel import Panel
+    
     async def _ready():
         await ensure_service_initialized(db_path)
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Finding ready tasks...", total=None)
-                ready_tasks = await service.get_ready_tasks(status)
-                progress.update(task_progress, description="✅ Ready tasks found!")
+            ready_tasks = await _with_spinner(
+                "Finding ready tasks...",
+                "✅ Ready tasks found!",
+                service.get_ready_tasks(status)
+            )
             
             if not ready_tasks:
-                console.print("[yellow]No ready tasks found.[/yellow]")
+                get_console().print("[yellow]No ready tasks found.[/yellow]")
                 return
             
-            console.print(Panel.fit("⚡ Ready Tasks", style="bold green"))
-            console.print(format_task_table(ready_tasks))
+            get_console().print(Panel.fit("⚡ Ready Tasks", style="bold green"))
+            get_console().print(format_task_table(ready_tasks, max_rows=page_size, page=page - 1))
             
         except Exception as e:
-            console.print(f"[red]Error finding ready tasks:[/red] {e}")
+            get_console().print(f"[red]Error finding ready tasks:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_ready())
+    ctx.obj.loop.run_until_complete(_ready())
+
+
+async def print_statistics() -> None:
+    """Compute project statistics and print them as a panel."""
+    from rich.panel import Panel
+    
+    statistics = await _with_spinner(
+        "Computing statistics...",
+        "✅ Statistics computed!",
+        service.get_project_statistics()
+    )
+    
+    # Create statistics display
+    stats_content = []
+    
+    stats_content.append(f"[bold]Total Tasks:[/bold] {statistics['total_tasks']}")
+    stats_content.append(f"[bold]Graph Nodes:[/bold] {statistics['graph_nodes']}")
+    stats_content.append(f"[bold]Graph Edges:[/bold] {statistics['graph_edges']}")
+    stats_content.append(f"[bold]Has Cycles:[/bold] {'⚠️ Yes' if statistics['has_cycles'] else '✅ No'}")
+    stats_content.append(f"[bold]Ready Tasks:[/bold] {statistics['ready_tasks_count']}")
+    
+    stats_content.append("")
+    stats_content.append("[bold]Status Breakdown:[/bold]")
+    
+    for status, count in statistics['status_breakdown'].items():
+        stats_content.append(f"  {_STATUS_RENDERED.get(status, status)}: {count}")
+    
+    if statistics.get('earliest_created'):
+        stats_content.append("")
+        stats_content.append(f"[dim]Earliest Created: {statistics['earliest_created']}")
+        stats_content.append(f"Latest Created: {statistics['latest_created']}")
+        stats_content.append(f"Latest Updated: {statistics['latest_updated']}[/dim]")
+    
+    get_console().print(Panel(
+        "\n".join(stats_content),
+        title="📊 Project Statistics",
+        title_align="left",
+        border_style="cyan"
+    ))
 
 
 @app.command()
 def stats(
+    ctx: typer.Context,
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """Show comprehensive project statistics."""
@@ -488,84 +727,41 @@ def stats(
         await ensure_service_initialized(db_path)
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Computing statistics...", total=None)
-                statistics = await service.get_project_statistics()
-                progress.update(task_progress, description="✅ Statistics computed!")
-            
-            # Create statistics display
-            stats_content = []
-            
-            stats_content.append(f"[bold]Total Tasks:[/bold] {statistics['total_tasks']}")
-            stats_content.append(f"[bold]Graph Nodes:[/bold] {statistics['graph_nodes']}")
-            stats_content.append(f"[bold]Graph Edges:[/bold] {statistics['graph_edges']}")
-            stats_content.append(f"[bold]Has Cycles:[/bold] {'⚠️ Yes' if statistics['has_cycles'] else '✅ No'}")
-            stats_content.append(f"[bold]Ready Tasks:[/bold] {statistics['ready_tasks_count']}")
-            
-            stats_content.append("")
-            stats_content.append("[bold]Status Breakdown:[/bold]")
-            
-            for status, count in statistics['status_breakdown'].items():
-                color = {
-                    'COMPLETED': 'green',
-                    'IN_PROGRESS': 'blue', 
-                    'PENDING': 'yellow',
-                    'BLOCKED': 'red'
-                }.get(status, 'white')
-                
-                stats_content.append(f"  [{color}]{status}[/{color}]: {count}")
-            
-            if statistics.get('earliest_created'):
-                stats_content.append("")
-                stats_content.append(f"[dim]Earliest Created: {statistics['earliest_created']}")
-                stats_content.append(f"Latest Created: {statistics['latest_created']}")
-                stats_content.append(f"Latest Updated: {statistics['latest_updated']}[/dim]")
-            
-            console.print(Panel(
-                "\n".join(stats_content),
-                title="📊 Project Statistics",
-                title_align="left",
-                border_style="cyan"
-            ))
-            
+            await print_statistics()
         except Exception as e:
-            console.print(f"[red]Error getting statistics:[/red] {e}")
+            get_console().print(f"[red]Error getting statistics:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_stats())
+    ctx.obj.loop.run_until_complete(_stats())
 
 
 @app.command()
 def detect_cycles(
+    ctx: typer.Context,
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
     """Check for circular dependencies in the task graph."""
+    from rich.panel import Panel
+    
     async def _detect_cycles():
         await ensure_service_initialized(db_path)
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Detecting cycles...", total=None)
-                has_cycles = await service.detect_circular_dependencies()
-                progress.update(task_progress, description="✅ Cycle detection complete!")
+            has_cycles = await _with_spinner(
+                "Detecting cycles...",
+                "✅ Cycle detection complete!",
+                service.detect_circular_dependencies()
+            )
             
             if has_cycles:
-                console.print(Panel(
+                get_console().print(Panel(
                     "⚠️ Circular dependencies detected in task graph!\n\nThis means some tasks depend on each other in a way that creates an impossible execution order.",
                     title="Circular Dependencies Found",
                     title_align="left",
                     border_style="red"
                 ))
             else:
-                console.print(Panel(
+                get_console().print(Panel(
                     "✅ No circular dependencies found.\n\nTask graph is valid and can be executed in proper dependency order.",
                     title="Graph Validation Successful",
                     title_align="left",
@@ -573,66 +769,90 @@ def detect_cycles(
                 ))
             
         except Exception as e:
-            console.print(f"[red]Error detecting cycles:[/red] {e}")
+            get_console().print(f"[red]Error detecting cycles:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_detect_cycles())
+    ctx.obj.loop.run_until_complete(_detect_cycles())
+
+
+def _read_task_batches(file_path: Path, batch_size: int) -> Iterator[List["Task"]]:
+    """Yield validated batches of the tasks listed in an export file.
+    
+    With ijson installed the file is parsed incrementally, so only one
+    batch of tasks is in memory at a time; otherwise it is loaded whole
+    with pydantic-core's Rust JSON parser.
+    """
+    from pydantic import TypeAdapter
+    from pydantic_core import from_json
+    
+    from src.models.task import Task
+    
+    # Validate each batch in one pydantic call; it converts the enum
+    # strings and nested related files itself
+    adapter = TypeAdapter(List[Task])
+    
+    with open(file_path, 'rb') as f:
+        try:
+            import ijson
+        except ImportError:  # Optional: falls back to parsing the whole file
+            items = iter(from_json(f.read()).get('tasks', []))
+        else:
+            items = ijson.items(f, 'tasks.item', use_float=True)
+        
+        while batch := [*islice(items, batch_size)]:
+            yield adapter.validate_python(batch)
 
 
 @app.command()
 def import_tasks(
-    file_path: Annotated[Path, typer.Argument(help="JSON file to import from", exists=True)],
-    db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
+    ctx: typer.Context,
+    file_path: Annotated[Path, typer.Argument(
+        help="JSON export, or CSV/Parquet/JSON lines file, to import from", exists=True
+    )],
+    db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db",
+    batch_size: Annotated[int, typer.Option(
+        "--batch-size", min=1, help="Tasks parsed and inserted per batch"
+    )] = DEFAULT_BATCH_SIZE
 ):
-    """Import tasks from a JSON file."""
+    """Import tasks from a JSON export or a CSV, Parquet or JSON lines file.
+    
+    Tabular files are loaded by DuckDB in a single statement, with one
+    task per row and columns named after task fields.
+    """
+    def _report(batches: Iterator[List["Task"]], update: Callable[[str], None]):
+        imported = 0
+        for number, batch in enumerate(batches, start=1):
+            imported += len(batch)
+            update(f"Importing tasks... batch {number} ({imported} tasks)")
+            yield batch
+    
     async def _import_tasks():
         await ensure_service_initialized(db_path)
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            tasks = []
-            for task_data in data.get('tasks', []):
-                # Convert string enums to enum instances
-                if 'priority' in task_data:
-                    task_data['priority'] = Priority(task_data['priority'])
-                if 'status' in task_data:
-                    task_data['status'] = TaskStatus(task_data['status'])
-                if 'complexity' in task_data:
-                    task_data['complexity'] = ComplexityLevel(task_data['complexity'])
-                
-                # Convert related files
-                if 'related_files' in task_data:
-                    related_files = []
-                    for file_data in task_data['related_files']:
-                        if 'type' in file_data:
-                            file_data['type'] = RelatedFileType(file_data['type'])
-                        related_files.append(RelatedFile(**file_data))
-                    task_data['related_files'] = related_files
-                
-                tasks.append(Task(**task_data))
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task(f"Importing {len(tasks)} tasks...", total=None)
-                created_tasks = await service.bulk_create_tasks(tasks)
-                progress.update(task_progress, description="✅ Tasks imported!")
+            if file_path.suffix.lower() != '.json':
+                count = await _with_spinner(
+                    "Importing tasks...", "✅ Tasks imported!",
+                    service.bulk_import(str(file_path))
+                )
+            else:
+                with _spinner("Importing tasks...", "✅ Tasks imported!") as update:
+                    count = await service.bulk_create_task_batches(
+                        _report(_read_task_batches(file_path, batch_size), update)
+                    )
             
-            console.print(f"[green]✅ Successfully imported {len(created_tasks)} tasks from {file_path}[/green]")
+            get_console().print(f"[green]✅ Successfully imported {count} tasks from {file_path}[/green]")
             
         except Exception as e:
-            console.print(f"[red]Error importing tasks:[/red] {e}")
+            get_console().print(f"[red]Error importing tasks:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_import_tasks())
+    ctx.obj.loop.run_until_complete(_import_tasks())
 
 
 @app.command()
 def export_tasks(
+    ctx: typer.Context,
     file_path: Annotated[Path, typer.Argument(help="JSON file to export to")],
     db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
 ):
@@ -641,65 +861,70 @@ def export_tasks(
         await ensure_service_initialized(db_path)
         
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task_progress = progress.add_task("Exporting tasks...", total=None)
-                tasks = await service.list_tasks()
-                progress.update(task_progress, description="✅ Tasks loaded!")
-            
-            # Convert tasks to JSON-serializable format
-            tasks_data = []
-            for task in tasks:
-                task_dict = task.model_dump()
-                # Convert UUID to string
-                task_dict['id'] = str(task_dict['id'])
-                # Convert dependency UUIDs to strings
-                for dep in task_dict.get('dependencies', []):
-                    dep['task_id'] = str(dep['task_id'])
-                tasks_data.append(task_dict)
-            
-            export_data = {
-                'tasks': tasks_data,
-                'exported_at': tasks[0].created_at.isoformat() if tasks else None,
-                'total_count': len(tasks)
-            }
-            
-            with open(file_path, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            count = await _with_spinner(
+                "Exporting tasks...",
+                "✅ Tasks exported!",
+                service.export_tasks_to_json(str(file_path))
+            )
             
-            console.print(f"[green]✅ Successfully exported {len(tasks)} tasks to {file_path}[/green]")
+            get_console().print(f"[green]✅ Successfully exported {count} tasks to {file_path}[/green]")
             
         except Exception as e:
-            console.print(f"[red]Error exporting tasks:[/red] {e}")
+            get_console().print(f"[red]Error exporting tasks:[/red] {e}")
             raise typer.Exit(1)
     
-    asyncio.run(_export_tasks())
+    ctx.obj.loop.run_until_complete(_export_tasks())
 
 
-@app.command()
-def interactive(
-    db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
-):
-    """Start interactive task management session."""
-    async def _interactive():
-        await ensure_service_initialized(db_path)
+class _InteractiveSession:
+    """State kept across the commands of one interactive session.
+    
+    Read results are reused by back-to-back commands for
+    INTERACTIVE_CACHE_TTL seconds and dropped when the session writes.
+    Created tasks are buffered and stored together by flush(), which runs
+    before any other command reads them.
+    """
+    
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self.pending: List["Task"] = []
+        # Text typed after the current command's name
+        self.argument = ""
+    
+    async def cached(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached result for key, loading it if missing or stale."""
+        now = time.monotonic()
+        hit = self._entries.get(key)
+        if hit is not None and now - hit[0] < INTERACTIVE_CACHE_TTL:
+            return hit[1]
+        result = await load()
+        self._entries[key] = (now, result)
+        return result
+    
+    def clear(self) -> None:
+        """Forget every cached result."""
+        self._entries.clear()
+    
+    async def flush(self) -> int:
+        """Store the buffered tasks with one bulk insert.
         
-        console.print(Panel.fit("🚀 Interactive Task Manager", style="bold magenta"))
-        console.print("[dim]Type 'help' for available commands, 'quit' to exit[/dim]\n")
+        The buffer is only emptied once the insert succeeds, so tasks
+        that fail to store are kept and can be flushed again.
         
-        while True:
-            try:
-                command = Prompt.ask("[bold cyan]task-manager[/bold cyan]", default="help")
-                
-                if command.lower() in ['quit', 'exit', 'q']:
-                    console.print("[yellow]Goodbye! 👋[/yellow]")
-                    break
-                
-                elif command.lower() == 'help':
-                    help_text = """
+        Returns:
+            Number of tasks stored
+        """
+        if not self.pending:
+            return 0
+        
+        tasks = self.pending
+        await service.bulk_create_tasks(tasks)
+        self.pending = []
+        self.clear()
+        return len(tasks)
+
+
+_INTERACTIVE_HELP = """
 [bold]Available Commands:[/bold]
 
 • [cyan]stats[/cyan]         - Show project statistics
@@ -708,121 +933,232 @@ def interactive(
 • [cyan]order[/cyan]         - Show execution order
 • [cyan]cycles[/cyan]        - Check for circular dependencies
 • [cyan]create[/cyan]        - Create a new task (guided)
+• [cyan]flush[/cyan]         - Store the tasks created so far
+• [cyan]import[/cyan] [dim]<path>[/dim] - Bulk import a CSV, Parquet or JSON lines file
 • [cyan]quit[/cyan]          - Exit interactive mode
 
 [dim]Tip: Use the CLI commands for more advanced operations[/dim]
-                    """
-                    console.print(Panel(help_text.strip(), title="Help", border_style="blue"))
-                
-                elif command.lower() == 'stats':
-                    await _stats()
-                
-                elif command.lower() == 'list':
-                    tasks = await service.list_tasks()
-                    if tasks:
-                        console.print(format_task_table(tasks))
-                        console.print(f"\n[dim]Found {len(tasks)} task(s)[/dim]")
-                    else:
-                        console.print("[yellow]No tasks found.[/yellow]")
-                
-                elif command.lower() == 'ready':
-                    ready_tasks = await service.get_ready_tasks()
-                    if ready_tasks:
-                        console.print(Panel.fit("⚡ Ready Tasks", style="bold green"))
-                        console.print(format_task_table(ready_tasks))
-                    else:
-                        console.print("[yellow]No ready tasks found.[/yellow]")
-                
-                elif command.lower() == 'order':
-                    tasks = await service.get_execution_order()
-                    if tasks:
-                        console.print(Panel.fit("📋 Task Execution Order", style="bold blue"))
-                        for i, task in enumerate(tasks, 1):
-                            status_emoji = {
-                                TaskStatus.PENDING: "⏳",
-                                TaskStatus.IN_PROGRESS: "🔄",
-                                TaskStatus.COMPLETED: "✅", 
-                                TaskStatus.BLOCKED: "🚫"
-                            }.get(task.status, "❓")
-                            console.print(f"{i:2d}. {status_emoji} [bold]{task.name}[/bold] ({task.priority.value})")
-                            console.print(f"    [dim]{task.description[:80]}{'...' if len(task.description) > 80 else ''}[/dim]")
-                    else:
-                        console.print("[yellow]No tasks found.[/yellow]")
+""".strip()
+
+
+async def _do_help(session: _InteractiveSession) -> None:
+    """Print the interactive command reference."""
+    from rich.panel import Panel
+    
+    get_console().print(Panel(_INTERACTIVE_HELP, title="Help", border_style="blue"))
+
+
+async def _do_stats(session: _InteractiveSession) -> None:
+    """Print project statistics."""
+    await print_statistics()
+
+
+async def _do_list(session: _InteractiveSession) -> None:
+    """Print all tasks a page at a time."""
+    from rich.prompt import Confirm
+    
+    tasks = await session.cached('list', service.list_tasks)
+    if tasks:
+        page = 0
+        get_console().print(format_task_table(tasks, page=page))
+        while (page + 1) * DEFAULT_PAGE_SIZE < len(tasks) and Confirm.ask("Show more?", default=False):
+            page += 1
+            get_console().print(format_task_table(tasks, page=page))
+        get_console().print(f"\n[dim]Found {len(tasks)} task(s)[/dim]")
+    else:
+        get_console().print("[yellow]No tasks found.[/yellow]")
+
+
+async def _do_ready(session: _InteractiveSession) -> None:
+    """Print the tasks whose dependencies are complete."""
+    from rich.panel import Panel
+    
+    ready_tasks = await session.cached('ready', service.get_ready_tasks)
+    if ready_tasks:
+        get_console().print(Panel.fit("⚡ Ready Tasks", style="bold green"))
+        get_console().print(format_task_table(ready_tasks))
+    else:
+        get_console().print("[yellow]No ready tasks found.[/yellow]")
+
+
+async def _do_order(session: _InteractiveSession) -> None:
+    """Print tasks in dependency execution order."""
+    from rich.panel import Panel
+    
+    tasks = await session.cached('order', _load_execution_order)
+    if tasks:
+        get_console().print(Panel.fit("📋 Task Execution Order", style="bold blue"))
+        get_console().print(format_execution_order(tasks))
+    else:
+        get_console().print("[yellow]No tasks found.[/yellow]")
+
+
+async def _do_cycles(session: _InteractiveSession) -> None:
+    """Report whether the dependency graph has cycles."""
+    from rich.panel import Panel
+    
+    has_cycles = await service.detect_circular_dependencies()
+    if has_cycles:
+        get_console().print(Panel(
+            "⚠️ Circular dependencies detected in task graph!",
+            title="Circular Dependencies Found",
+            title_align="left",
+            border_style="red"
+        ))
+    else:
+        get_console().print(Panel(
+            "✅ No circular dependencies found.",
+            title="Graph Validation Successful",
+            title_align="left",
+            border_style="green"
+        ))
+
+
+async def _do_create(session: _InteractiveSession) -> None:
+    """Prompt for a new task's fields and create it."""
+    from rich.prompt import Confirm, Prompt
+    
+    from src.models.task import Task
+    
+    get_console().print("[yellow]Guided task creation:[/yellow]\n")
+    
+    name = Prompt.ask("Task name")
+    description = Prompt.ask("Description")
+    impl_guide = Prompt.ask("Implementation guide")
+    priority = _PRIORITY_CHOICES[
+        Prompt.ask("Priority", choices=_PRIORITY_CHOICE_LIST, default=Priority.P2.value)
+    ]
+    
+    # Optional fields
+    complexity = None
+    if Confirm.ask("Add complexity level?", default=False):
+        complexity = _COMPLEXITY_CHOICES[
+            Prompt.ask("Complexity", choices=_COMPLEXITY_CHOICE_LIST)
+        ]
+    
+    hours = None
+    if Confirm.ask("Add estimated hours?", default=False):
+        hours = int(Prompt.ask("Estimated hours", default="0"))
+        hours = hours if hours > 0 else None
+    
+    category = None
+    if Confirm.ask("Add category?", default=False):
+        category = Prompt.ask("Category")
+    
+    # Create the task
+    try:
+        task_data = {
+            'name': name,
+            'description': description,
+            'implementation_guide': impl_guide,
+            'priority': priority
+        }
+        
+        if complexity:
+            task_data['complexity'] = complexity
+        if hours:
+            task_data['estimated_hours'] = hours
+        if category:
+            task_data['category'] = category
+        
+        task = Task(**task_data)
+        
+    except Exception as e:
+        get_console().print(f"[red]Error creating task: {e}[/red]")
+        return
+    
+    # Stored with the next flush, or right away once a full batch is waiting
+    session.pending.append(task)
+    if len(session.pending) >= DEFAULT_BATCH_SIZE:
+        await _do_flush(session)
+        return
+    
+    get_console().print(f"\n[green]✅ Task queued ({len(session.pending)} pending)[/green]")
+    get_console().print(format_task_details(task))
+
+
+async def _do_import(session: _InteractiveSession) -> None:
+    """Bulk import the tasks of the file named after the command."""
+    if not session.argument:
+        get_console().print("[red]Usage: import <path>[/red]")
+        return
+    
+    count = await _with_spinner(
+        "Importing tasks...", "✅ Tasks imported!", service.bulk_import(session.argument)
+    )
+    session.clear()
+    get_console().print(f"[green]✅ Imported {count} task(s) from {session.argument}[/green]")
+
+
+async def _do_flush(session: _InteractiveSession) -> None:
+    """Store the tasks created since the last flush."""
+    count = await session.flush()
+    get_console().print(f"[green]✅ Stored {count} pending task(s)[/green]")
+
+
+# Interactive commands by name; quit words end the session
+_INTERACTIVE_COMMANDS: Dict[str, Callable[[_InteractiveSession], Awaitable[None]]] = {
+    'help': _do_help,
+    'stats': _do_stats,
+    'list': _do_list,
+    'ready': _do_ready,
+    'order': _do_order,
+    'cycles': _do_cycles,
+    'create': _do_create,
+    'flush': _do_flush,
+    'import': _do_import,
+}
+_INTERACTIVE_QUIT = frozenset({'quit', 'exit', 'q'})
+
+
+@app.command()
+def interactive(
+    ctx: typer.Context,
+    db_path: Annotated[str, typer.Option("--db-path", help="Database file path")] = "tasks.db"
+):
+    """Start interactive task management session."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    
+    async def _interactive():
+        await ensure_service_initialized(db_path)
+        
+        get_console().print(Panel.fit("🚀 Interactive Task Manager", style="bold magenta"))
+        get_console().print("[dim]Type 'help' for available commands, 'quit' to exit[/dim]\n")
+        
+        session = _InteractiveSession()
+        
+        while True:
+            try:
+                command = Prompt.ask("[bold cyan]task-manager[/bold cyan]", default="help")
+                key, _, session.argument = command.strip().partition(' ')
+                session.argument = session.argument.strip()
+                if not key.islower():
+                    # Typed commands are nearly always lowercase already
+                    key = key.lower()
                 
-                elif command.lower() == 'cycles':
-                    has_cycles = await service.detect_circular_dependencies()
-                    if has_cycles:
-                        console.print(Panel(
-                            "⚠️ Circular dependencies detected in task graph!",
-                            title="Circular Dependencies Found",
-                            title_align="left",
-                            border_style="red"
-                        ))
-                    else:
-                        console.print(Panel(
-                            "✅ No circular dependencies found.",
-                            title="Graph Validation Successful",
-                            title_align="left",
-                            border_style="green"
-                        ))
+                if key in _INTERACTIVE_QUIT:
+                    await session.flush()
+                    get_console().print("[yellow]Goodbye! 👋[/yellow]")
+                    break
                 
-                elif command.lower() == 'create':
-                    console.print("[yellow]Guided task creation:[/yellow]\n")
-                    
-                    name = Prompt.ask("Task name")
-                    description = Prompt.ask("Description")
-                    impl_guide = Prompt.ask("Implementation guide")
-                    priority = Priority(Prompt.ask("Priority", choices=['P0', 'P1', 'P2', 'P3'], default='P2'))
-                    
-                    # Optional fields
-                    complexity = None
-                    if Confirm.ask("Add complexity level?", default=False):
-                        complexity = ComplexityLevel(Prompt.ask("Complexity", choices=['SIMPLE', 'MODERATE', 'COMPLEX', 'EPIC']))
-                    
-                    hours = None
-                    if Confirm.ask("Add estimated hours?", default=False):
-                        hours = int(Prompt.ask("Estimated hours", default="0"))
-                        hours = hours if hours > 0 else None
-                    
-                    category = None
-                    if Confirm.ask("Add category?", default=False):
-                        category = Prompt.ask("Category")
-                    
-                    # Create the task
-                    try:
-                        task_data = {
-                            'name': name,
-                            'description': description,
-                            'implementation_guide': impl_guide,
-                            'priority': priority
-                        }
-                        
-                        if complexity:
-                            task_data['complexity'] = complexity
-                        if hours:
-                            task_data['estimated_hours'] = hours
-                        if category:
-                            task_data['category'] = category
-                        
-                        task = Task(**task_data)
-                        created_task = await service.create_task(task)
-                        
-                        console.print(f"\n[green]✅ Task created successfully![/green]")
-                        console.print(format_task_details(created_task))
-                        
-                    except Exception as e:
-                        console.print(f"[red]Error creating task: {e}[/red]")
+                handler = _INTERACTIVE_COMMANDS.get(key)
+                if handler is None:
+                    get_console().print(f"[red]Unknown command: {command}[/red]")
+                    get_console().print("[dim]Type 'help' for available commands[/dim]")
+                    continue
                 
-                else:
-                    console.print(f"[red]Unknown command: {command}[/red]")
-                    console.print("[dim]Type 'help' for available commands[/dim]")
+                # Every other command sees the buffered tasks stored first
+                if handler not in (_do_create, _do_flush):
+                    await session.flush()
+                await handler(session)
             
             except KeyboardInterrupt:
-                console.print("\n[yellow]Use 'quit' to exit gracefully[/yellow]")
+                get_console().print("\n[yellow]Use 'quit' to exit gracefully[/yellow]")
             except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
+                get_console().print(f"[red]Error: {e}[/red]")
     
-    asyncio.run(_interactive())
+    ctx.obj.loop.run_until_complete(_interactive())
 
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
 """Configuration management for the Advanced Task Manager."""
 
 import os
+import tomllib
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, ClassVar, List, Optional, Set, Tuple, get_args
 
+import tomli_w
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
@@ -32,7 +35,7 @@ class StorageConfig(BaseModel):
     enable_graph_cache: bool = Field(default=True, description="Enable graph storage caching")
     max_graph_nodes: int = Field(default=10000, description="Maximum nodes in graph")
     enable_table_indexes: bool = Field(default=True, description="Enable table indexes")
-    bulk_insert_batch_size: int = Field(default=100, description="Batch size for bulk operations")
+    bulk_insert_batch_size: int = Field(default=10_000, description="Batch size for bulk operations")
 
 
 class UIConfig(BaseModel):
@@ -65,12 +68,17 @@ class TaskManagerConfig(BaseSettings):
         "extra": "ignore"
     }
     
+    # Data directories already created by this process
+    _created_dirs: ClassVar[Set[str]] = set()
+    
     def __init__(self, **kwargs):
         """Initialize configuration with environment variables and defaults."""
         super().__init__(**kwargs)
         
         # Ensure data directory exists
-        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+        if self.data_dir not in self._created_dirs:
+            Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(self.data_dir)
         
         # Update database path if relative
         if not os.path.isabs(self.database.path):
@@ -79,8 +87,6 @@ class TaskManagerConfig(BaseSettings):
     @classmethod
     def from_file(cls, config_path: str) -> "TaskManagerConfig":
         """Load configuration from a TOML file."""
-        import tomllib
-        
         with open(config_path, 'rb') as f:
             config_data = tomllib.load(f)
         
@@ -88,8 +94,6 @@ class TaskManagerConfig(BaseSettings):
     
     def save_to_file(self, config_path: str) -> None:
         """Save current configuration to a TOML file."""
-        import tomli_w
-        
         config_dict = self.model_dump()
         
         with open(config_path, 'wb') as f:
@@ -156,28 +160,57 @@ ENVIRONMENT_MAPPINGS = {
 }
 
 
+# Environment flag values read as True
+_BOOL_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _parse_bool(value: str) -> bool:
+    """Read an environment flag."""
+    return value.lower() in _BOOL_TRUE
+
+
+def _env_plan() -> List[Tuple[str, Callable[[Any], Any], str, Callable[[str], Any]]]:
+    """Resolve ENVIRONMENT_MAPPINGS into (env var, owner getter, field, caster).
+    
+    Each dotted path is split and its field type looked up on the config
+    classes once, so reading the environment is a flat loop.
+    """
+    plan = []
+    for env_var, config_path in ENVIRONMENT_MAPPINGS.items():
+        *owner_path, field = config_path.split('.')
+        
+        # Navigate to the nested config class declaring the field
+        model: Any = TaskManagerConfig
+        for part in owner_path:
+            model = model.model_fields[part].annotation
+        
+        # Convert value to appropriate type
+        # Optional[...] fields are cast to the type they wrap
+        annotation = model.model_fields[field].annotation
+        wrapped = get_args(annotation)
+        if annotation is bool or bool in wrapped:
+            caster: Callable[[str], Any] = _parse_bool
+        elif annotation is int or int in wrapped:
+            caster = int
+        else:
+            caster = str
+        
+        getter = attrgetter('.'.join(owner_path)) if owner_path else lambda config: config
+        plan.append((env_var, getter, field, caster))
+    return plan
+
+
+_ENV_PLAN = _env_plan()
+
+
 def get_config_from_env() -> TaskManagerConfig:
     """Create configuration from environment variables with legacy support."""
     config = TaskManagerConfig()
     
     # Apply legacy environment variable mappings
-    for env_var, config_path in ENVIRONMENT_MAPPINGS.items():
+    for env_var, getter, field, caster in _ENV_PLAN:
         value = os.getenv(env_var)
         if value is not None:
-            # Navigate to nested config attribute
-            obj = config
-            parts = config_path.split('.')
-            
-            for part in parts[:-1]:
-                obj = getattr(obj, part)
-            
-            # Convert value to appropriate type
-            field_info = obj.model_fields[parts[-1]]
-            if field_info.annotation == bool:
-                value = value.lower() in ('true', '1', 'yes', 'on')
-            elif field_info.annotation == int:
-                value = int(value)
-            
-            setattr(obj, parts[-1], value)
-    
-    return config
\ No newline at end of file
+            setattr(getter(config), field, caster(value))
+    
+    return config
@@ -5,27 +5,52 @@ with integrated graph (NetworkX) and table (DuckDB) storage backends.
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Callable
 
 from src.config import get_config, TaskManagerConfig
 from src.server import main as server_main
 
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
 def setup_logging(config: TaskManagerConfig) -> None:
-    """Set up logging configuration."""
+    """Set up logging configuration.
+    
+    Log file writes happen on a QueueListener thread; logging calls only
+    enqueue the record, so the event loop never waits on the disk.
+    """
     log_level = getattr(logging, config.get_log_level())
     
+    file_handler = logging.FileHandler(
+        Path(config.data_dir) / 'task_manager.log',
+        mode='a'
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queued record is formatted once, by the file handler
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=LOG_FORMAT,
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler(
-                Path(config.data_dir) / 'task_manager.log',
-                mode='a'
-            )
+            queue_handler
         ]
     )
     
@@ -39,9 +64,11 @@ async def initialize_system(config: TaskManagerConfig) -> None:
     """Initialize the task management system."""
     logger = logging.getLogger(__name__)
     
-    # Ensure data directory exists
+    # Ensure data directory exists; the config has usually created it already
     data_dir = Path(config.data_dir)
-    data_dir.mkdir(parents=True, exist_ok=True)
+    if config.data_dir not in TaskManagerConfig._created_dirs:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        TaskManagerConfig._created_dirs.add(config.data_dir)
     
     logger.info(f"Task Manager starting...")
     logger.info(f"Data directory: {data_dir.absolute()}")
@@ -78,5 +105,15 @@ async def main() -> None:
         sys.exit(1)
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Pick uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # Optional: falls back to the default asyncio loop
+        return asyncio.new_event_loop
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(main())
\ No newline at end of file
@@ -1,11 +1,37 @@
 """Enhanced task models with Pydantic v2 validation."""
 
-from datetime import datetime, timezone
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# (epoch milliseconds, datetime) of the last utc_now() call, replaced as
+# one tuple so concurrent callers never see a half-updated pair
+_now_cache: Tuple[int, datetime] = (-1, _EPOCH)
+
+
+def utc_now() -> datetime:
+    """Current UTC time, truncated to millisecond precision.
+    
+    Models built within the same millisecond share one datetime object
+    instead of each allocating its own through datetime.now(timezone.utc).
+    The trade-off is that their timestamps are equal, so models created
+    back to back can't be ordered by created_at alone.
+    """
+    global _now_cache
+    ms = time.time_ns() // 1_000_000
+    cached = _now_cache
+    if cached[0] != ms:
+        cached = (ms, _EPOCH + timedelta(milliseconds=ms))
+        _now_cache = cached
+    return cached[1]
 
 
 class TaskStatus(str, Enum):
@@ -88,7 +114,11 @@ class RelatedFile(BaseModel):
 
 
 class TaskDependency(BaseModel):
-    """Task dependency reference."""
+    """Task dependency reference.
+    
+    Task.dependencies holds the UUIDs themselves; this wrapper is still
+    accepted there, and read from stored tasks, for compatibility.
+    """
     
     task_id: UUID = Field(..., description="UUID of dependent task")
     
@@ -130,8 +160,8 @@ class Task(BaseModel):
     )
     
     # Relationships
-    dependencies: List[TaskDependency] = Field(
-        default_factory=list, description="Task dependencies"
+    dependencies: List[UUID] = Field(
+        default_factory=list, description="IDs of tasks this task depends on"
     )
     related_files: List[RelatedFile] = Field(
         default_factory=list, description="Associated files"
@@ -145,10 +175,10 @@ class Task(BaseModel):
     
     # Timestamps
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Creation timestamp"
+        default_factory=utc_now, description="Creation timestamp"
     )
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), description="Last update timestamp"
+        default_factory=utc_now, description="Last update timestamp"
     )
     
     # Validation configuration
@@ -158,35 +188,95 @@ class Task(BaseModel):
         frozen=False               # Allow updates
     )
     
-    @field_validator("name")
-    @classmethod
-    def validate_name_format(cls, v: str) -> str:
-        """Ensure task name follows proper format."""
-        if not v.strip():
-            raise ValueError("Task name cannot be empty or whitespace")
-        return v.strip()
-    
-    @field_validator("estimated_hours")
+    @field_validator("dependencies", mode="before")
     @classmethod
-    def validate_complexity_hours_alignment(
-        cls, v: Optional[int], info
-    ) -> Optional[int]:
-        """Ensure estimated hours align with complexity level."""
-        if v is None:
+    def coerce_dependencies(cls, v: Any) -> Any:
+        """Unwrap TaskDependency objects and {"task_id": ...} mappings."""
+        if not isinstance(v, list):
             return v
-            
-        complexity = info.data.get("complexity")
-        if complexity == ComplexityLevel.SIMPLE and v > 4:
-            raise ValueError("SIMPLE tasks should be ≤4 hours")
-        elif complexity == ComplexityLevel.MODERATE and (v <= 4 or v > 8):
-            raise ValueError("MODERATE tasks should be 4-8 hours")
-        elif complexity == ComplexityLevel.COMPLEX and (v <= 8 or v > 16):
-            raise ValueError("COMPLEX tasks should be 8-16 hours")
-        elif complexity == ComplexityLevel.EPIC and v <= 16:
-            raise ValueError("EPIC tasks should be >16 hours (consider splitting)")
-            
-        return v
+        return [
+            dep.task_id if isinstance(dep, TaskDependency)
+            else dep["task_id"] if isinstance(dep, dict)
+            else dep
+            for dep in v
+        ]
+    
+    @model_validator(mode="after")
+    def validate_task(self) -> "Task":
+        """Strip the name and check estimated hours against complexity.
+        
+        Both checks run in one validator, once per validation of the model
+        rather than through a separate field validator each.
+        """
+        name = self.name.strip()
+        if not name:
+            raise ValueError("Task name cannot be empty or whitespace")
+        if name != self.name:
+            # Set directly so the assignment isn't validated all over again
+            self.__dict__["name"] = name
+        
+        hours = self.estimated_hours
+        if hours is not None:
+            complexity = self.complexity
+            if complexity == ComplexityLevel.SIMPLE and hours > 4:
+                raise ValueError("SIMPLE tasks should be ≤4 hours")
+            elif complexity == ComplexityLevel.MODERATE and (hours <= 4 or hours > 8):
+                raise ValueError("MODERATE tasks should be 4-8 hours")
+            elif complexity == ComplexityLevel.COMPLEX and (hours <= 8 or hours > 16):
+                raise ValueError("COMPLEX tasks should be 8-16 hours")
+            elif complexity == ComplexityLevel.EPIC and hours <= 16:
+                raise ValueError("EPIC tasks should be >16 hours (consider splitting)")
+        
+        return self
     
     def update_timestamp(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(timezone.utc)
\ No newline at end of file
+        """Update the updated_at timestamp.
+        
+        A fresh timestamp needs no validation, so it bypasses the
+        validate_assignment round trip through the model validator. It
+        keeps full precision so an update always moves the timestamp on.
+        """
+        object.__setattr__(self, "updated_at", datetime.now(timezone.utc))
+    
+    def view(self) -> "TaskView":
+        """Read-only snapshot of this task for listing and display."""
+        data = self.__dict__
+        return TaskView(*[
+            tuple(data[name]) if name in _TASK_VIEW_SEQUENCES else data[name]
+            for name in _TASK_VIEW_FIELDS
+        ])
+
+
+@dataclass(frozen=True, slots=True)
+class TaskView:
+    """Immutable, slotted copy of a Task for the read path.
+    
+    Pydantic models always carry a per-instance __dict__, so large listings
+    that never mutate or re-validate their tasks hold these instead. Values
+    are taken from an already validated Task and are not checked again.
+    Task stores enum fields as their values (use_enum_values), so they are
+    plain strings here, and its lists are copied to tuples rather than
+    shared.
+    """
+    
+    id: UUID
+    name: str
+    description: str
+    implementation_guide: str
+    verification_criteria: Optional[str]
+    status: str
+    priority: str
+    complexity: Optional[str]
+    estimated_hours: Optional[int]
+    dependencies: Tuple[UUID, ...]
+    related_files: Tuple[RelatedFile, ...]
+    category: Optional[str]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+# Task.view() fills TaskView positionally in this order
+_TASK_VIEW_FIELDS = tuple(field.name for field in fields(TaskView))
+# View fields holding Task lists, copied to tuples
+_TASK_VIEW_SEQUENCES = frozenset({"dependencies", "related_files"})
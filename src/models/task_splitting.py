@@ -6,14 +6,23 @@ following the patterns from MCP Shrimp Task Manager with enhanced validation
 and modern Pydantic v2 patterns.
 """
 
-from datetime import datetime, timezone
+import sys
+from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator, ConfigDict
 
-from .task import Task, TaskStatus, Priority, ComplexityLevel, RelatedFile
+from .task import Task, TaskStatus, Priority, ComplexityLevel, RelatedFile, utc_now
+
+
+# Model configs shared by every model here and in the splitting schemas
+_STRICT_CONFIG = ConfigDict(str_strip_whitespace=True, extra="forbid")
+_STRICT_FROZEN_CONFIG = ConfigDict(str_strip_whitespace=True, extra="forbid", frozen=True)
+_FROZEN_CONFIG = ConfigDict(extra="forbid", frozen=True)
+# Templates strip their own strings before validation (see TaskTemplate)
+_TEMPLATE_CONFIG = ConfigDict(extra="forbid")
 
 
 class UpdateMode(str, Enum):
@@ -33,12 +42,11 @@ class GranularityRules(BaseModel):
     Rules for task granularity validation and enforcement.
     
     Ensures tasks are appropriately sized and maintain quality standards.
+    Rules are frozen, so the default instance can be shared by every
+    request that doesn't bring its own; use model_copy(update=...) to
+    derive changed rules.
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _STRICT_FROZEN_CONFIG
     
     # Task duration constraints (in hours)
     min_task_duration_hours: int = Field(
@@ -97,6 +105,25 @@ class GranularityRules(BaseModel):
         """Validate task description length."""
         return len(description.strip()) >= self.min_description_length
     
+    def validate_templates(self, templates: List["TaskTemplate"]) -> bool:
+        """Validate a batch of templates: their count, names and descriptions.
+        
+        Templates strip whitespace on construction, so the stored lengths
+        are checked directly, with the limits read once for the batch.
+        """
+        if not 1 <= len(templates) <= self.max_subtasks_per_split:
+            return False
+        
+        max_name_length = self.max_task_name_length
+        min_description_length = self.min_description_length
+        for template in templates:
+            if not 1 <= len(template.name) <= max_name_length:
+                return False
+            if len(template.description) < min_description_length:
+                return False
+        
+        return True
+    
     @field_validator("max_task_duration_hours")
     @classmethod
     def validate_duration_range(cls, v: int, info) -> int:
@@ -107,6 +134,10 @@ class GranularityRules(BaseModel):
         return v
 
 
+# Rules used when a request or decomposition doesn't specify any
+DEFAULT_GRANULARITY_RULES = GranularityRules()
+
+
 class TaskTemplate(BaseModel):
     """
     Template for creating tasks with structured decomposition data.
@@ -114,11 +145,7 @@ class TaskTemplate(BaseModel):
     Represents a task template that can be converted to an actual Task instance
     with all required fields and validation.
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _TEMPLATE_CONFIG
     
     name: str = Field(
         ...,
@@ -187,9 +214,37 @@ class TaskTemplate(BaseModel):
             category=self.category,
             notes=self.notes,
             dependencies=[],  # Will be resolved during splitting
-            related_files=self.related_files.copy()
+            # Task validation builds its own list, so no copy is needed
+            related_files=self.related_files
         )
     
+    @model_validator(mode="before")
+    @classmethod
+    def strip_strings(cls, data: Any) -> Any:
+        """Strip surrounding whitespace from string fields and dependencies.
+        
+        Runs once per template instead of per field. Clean input is passed
+        through untouched; the input dict is copied only if a value changes.
+        """
+        if not isinstance(data, dict):
+            return data
+        
+        stripped = data
+        for key, value in data.items():
+            if isinstance(value, str):
+                clean = value.strip()
+            elif key == "dependencies" and isinstance(value, list):
+                clean = [dep.strip() if isinstance(dep, str) else dep for dep in value]
+                if all(a is b for a, b in zip(clean, value)):
+                    clean = value
+            else:
+                continue
+            if clean is not value:
+                if stripped is data:
+                    stripped = dict(data)
+                stripped[key] = clean
+        return stripped
+    
     @field_validator("dependencies")
     @classmethod
     def validate_dependencies(cls, v: List[str]) -> List[str]:
@@ -197,15 +252,27 @@ class TaskTemplate(BaseModel):
         if not v:
             return v
         
-        # Remove duplicates while preserving order
+        # Remove blanks and duplicates while preserving order
         seen = set()
         unique_deps = []
         for dep in v:
-            if dep.strip() and dep not in seen:
+            if dep and dep not in seen:
                 seen.add(dep)
-                unique_deps.append(dep.strip())
+                unique_deps.append(sys.intern(dep))
         
         return unique_deps
+    
+    @field_validator("name")
+    @classmethod
+    def intern_name(cls, v: str) -> str:
+        """Intern the name; names and dependencies key the same dicts and sets."""
+        return sys.intern(v)
+    
+    @field_validator("priority", mode="before")
+    @classmethod
+    def default_priority(cls, v: Any) -> Any:
+        """Treat an explicit None priority as the default P2."""
+        return Priority.P2 if v is None else v
 
 
 class TaskSplitRequest(BaseModel):
@@ -215,11 +282,7 @@ class TaskSplitRequest(BaseModel):
     Contains all information needed to perform intelligent task decomposition
     with proper validation and granularity controls.
     """
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _STRICT_CONFIG
     
     update_mode: UpdateMode = Field(
         default=UpdateMode.CLEAR_ALL_TASKS,
@@ -235,24 +298,19 @@ class TaskSplitRequest(BaseModel):
         description="Overall project goal applicable to all tasks"
     )
     granularity_rules: GranularityRules = Field(
-        default_factory=GranularityRules,
+        default_factory=lambda: DEFAULT_GRANULARITY_RULES,
         description="Rules for task granularity validation"
     )
     
     def validate_granularity(self) -> bool:
         """Validate request against granularity rules."""
-        # Check task count
-        if not self.granularity_rules.validate_task_count(len(self.task_templates)):
-            return False
-        
-        # Check individual task constraints
-        for template in self.task_templates:
-            if not self.granularity_rules.validate_task_name_length(template.name):
-                return False
-            if not self.granularity_rules.validate_description_length(template.description):
-                return False
-        
-        return True
+        return self.granularity_rules.validate_templates(self.task_templates)
+    
+    @field_validator("granularity_rules", mode="before")
+    @classmethod
+    def default_granularity_rules(cls, v: Any) -> Any:
+        """Use the default rules when None is given explicitly."""
+        return DEFAULT_GRANULARITY_RULES if v is None else v
     
     @field_validator("task_templates")
     @classmethod
@@ -261,10 +319,16 @@ class TaskSplitRequest(BaseModel):
         if not v:
             raise ValueError("At least one task template is required")
         
-        # Check for duplicate names
-        names = [template.name.lower().strip() for template in v]
-        if len(names) != len(set(names)):
-            raise ValueError("Task names must be unique within a split request")
+        # Check for duplicate names in one pass, stopping at the first
+        seen: Set[str] = set()
+        for template in v:
+            key = template.name.strip().casefold()
+            if key in seen:
+                raise ValueError(
+                    f"Task names must be unique within a split request "
+                    f"(duplicate: {template.name!r})"
+                )
+            seen.add(key)
         
         return v
 
@@ -276,10 +340,7 @@ class SplitOperation(BaseModel):
     Captures the details of what happened during a split operation
     for debugging, rollback, and analytics purposes.
     """
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     operation_type: str = Field(
         ...,
@@ -315,7 +376,7 @@ class SplitOperation(BaseModel):
         description="Number of tasks removed"
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="When the operation was performed"
     )
     
@@ -335,10 +396,7 @@ class SplitResult(BaseModel):
     Contains the outcome of the split operation including created tasks,
     operation details, and any errors that occurred.
     """
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     success: bool = Field(
         ...,
@@ -361,14 +419,19 @@ class SplitResult(BaseModel):
         description="List of errors that occurred during the operation"
     )
     
+    # The result is frozen, so the names are collected once on first use
+    _task_names: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    
     @property
     def task_count(self) -> int:
         """Number of tasks in the result."""
         return len(self.created_tasks)
     
-    def get_task_names(self) -> List[str]:
-        """Get list of created task names."""
-        return [task.name for task in self.created_tasks]
+    def get_task_names(self) -> Tuple[str, ...]:
+        """Get the created task names."""
+        if self._task_names is None:
+            self._task_names = tuple(task.name for task in self.created_tasks)
+        return self._task_names
 
 
 class TaskDecomposition(BaseModel):
@@ -378,10 +441,7 @@ class TaskDecomposition(BaseModel):
     Represents the full decomposition of a complex task into manageable subtasks
     with dependency tracking and validation.
     """
-    model_config = ConfigDict(
-        validate_assignment=True,
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     original_task: Task = Field(
         ...,
@@ -397,28 +457,17 @@ class TaskDecomposition(BaseModel):
         description="Strategy used to decompose the task"
     )
     granularity_rules: GranularityRules = Field(
-        default_factory=GranularityRules,
+        default_factory=lambda: DEFAULT_GRANULARITY_RULES,
         description="Rules applied during decomposition"
     )
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="When the decomposition was created"
     )
     
     def validate(self) -> bool:
         """Validate the decomposition against granularity rules."""
-        # Check subtask count
-        if not self.granularity_rules.validate_task_count(len(self.subtask_templates)):
-            return False
-        
-        # Check individual subtask quality
-        for template in self.subtask_templates:
-            if not self.granularity_rules.validate_task_name_length(template.name):
-                return False
-            if not self.granularity_rules.validate_description_length(template.description):
-                return False
-        
-        return True
+        return self.granularity_rules.validate_templates(self.subtask_templates)
     
     def get_dependency_map(self) -> Dict[str, List[str]]:
         """Get mapping of task names to their dependencies."""
@@ -428,27 +477,41 @@ class TaskDecomposition(BaseModel):
         }
     
     def get_execution_order(self) -> List[str]:
-        """Get recommended execution order based on dependencies."""
-        # Simple topological sort of task names
-        dependency_map = self.get_dependency_map()
-        result = []
-        remaining = set(dependency_map.keys())
+        """Get recommended execution order based on dependencies.
         
-        while remaining:
-            # Find tasks with no unmet dependencies
-            ready = []
-            for task_name in remaining:
-                deps = dependency_map[task_name]
-                if all(dep in result or dep not in remaining for dep in deps):
-                    ready.append(task_name)
-            
-            if not ready:
-                # Circular dependency or unresolvable - add remaining in original order
-                ready = list(remaining)
-            
-            # Sort alphabetically for consistent ordering
-            ready.sort()
+        Kahn's algorithm, a level at a time: every task whose dependencies
+        are all placed is ready, and each level is sorted alphabetically
+        for consistent ordering. Dependencies outside the decomposition are
+        ignored. Tasks caught in a cycle are appended at the end, sorted.
+        """
+        # The templates' own lists are only read, so they aren't copied
+        dependency_map = {
+            template.name: template.dependencies
+            for template in self.subtask_templates
+        }
+        indegree = dict.fromkeys(dependency_map, 0)
+        dependents: Dict[str, List[str]] = {name: [] for name in dependency_map}
+        for task_name, deps in dependency_map.items():
+            for dep in deps:
+                if dep in dependents:
+                    indegree[task_name] += 1
+                    dependents[dep].append(task_name)
+        
+        result: List[str] = []
+        ready = sorted(name for name, count in indegree.items() if count == 0)
+        while ready:
             result.extend(ready)
-            remaining -= set(ready)
+            next_ready = []
+            for task_name in ready:
+                for dependent in dependents[task_name]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
+        
+        if len(result) < len(indegree):
+            # Circular dependency - add remaining in sorted order
+            placed = set(result)
+            result.extend(sorted(name for name in indegree if name not in placed))
         
-        return result
\ No newline at end of file
+        return result
@@ -6,28 +6,29 @@ compatible with MCP tool requirements and modern Pydantic v2 patterns.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
-from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import (
+    BaseModel, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
+)
+from pydantic_core import from_json, to_json
 
 from ..models.task import Priority, ComplexityLevel, TaskStatus, RelatedFileType
-
-
-class UpdateModeSchema(str, Enum):
-    """Schema for update mode validation."""
-    APPEND = "append"
-    OVERWRITE = "overwrite"
-    SELECTIVE = "selective"
-    CLEAR_ALL_TASKS = "clearAllTasks"
+from ..models.task_splitting import (
+    _FROZEN_CONFIG,
+    _STRICT_CONFIG,
+    GranularityRules,
+    SplitOperation,
+    TaskSplitRequest,
+    TaskTemplate,
+    UpdateMode,
+)
 
 
 class RelatedFileSchema(BaseModel):
     """Schema for related file validation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        extra="forbid"
-    )
+    model_config = _STRICT_CONFIG
     
     path: str = Field(
         ...,
@@ -64,214 +65,22 @@ class RelatedFileSchema(BaseModel):
         return v
 
 
-class TaskTemplateSchema(BaseModel):
-    """Schema for task template validation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        extra="forbid"
-    )
-    
-    name: str = Field(
-        ...,
-        min_length=1,
-        max_length=100,
-        description="Clear, concise task name"
-    )
-    description: str = Field(
-        ...,
-        min_length=10,
-        description="Detailed task description with implementation points"
-    )
-    implementation_guide: str = Field(
-        ...,
-        min_length=10,
-        description="Specific implementation methods and steps"
-    )
-    dependencies: List[str] = Field(
-        default_factory=list,
-        description="List of prerequisite task names or IDs"
-    )
-    notes: Optional[str] = Field(
-        default=None,
-        description="Supplementary implementation suggestions"
-    )
-    related_files: List[RelatedFileSchema] = Field(
-        default_factory=list,
-        description="Associated files with line-level precision"
-    )
-    verification_criteria: Optional[str] = Field(
-        default=None,
-        description="Specific validation standards and verification methods"
-    )
-    priority: Optional[Priority] = Field(
-        default=Priority.P2,
-        description="Task priority level"
-    )
-    complexity: Optional[ComplexityLevel] = Field(
-        default=None,
-        description="Estimated task complexity"
-    )
-    estimated_hours: Optional[int] = Field(
-        default=None,
-        ge=1,
-        le=40,
-        description="Estimated hours to complete"
-    )
-    category: Optional[str] = Field(
-        default=None,
-        description="Task category or domain"
-    )
-    
-    @field_validator("dependencies")
-    @classmethod
-    def validate_dependencies(cls, v: List[str]) -> List[str]:
-        """Remove duplicates and empty strings from dependencies."""
-        if not v:
-            return v
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_deps = []
-        for dep in v:
-            clean_dep = dep.strip()
-            if clean_dep and clean_dep not in seen:
-                seen.add(clean_dep)
-                unique_deps.append(clean_dep)
-        
-        return unique_deps
-
-
-class GranularityRulesSchema(BaseModel):
-    """Schema for granularity rules validation."""
-    model_config = ConfigDict(
-        extra="forbid"
-    )
-    
-    min_task_duration_hours: int = Field(
-        default=1,
-        ge=1,
-        description="Minimum viable task duration in hours"
-    )
-    max_task_duration_hours: int = Field(
-        default=16,
-        le=40,
-        description="Maximum task duration to maintain focus"
-    )
-    max_subtasks_per_split: int = Field(
-        default=10,
-        ge=1,
-        le=20,
-        description="Maximum number of subtasks in a single split"
-    )
-    max_task_raw_length: int = Field(
-        default=5000,
-        ge=100,
-        description="Maximum character limit for task raw input"
-    )
-    max_task_name_length: int = Field(
-        default=100,
-        ge=5,
-        description="Maximum task name length"
-    )
-    min_description_length: int = Field(
-        default=10,
-        ge=5,
-        description="Minimum task description length"
-    )
-    max_depth_levels: int = Field(
-        default=3,
-        ge=1,
-        le=5,
-        description="Maximum task hierarchy depth"
-    )
-
-
-class TaskSplitRequestSchema(BaseModel):
-    """Schema for task split request validation."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        extra="forbid"
-    )
-    
-    update_mode: UpdateModeSchema = Field(
-        default=UpdateModeSchema.CLEAR_ALL_TASKS,
-        description="Task update strategy for the split operation"
-    )
-    task_templates: List[TaskTemplateSchema] = Field(
-        ...,
-        min_length=1,
-        max_length=20,
-        description="List of task templates to create or update"
-    )
-    global_analysis_result: Optional[str] = Field(
-        default=None,
-        description="Overall project goal applicable to all tasks"
-    )
-    granularity_rules: Optional[GranularityRulesSchema] = Field(
-        default=None,
-        description="Custom granularity rules (uses defaults if not provided)"
-    )
-    
-    @field_validator("task_templates")
-    @classmethod
-    def validate_unique_task_names(cls, v: List[TaskTemplateSchema]) -> List[TaskTemplateSchema]:
-        """Ensure task names are unique within the request."""
-        names = [template.name.lower().strip() for template in v]
-        if len(names) != len(set(names)):
-            raise ValueError("Task names must be unique within a split request")
-        return v
-
+# The splitting request models are validated by the canonical models in
+# src.models.task_splitting; these names alias them so no second copy of
+# their validators and serializers is ever built
+UpdateModeSchema = UpdateMode
+TaskTemplateSchema = TaskTemplate
+GranularityRulesSchema = GranularityRules
+TaskSplitRequestSchema = TaskSplitRequest
+SplitOperationSchema = SplitOperation
 
-class SplitOperationSchema(BaseModel):
-    """Schema for split operation tracking."""
-    model_config = ConfigDict(
-        extra="forbid"
-    )
-    
-    operation_type: str = Field(
-        ...,
-        description="Type of operation performed"
-    )
-    update_mode: UpdateModeSchema = Field(
-        ...,
-        description="Update mode used for the operation"
-    )
-    tasks_before_count: int = Field(
-        ...,
-        ge=0,
-        description="Number of tasks before the operation"
-    )
-    tasks_after_count: int = Field(
-        ...,
-        ge=0,
-        description="Number of tasks after the operation"
-    )
-    tasks_added: int = Field(
-        ...,
-        ge=0,
-        description="Number of tasks added"
-    )
-    tasks_updated: int = Field(
-        ...,
-        ge=0,
-        description="Number of tasks updated"
-    )
-    tasks_removed: int = Field(
-        ...,
-        ge=0,
-        description="Number of tasks removed"
-    )
-    timestamp: datetime = Field(
-        ...,
-        description="When the operation was performed"
-    )
+# Validates a batch of plain template dicts in one call (see split_tasks)
+TaskTemplateListAdapter: TypeAdapter[List[TaskTemplate]] = TypeAdapter(List[TaskTemplate])
 
 
 class TaskSchema(BaseModel):
     """Simplified task schema for split results."""
-    model_config = ConfigDict(
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     id: str = Field(..., description="Task unique identifier")
     name: str = Field(..., description="Task name")
@@ -292,9 +101,7 @@ class TaskSchema(BaseModel):
 
 class SplitResultSchema(BaseModel):
     """Schema for split result validation."""
-    model_config = ConfigDict(
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     success: bool = Field(
         ...,
@@ -320,9 +127,7 @@ class SplitResultSchema(BaseModel):
 
 class TaskDecompositionSchema(BaseModel):
     """Schema for task decomposition validation."""
-    model_config = ConfigDict(
-        extra="forbid"
-    )
+    model_config = _FROZEN_CONFIG
     
     original_task: TaskSchema = Field(
         ...,
@@ -350,12 +155,10 @@ class TaskDecompositionSchema(BaseModel):
 # Raw JSON schemas for MCP tool integration
 class RawTaskSplitSchema(BaseModel):
     """Raw schema for MCP tool JSON input (matching Shrimp format)."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        extra="forbid"
-    )
+    model_config = _STRICT_CONFIG
     
-    updateMode: str = Field(
+    # A Literal is checked inside pydantic-core, with no Python validator
+    updateMode: Literal["append", "overwrite", "selective", "clearAllTasks"] = Field(
         default="clearAllTasks",
         description="Task update mode"
     )
@@ -370,29 +173,41 @@ class RawTaskSplitSchema(BaseModel):
         description="Global project analysis result"
     )
     
-    @field_validator("updateMode")
-    @classmethod
-    def validate_update_mode(cls, v: str) -> str:
-        """Validate update mode is one of the allowed values."""
-        allowed_modes = {"append", "overwrite", "selective", "clearAllTasks"}
-        if v not in allowed_modes:
-            raise ValueError(f"updateMode must be one of: {', '.join(allowed_modes)}")
-        return v
+    # tasksRaw as decoded during validation, so callers don't parse it again
+    _parsed: List[Any] = PrivateAttr(default_factory=list)
     
-    @field_validator("tasksRaw")
-    @classmethod
-    def validate_tasks_raw_json(cls, v: str) -> str:
-        """Validate that tasksRaw is valid JSON."""
-        import json
+    @model_validator(mode="after")
+    def parse_tasks_raw(self) -> "RawTaskSplitSchema":
+        """Parse tasksRaw once, check it is a non-empty JSON array and keep it."""
+        # Whitespace is already stripped, so anything but an array shows in
+        # the first character without running the parser
+        if not self.tasksRaw.startswith("["):
+            raise ValueError("tasksRaw must be a JSON array")
         try:
-            parsed = json.loads(v)
-            if not isinstance(parsed, list):
-                raise ValueError("tasksRaw must be a JSON array")
-            if len(parsed) == 0:
-                raise ValueError("tasksRaw must contain at least one task")
-            return v
-        except json.JSONDecodeError as e:
+            parsed = from_json(self.tasksRaw)
+        except ValueError as e:
             raise ValueError(f"tasksRaw must be valid JSON: {e}")
+        if not isinstance(parsed, list):
+            raise ValueError("tasksRaw must be a JSON array")
+        if len(parsed) == 0:
+            raise ValueError("tasksRaw must contain at least one task")
+        self._parsed = parsed
+        return self
+    
+    @property
+    def parsed(self) -> List[Any]:
+        """The task objects decoded from tasksRaw."""
+        return self._parsed
+
+
+@lru_cache(maxsize=None)
+def get_schema_json(schema: Type[BaseModel]) -> bytes:
+    """JSON schema of a model as serialized JSON, built once per model.
+    
+    model_json_schema() walks the whole model graph on every call; tool
+    registration and schema endpoints can reuse these bytes instead.
+    """
+    return to_json(schema.model_json_schema())
 
 
 # Export commonly used schemas
@@ -406,5 +221,7 @@ __all__ = [
     "TaskSchema",
     "SplitResultSchema",
     "TaskDecompositionSchema",
-    "RawTaskSplitSchema"
+    "RawTaskSplitSchema",
+    "TaskTemplateListAdapter",
+    "get_schema_json"
 ]
\ No newline at end of file
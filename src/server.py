@@ -16,14 +16,13 @@ from src.models.task import (
     Task,
     TaskStatus,
     RelatedFile,
-    RelatedFileType,
-    TaskDependency,
 )
+from src.models.task_splitting import TaskSplitRequest, UpdateMode
 from src.services.task_service import TaskService
 from src.services.task_splitting_service import TaskSplittingService
 from src.storage.duckdb_table import DuckDBTableStorage
 from src.storage.networkx_graph import NetworkXGraphStorage
-from src.schemas.splitting_schemas import RawTaskSplitSchema
+from src.schemas.splitting_schemas import RawTaskSplitSchema, TaskTemplateListAdapter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -152,7 +151,7 @@ def format_task_detailed(task: Task) -> str:
         details.extend([
             "",
             f"## Dependencies ({len(task.dependencies)})",
-            *[f"- {dep.task_id}" for dep in task.dependencies]
+            *[f"- {dep_id}" for dep_id in task.dependencies]
         ])
     
     if task.related_files:
@@ -258,11 +257,10 @@ def create_mcp() -> FastMCP:
     ) -> str:
         """Create a new task with comprehensive metadata."""
         try:
-            # Convert dependencies from strings to TaskDependency objects
+            # Resolve dependency IDs or names to task IDs
             task_dependencies = []
             if dependencies:
-                dep_ids = await resolve_task_references(dependencies)
-                task_dependencies = [TaskDependency(task_id=dep_id) for dep_id in dep_ids]
+                task_dependencies = await resolve_task_references(dependencies)
             
             # Convert related files
             task_related_files = []
@@ -582,13 +580,8 @@ def create_mcp() -> FastMCP:
             
             # Handle both string (JSON) and already parsed list inputs from FastMCP
             if isinstance(tasksRaw, str):
-                # JSON string - need to parse
-                try:
-                    tasks_data = json.loads(tasksRaw)
-                except json.JSONDecodeError as e:
-                    return f"❌ Invalid JSON in tasksRaw: {e}"
-                
-                # Validate string input using schema
+                # Validate string input using schema; it parses the JSON
+                # once and hands back the decoded task list
                 raw_request_data = {
                     "updateMode": updateMode,
                     "tasksRaw": tasksRaw, 
@@ -596,7 +589,7 @@ def create_mcp() -> FastMCP:
                 }
                 
                 try:
-                    RawTaskSplitSchema.model_validate(raw_request_data)
+                    tasks_data = RawTaskSplitSchema.model_validate(raw_request_data).parsed
                 except ValidationError as e:
                     return f"❌ Validation Error: {e}"
                     
@@ -611,46 +604,38 @@ def create_mcp() -> FastMCP:
             else:
                 return f"❌ Error: tasksRaw must be a JSON string or list, got {type(tasksRaw)}"
             
-            # Convert to internal models
-            from src.models.task_splitting import TaskSplitRequest, TaskTemplate, UpdateMode
-            from src.models.task import RelatedFile, RelatedFileType
-            
             # Convert updateMode string to enum
             try:
                 update_mode = UpdateMode(updateMode)
             except ValueError:
                 return f"❌ Invalid updateMode: {updateMode}. Must be one of: append, overwrite, selective, clearAllTasks"
             
-            # Convert task data to TaskTemplate objects
-            task_templates = []
-            for task_data in tasks_data:
-                try:
-                    # Handle related files if present
-                    related_files = []
-                    if "relatedFiles" in task_data:
-                        for file_data in task_data["relatedFiles"]:
-                            related_file = RelatedFile(
-                                path=file_data["path"],
-                                type=RelatedFileType(file_data["type"]),
-                                description=file_data["description"],
-                                line_start=file_data.get("lineStart"),
-                                line_end=file_data.get("lineEnd")
-                            )
-                            related_files.append(related_file)
-                    
-                    template = TaskTemplate(
-                        name=task_data["name"],
-                        description=task_data["description"],
-                        implementation_guide=task_data["implementation_guide"],
-                        dependencies=task_data.get("dependencies", []),
-                        notes=task_data.get("notes"),
-                        related_files=related_files,
-                        verification_criteria=task_data.get("verificationCriteria")
-                    )
-                    task_templates.append(template)
-                    
-                except (KeyError, ValueError) as e:
-                    return f"❌ Invalid task data: {e}"
+            # Map the camelCase tool fields onto TaskTemplate fields and
+            # validate every template in one adapter call
+            try:
+                task_templates = TaskTemplateListAdapter.validate_python([
+                    {
+                        "name": task_data["name"],
+                        "description": task_data["description"],
+                        "implementation_guide": task_data["implementation_guide"],
+                        "dependencies": task_data.get("dependencies", []),
+                        "notes": task_data.get("notes"),
+                        "related_files": [
+                            {
+                                "path": file_data["path"],
+                                "type": file_data["type"],
+                                "description": file_data["description"],
+                                "line_start": file_data.get("lineStart"),
+                                "line_end": file_data.get("lineEnd")
+                            }
+                            for file_data in task_data.get("relatedFiles", [])
+                        ],
+                        "verification_criteria": task_data.get("verificationCriteria")
+                    }
+                    for task_data in tasks_data
+                ])
+            except (KeyError, ValueError) as e:
+                return f"❌ Invalid task data: {e}"
             
             # Create split request
             split_request = TaskSplitRequest(
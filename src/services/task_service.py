@@ -1,12 +1,31 @@
 """Task management service layer coordinating graph and table storage."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
-from src.models.task import GraphEdge, GraphNode, Task, TaskDependency, TaskStatus
+from pydantic_core import from_json
+
+from src.models.task import GraphEdge, GraphNode, Priority, Task, TaskStatus
 from src.storage.abstractions import AbstractGraphStorage, AbstractTableStorage
 
+# Task fields copied into graph node data
+GRAPH_NODE_FIELDS = {"name", "status", "priority", "complexity", "category"}
+
+# SQL defaults for task fields an import file leaves out or NULL
+_UTC_NOW_SQL = "strftime(now() AT TIME ZONE 'UTC', '%Y-%m-%dT%H:%M:%S.%fZ')"
+IMPORT_DEFAULTS = {
+    "id": "uuid()",
+    "status": f"'{TaskStatus.PENDING.value}'",
+    "priority": f"'{Priority.P2.value}'",
+    "created_at": _UTC_NOW_SQL,
+    "updated_at": _UTC_NOW_SQL,
+    # JSON lines rows may leave out the lists other rows give
+    "dependencies": "[]",
+    "related_files": "[]",
+}
+
 
 class TaskService:
     """High-level service for task management using both graph and table storage."""
@@ -41,16 +60,7 @@ class TaskService:
         created_task = await self.table_storage.create(task)
         
         # Create corresponding graph node
-        graph_node = GraphNode(
-            id=task.id,
-            data={
-                "name": task.name,
-                "status": task.status.value if hasattr(task.status, 'value') else task.status,
-                "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                "complexity": task.complexity.value if task.complexity and hasattr(task.complexity, 'value') else (task.complexity if task.complexity else None),
-                "category": task.category
-            }
-        )
+        graph_node = self._graph_node(task)
         
         node_created = await self.graph_storage.add_node(graph_node)
         if not node_created:
@@ -75,6 +85,18 @@ class TaskService:
         """
         return await self.table_storage.get_by_id(task_id)
     
+    async def get_task_by_name(self, name: str) -> Optional[Task]:
+        """Get the earliest created task with the given name.
+        
+        Args:
+            name: Task name
+        
+        Returns:
+            Task if found, None otherwise
+        """
+        tasks = await self.table_storage.query({"name": name}, limit=1)
+        return tasks[0] if tasks else None
+    
     async def update_task(self, task: Task) -> Task:
         """Update existing task in both storages.
         
@@ -91,16 +113,7 @@ class TaskService:
         updated_task = await self.table_storage.update(task)
         
         # Update graph node data
-        graph_node = GraphNode(
-            id=task.id,
-            data={
-                "name": task.name,
-                "status": task.status.value if hasattr(task.status, 'value') else task.status,
-                "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                "complexity": task.complexity.value if task.complexity and hasattr(task.complexity, 'value') else (task.complexity if task.complexity else None),
-                "category": task.category
-            }
-        )
+        graph_node = self._graph_node(task)
         
         # Remove existing node and add updated one
         await self.graph_storage.remove_node(task.id)
@@ -112,6 +125,31 @@ class TaskService:
         
         return updated_task
     
+    async def patch_task(self, task_id: UUID, updates: Dict[str, Any]) -> Optional[Task]:
+        """Update only the given fields of a task.
+        
+        Unlike update_task(), the stored task is not read first and only
+        the changed fields are written; the graph node keeps its edges.
+        
+        Args:
+            task_id: Task to update
+            updates: Field names mapped to their new values
+        
+        Returns:
+            Updated task, or None if it doesn't exist
+        
+        Raises:
+            ValueError: If the updated task fails validation
+        """
+        task = await self.table_storage.patch(task_id, updates)
+        if task is None:
+            return None
+        
+        if updates.keys() & GRAPH_NODE_FIELDS:
+            await self.graph_storage.update_node(self._graph_node(task))
+        
+        return task
+    
     async def delete_task(self, task_id: UUID) -> bool:
         """Delete task from both storages.
         
@@ -153,6 +191,19 @@ class TaskService:
         
         return tasks
     
+    async def group_counts(
+        self, fields: Optional[List[str]] = None
+    ) -> Dict[str, Dict[Any, int]]:
+        """Count tasks per value of each field without loading the tasks.
+        
+        Args:
+            fields: Task fields to group by (defaults to status and category)
+        
+        Returns:
+            Mapping of field name to {value: count}
+        """
+        return await self.table_storage.count_facets(fields or ["status", "category"])
+    
     async def get_task_dependencies(self, task_id: UUID) -> List[Task]:
         """Get tasks that this task depends on.
         
@@ -221,11 +272,57 @@ class TaskService:
         
         if edge_added:
             # Update task's dependency list in table storage
-            task.dependencies.append(TaskDependency(task_id=depends_on_id))
+            task.dependencies.append(depends_on_id)
             await self.table_storage.update(task)
         
         return edge_added
     
+    async def add_dependencies(
+        self, dependencies: List[Tuple[UUID, UUID]]
+    ) -> List[bool]:
+        """Add several dependency relationships in one pass.
+        
+        Each task is fetched and written back at most once, no matter how
+        many of the relationships it takes part in.
+        
+        Args:
+            dependencies: (task_id, depends_on_id) pairs
+        
+        Returns:
+            One flag per pair, False where the dependency would create a cycle
+        
+        Raises:
+            ValueError: If any referenced task doesn't exist
+        """
+        # Fetch every referenced task once
+        tasks: Dict[UUID, Task] = {}
+        for task_id, depends_on_id in dependencies:
+            for ref_id, label in ((task_id, "Task"), (depends_on_id, "Dependency task")):
+                if ref_id in tasks:
+                    continue
+                task = await self.table_storage.get_by_id(ref_id)
+                if not task:
+                    raise ValueError(f"{label} {ref_id} not found")
+                tasks[ref_id] = task
+        
+        results = await self.graph_storage.add_edges([
+            GraphEdge(from_id=task_id, to_id=depends_on_id)
+            for task_id, depends_on_id in dependencies
+        ])
+        
+        changed: Dict[UUID, Task] = {}
+        for (task_id, depends_on_id), edge_added in zip(dependencies, results):
+            if edge_added:
+                task = tasks[task_id]
+                task.dependencies.append(depends_on_id)
+                changed[task_id] = task
+        
+        # Write back each modified task once
+        for task in changed.values():
+            await self.table_storage.update(task)
+        
+        return results
+    
     async def remove_dependency(self, task_id: UUID, depends_on_id: UUID) -> bool:
         """Remove dependency relationship between tasks.
         
@@ -245,8 +342,8 @@ class TaskService:
             task = await self.table_storage.get_by_id(task_id)
             if task:
                 task.dependencies = [
-                    dep for dep in task.dependencies 
-                    if dep.task_id != depends_on_id
+                    dep_id for dep_id in task.dependencies 
+                    if dep_id != depends_on_id
                 ]
                 await self.table_storage.update(task)
         
@@ -278,6 +375,30 @@ class TaskService:
         
         return tasks
     
+    async def get_execution_order_fields(
+        self, fields: List[str], max_lengths: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get selected task fields in topological execution order.
+        
+        Only the requested fields are read, in one query, so listings
+        don't rebuild a full Task per row.
+        
+        Args:
+            fields: Task fields to return for each task
+            max_lengths: Per-field limits past which strings are truncated
+            
+        Returns:
+            One {field: value} dict per task, in dependency execution order
+            
+        Raises:
+            ValueError: If circular dependencies detected
+        """
+        sorted_ids = await self.graph_storage.topological_sort()
+        sorted_ids.reverse()
+        
+        rows = await self.table_storage.get_fields(sorted_ids, fields, max_lengths)
+        return [rows[task_id] for task_id in sorted_ids if task_id in rows]
+    
     async def detect_circular_dependencies(self) -> bool:
         """Check if task dependency graph has cycles.
         
@@ -298,25 +419,29 @@ class TaskService:
         Returns:
             List of ready tasks
         """
-        # Get all tasks
-        filters = {"status": status_filter.value if hasattr(status_filter, 'value') else status_filter} if status_filter else {}
-        all_tasks = await self.list_tasks(filters)
+        # Load every task once so dependency statuses come from memory
+        # instead of one table lookup per dependency
+        all_tasks = await self.table_storage.list_all()
+        status_by_id = {task.id: task.status for task in all_tasks}
+        
+        if status_filter:
+            status_value = getattr(status_filter, 'value', status_filter)
+            candidates = [task for task in all_tasks if task.status == status_value]
+        else:
+            candidates = all_tasks
         
         ready_tasks = []
-        for task in all_tasks:
-            # Check if all dependencies are completed
-            dependencies = await self.get_task_dependencies(task.id)
+        for task in candidates:
+            dependency_ids = await self.graph_storage.get_dependencies(task.id)
             
-            if not dependencies:  # No dependencies
+            # Dependencies missing from table storage are ignored
+            all_deps_complete = all(
+                status_by_id[dep_id] == TaskStatus.COMPLETED
+                for dep_id in dependency_ids
+                if dep_id in status_by_id
+            )
+            if all_deps_complete:
                 ready_tasks.append(task)
-            else:
-                # Check if all dependencies are completed
-                all_deps_complete = all(
-                    dep.status == TaskStatus.COMPLETED 
-                    for dep in dependencies
-                )
-                if all_deps_complete:
-                    ready_tasks.append(task)
         
         return ready_tasks
     
@@ -326,20 +451,22 @@ class TaskService:
         Returns:
             Dictionary with project metrics
         """
-        # Get basic task statistics from table storage
-        table_stats = await self.table_storage.get_statistics()
+        # The table queries are independent, so they run concurrently
+        # (DuckDB storage serves each on its own read cursor)
+        table_stats, group_counts, ready_tasks = await asyncio.gather(
+            self.table_storage.get_statistics(),
+            self.group_counts(["status"]),
+            self.get_ready_tasks(),
+        )
         
         # Get graph metrics
         graph_metrics = await self.graph_storage.get_graph_metrics()
         
         # Get status breakdown
-        status_counts = {}
-        for status in TaskStatus:
-            tasks = await self.list_tasks({"status": status.value})
-            status_counts[status.value] = len(tasks)
-        
-        # Get ready tasks count
-        ready_tasks = await self.get_ready_tasks()
+        status_counts = {
+            status.value: group_counts["status"].get(status.value, 0)
+            for status in TaskStatus
+        }
         
         return {
             "total_tasks": table_stats["total_count"],
@@ -365,61 +492,224 @@ class TaskService:
         Raises:
             ValueError: If any task creation fails
         """
-        # Create all tasks in table storage first
-        created_tasks = await self.table_storage.bulk_insert(tasks)
+        created_tasks = await self._insert_task_batch(tasks)
+        await self._add_batch_dependencies(
+            {task.id for task in created_tasks}, self._dependency_edges(created_tasks)
+        )
+        return created_tasks
+    
+    async def bulk_create_task_batches(self, batches: Iterable[List[Task]]) -> int:
+        """Create tasks that arrive in batches, e.g. while streaming a file.
+        
+        Each batch is stored as soon as it arrives, so only one batch of
+        tasks is held at a time. Dependency edges are collected and added
+        once every batch is in, which lets a task depend on one from a
+        later batch.
+        
+        Args:
+            batches: Iterable of task lists to create
+            
+        Returns:
+            Number of tasks created
+            
+        Raises:
+            ValueError: If any task creation fails
+        """
+        created_ids: Set[UUID] = set()
+        edges: List[GraphEdge] = []
+        for batch in batches:
+            created_tasks = await self._insert_task_batch(batch)
+            created_ids.update(task.id for task in created_tasks)
+            edges.extend(self._dependency_edges(created_tasks))
+        
+        await self._add_batch_dependencies(created_ids, edges)
+        return len(created_ids)
+    
+    async def bulk_import(self, file_path: str) -> int:
+        """Import tasks from a CSV, Parquet or JSON lines file.
+        
+        Table storage loads the file in one statement inside DuckDB; only
+        the graph node fields and dependencies of the new tasks are read
+        back to extend the graph. Missing IDs, statuses, priorities,
+        timestamps and lists are filled in by SQL defaults. If the graph can't take
+        the new tasks (an unknown dependency or a cycle), the imported rows
+        and their graph nodes are removed again.
+        
+        Args:
+            file_path: File with one task per row; columns named after
+                Task fields, where dependencies and related files need list
+                columns (Parquet or JSON lines)
+        
+        Returns:
+            Number of tasks imported
         
-        # Create corresponding graph nodes
-        for task in created_tasks:
-            graph_node = GraphNode(
-                id=task.id,
-                data={
-                    "name": task.name,
-                    "status": task.status.value if hasattr(task.status, 'value') else task.status,
-                    "priority": task.priority.value if hasattr(task.priority, 'value') else task.priority,
-                    "complexity": task.complexity.value if task.complexity and hasattr(task.complexity, 'value') else (task.complexity if task.complexity else None),
-                    "category": task.category
-                }
+        Raises:
+            ValueError: If the file can't be imported, a row fails Task
+                validation, or a dependency is unknown or would create a cycle
+        """
+        created_ids = await self.table_storage.import_file(file_path, IMPORT_DEFAULTS)
+        added_ids: List[UUID] = []
+        try:
+            # Stored dependencies are bare IDs; import_file unwraps the
+            # legacy {"task_id": ...} shape
+            rows = await self.table_storage.get_fields(
+                created_ids, [*GRAPH_NODE_FIELDS, "dependencies"]
             )
             
-            node_created = await self.graph_storage.add_node(graph_node)
-            if not node_created:
-                raise ValueError(f"Failed to create graph node for task {task.id}")
+            graph_nodes = []
+            edges = []
+            for task_id, row in rows.items():
+                dependencies = row.pop("dependencies")
+                graph_nodes.append(GraphNode(id=task_id, data=row))
+                if dependencies:
+                    edges.extend(
+                        GraphEdge(from_id=task_id, to_id=dep_id)
+                        for dep_id in from_json(dependencies)
+                    )
+            
+            nodes_created = await self.graph_storage.add_nodes(graph_nodes)
+            added_ids = [
+                node.id for node, node_created in zip(graph_nodes, nodes_created)
+                if node_created
+            ]
+            for node, node_created in zip(graph_nodes, nodes_created):
+                if not node_created:
+                    raise ValueError(f"Failed to create graph node for task {node.id}")
+            await self._add_batch_dependencies(set(created_ids), edges)
+        except Exception:
+            # The rows are already committed, so take them back out; removing
+            # the nodes also drops any edges added from them
+            for task_id in added_ids:
+                await self.graph_storage.remove_node(task_id)
+            await self.table_storage.delete_many(created_ids)
+            raise
+        return len(created_ids)
+    
+    async def export_tasks_to_json(self, file_path: str) -> int:
+        """Export all tasks to a JSON file.
         
-        # Add dependencies for all tasks
-        for task in created_tasks:
-            if task.dependencies:
-                await self._add_task_dependencies(task.id, task.dependencies)
+        The file holds {"tasks": [...], "exported_at": ..., "total_count": ...};
+        tasks are streamed from table storage rather than loaded first.
         
-        return created_tasks
+        Args:
+            file_path: File to write
+        
+        Returns:
+            Number of tasks exported
+        """
+        with open(file_path, "w") as f:
+            f.write('{"tasks": ')
+            count = await self.table_storage.export_json(f)
+            f.write(
+                f', "exported_at": "{datetime.now().isoformat()}"'
+                f', "total_count": {count}}}\n'
+            )
+        return count
+    
+    async def rebuild_graph(self) -> None:
+        """Rebuild graph storage from the tasks and dependencies in table storage.
+        
+        Used when the graph was not persisted, or its snapshot no longer
+        matches the table.
+        """
+        tasks = await self.table_storage.list_all()
+        known_ids = {task.id for task in tasks}
+        
+        await self.graph_storage.clear()
+        await self.graph_storage.add_nodes([self._graph_node(task) for task in tasks])
+        await self.graph_storage.add_edges([
+            GraphEdge(from_id=task.id, to_id=dep_id)
+            for task in tasks
+            for dep_id in task.dependencies
+            if dep_id in known_ids
+        ])
     
     async def clear_all_data(self) -> None:
         """Clear all tasks from both storages. Use with caution!"""
         await self.table_storage.clear()
         await self.graph_storage.clear()
     
+    @staticmethod
+    def _graph_node(task: Task) -> GraphNode:
+        """Build the graph node mirroring a task."""
+        return GraphNode(
+            id=task.id,
+            data={
+                "name": task.name,
+                "status": getattr(task.status, 'value', task.status),
+                "priority": getattr(task.priority, 'value', task.priority),
+                "complexity": getattr(task.complexity, 'value', task.complexity),
+                "category": task.category
+            }
+        )
+    
+    async def _insert_task_batch(self, tasks: List[Task]) -> List[Task]:
+        """Store a batch of tasks in the table and add their graph nodes."""
+        created_tasks = await self.table_storage.bulk_insert(tasks)
+        
+        # Create corresponding graph nodes in one batch
+        graph_nodes = [self._graph_node(task) for task in created_tasks]
+        
+        nodes_created = await self.graph_storage.add_nodes(graph_nodes)
+        for task, node_created in zip(created_tasks, nodes_created):
+            if not node_created:
+                raise ValueError(f"Failed to create graph node for task {task.id}")
+        return created_tasks
+    
+    @staticmethod
+    def _dependency_edges(tasks: List[Task]) -> List[GraphEdge]:
+        """Build the dependency edges declared by a batch of tasks."""
+        return [
+            GraphEdge(from_id=task.id, to_id=dep_id)
+            for task in tasks
+            for dep_id in task.dependencies
+        ]
+    
+    async def _add_batch_dependencies(
+        self, created_ids: Set[UUID], edges: List[GraphEdge]
+    ) -> None:
+        """Add the dependency edges of freshly created tasks.
+        
+        Dependencies on the created tasks are known to exist; only the
+        tasks outside of them are looked up.
+        """
+        external_ids = {edge.to_id for edge in edges} - created_ids
+        for dep_id in external_ids:
+            if not await self.table_storage.exists(dep_id):
+                raise ValueError(f"Dependency task {dep_id} not found")
+        
+        # Add dependency edges for all tasks in one batch
+        edges_added = await self.graph_storage.add_edges(edges)
+        for edge, edge_added in zip(edges, edges_added):
+            if not edge_added:
+                raise ValueError(
+                    f"Failed to add dependency: {edge.from_id} -> {edge.to_id} "
+                    "(would create cycle)"
+                )
+    
     async def _add_task_dependencies(
         self, 
         task_id: UUID, 
-        dependencies: List[TaskDependency]
+        dependencies: List[UUID]
     ) -> None:
         """Internal method to add dependencies to graph storage.
         
         Args:
             task_id: Task ID that has dependencies
-            dependencies: List of dependencies to add
+            dependencies: IDs of the tasks it depends on
         """
-        for dep in dependencies:
+        for dep_id in dependencies:
             # Verify dependency task exists
-            dep_task = await self.table_storage.get_by_id(dep.task_id)
+            dep_task = await self.table_storage.get_by_id(dep_id)
             if not dep_task:
-                raise ValueError(f"Dependency task {dep.task_id} not found")
+                raise ValueError(f"Dependency task {dep_id} not found")
             
             # Create edge in graph storage
-            edge = GraphEdge(from_id=task_id, to_id=dep.task_id)
+            edge = GraphEdge(from_id=task_id, to_id=dep_id)
             edge_added = await self.graph_storage.add_edge(edge)
             
             if not edge_added:
                 raise ValueError(
-                    f"Failed to add dependency: {task_id} -> {dep.task_id} "
+                    f"Failed to add dependency: {task_id} -> {dep_id} "
                     "(would create cycle)"
                 )
\ No newline at end of file
@@ -6,7 +6,6 @@ task management workflows following MCP Shrimp Task Manager patterns.
 """
 
 import json
-import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Dict, Any, Optional, Tuple, Set
@@ -19,9 +18,10 @@ from ..models.task_splitting import (
     SplitResult,
     SplitOperation,
     TaskDecomposition,
-    GranularityRules
+    GranularityRules,
+    DEFAULT_GRANULARITY_RULES
 )
-from ..models.task import Task, TaskStatus, TaskDependency, Priority, ComplexityLevel
+from ..models.task import Task, TaskStatus, Priority, ComplexityLevel
 from ..services.task_service import TaskService
 
 
@@ -37,8 +37,8 @@ class DependencyResolver:
     """
     Utility class for resolving task dependencies and managing dependency graphs.
     
-    Handles conversion from string references (names/IDs) to structured
-    TaskDependency objects with proper validation and cycle detection.
+    Handles conversion from string references (names/IDs) to task IDs
+    with proper validation and cycle detection.
     """
     
     def resolve_task_dependencies(
@@ -54,7 +54,7 @@ class DependencyResolver:
             existing_tasks: List of existing tasks to resolve against
             
         Returns:
-            List of Task objects with resolved TaskDependency objects
+            List of Task objects with resolved dependency IDs
         """
         # Create lookup maps for existing tasks
         name_to_task = {task.name: task for task in existing_tasks}
@@ -73,14 +73,10 @@ class DependencyResolver:
                 
                 # Try to resolve by UUID first
                 if dep_ref in id_to_task:
-                    resolved_dependencies.append(
-                        TaskDependency(task_id=uuid.UUID(dep_ref))
-                    )
+                    resolved_dependencies.append(id_to_task[dep_ref].id)
                 # Then try by name
                 elif dep_ref in name_to_task:
-                    resolved_dependencies.append(
-                        TaskDependency(task_id=name_to_task[dep_ref].id)
-                    )
+                    resolved_dependencies.append(name_to_task[dep_ref].id)
                 # Skip unresolvable dependencies (with warning in real implementation)
             
             task.dependencies = resolved_dependencies
@@ -200,7 +196,7 @@ class TaskSplittingService:
         """
         self.task_service = task_service
         self.dependency_resolver = DependencyResolver()
-        self.default_granularity_rules = GranularityRules()
+        self.default_granularity_rules = DEFAULT_GRANULARITY_RULES
     
     async def split_tasks(self, request: TaskSplitRequest) -> SplitResult:
         """
@@ -346,7 +342,8 @@ class TaskSplittingService:
                 existing_task.complexity = template.complexity
                 existing_task.estimated_hours = template.estimated_hours
                 existing_task.category = template.category
-                existing_task.related_files = template.related_files.copy()
+                # Assignment is validated into a new list, so no copy is needed
+                existing_task.related_files = template.related_files
                 
                 # Resolve and update dependencies
                 resolved_deps = self.dependency_resolver.resolve_task_dependencies(
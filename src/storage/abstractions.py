@@ -39,6 +39,59 @@ class AbstractGraphStorage(ABC):
         """
         pass
     
+    async def add_nodes(self, nodes: List[GraphNode]) -> List[bool]:
+        """Add multiple nodes to graph.
+        
+        Backends can override this with a native bulk operation; the
+        default simply adds the nodes one at a time.
+        
+        Args:
+            nodes: The graph nodes to add
+        
+        Returns:
+            One flag per node, True if added, False if it already existed
+        """
+        return [await self.add_node(node) for node in nodes]
+    
+    async def add_edges(self, edges: List[GraphEdge]) -> List[bool]:
+        """Add multiple edges to graph.
+        
+        Backends can override this with a native bulk operation; the
+        default simply adds the edges one at a time.
+        
+        Args:
+            edges: The graph edges to add
+        
+        Returns:
+            One flag per edge, True if added, False if it was rejected
+        """
+        return [await self.add_edge(edge) for edge in edges]
+    
+    async def update_node(self, node: GraphNode) -> bool:
+        """Replace a node's data, keeping its edges.
+        
+        Backends can override this to update the node in place; the
+        default removes the node and restores it with its edges.
+        
+        Args:
+            node: The node with its new data
+        
+        Returns:
+            True if updated, False if node didn't exist
+        """
+        if await self.get_node(node.id) is None:
+            return False
+        
+        dependencies = await self.get_dependencies(node.id)
+        dependents = await self.get_dependents(node.id)
+        await self.remove_node(node.id)
+        await self.add_node(node)
+        await self.add_edges(
+            [GraphEdge(from_id=node.id, to_id=dep_id) for dep_id in dependencies]
+            + [GraphEdge(from_id=dep_id, to_id=node.id) for dep_id in dependents]
+        )
+        return True
+    
     @abstractmethod
     async def get_node(self, node_id: UUID) -> Optional[GraphNode]:
         """Retrieve node by ID.
@@ -1,17 +1,69 @@
 """DuckDB-based table storage implementation."""
 
-import json
-from typing import Any, Dict, List, Optional, Type
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Type, TypeVar
 from uuid import UUID
 
 import duckdb
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from .abstractions import AbstractTableStorage
 
+R = TypeVar("R")
+
+# Threads serving read queries, each on its own cursor
+READ_WORKERS = 4
+
+# Frequently filtered scalar fields mirrored into real columns (name -> SQL type)
+COLUMN_FIELDS: Dict[str, str] = {
+    "name": "VARCHAR",
+    "status": "VARCHAR",
+    "priority": "VARCHAR",
+    "complexity": "VARCHAR",
+    "category": "VARCHAR",
+    "estimated_hours": "INTEGER",
+}
+
+# Table functions that read an import file, by file suffix
+FILE_READERS: Dict[str, str] = {
+    ".csv": "read_csv_auto(?, header = true)",
+    ".parquet": "read_parquet(?)",
+    ".jsonl": "read_json_auto(?)",
+    ".ndjson": "read_json_auto(?)",
+}
+
+
+def _take_read_cursor(
+    local: threading.local,
+    cursors: "queue.SimpleQueue[duckdb.DuckDBPyConnection]",
+) -> None:
+    """Hand a read worker thread one of the cursors opened for the pool."""
+    local.cursor = cursors.get_nowait()
+
 
 class DuckDBTableStorage(AbstractTableStorage):
-    """DuckDB-based implementation of table storage."""
+    """DuckDB-based implementation of table storage.
+    
+    Items are stored as the JSON produced by model_dump_json() and rebuilt
+    with model_validate_json(), so nested fields such as related files are
+    encoded and decoded inside pydantic-core without intermediate dicts.
+    
+    DuckDB's Python API is blocking, so every statement is dispatched to a
+    worker thread owned by the storage and the event loop stays free while
+    queries run. Writes go through a single thread on the main connection.
+    Reads go to a small pool whose threads each hold their own cursor (a
+    separate connection to the same database, opened by the writer thread
+    when the storage is created), so independent queries
+    awaited together run in parallel. No connection or cursor is ever used
+    from two threads at once.
+    """
     
     def __init__(
         self, 
@@ -29,53 +81,211 @@ class DuckDBTableStorage(AbstractTableStorage):
         super().__init__(model_class)
         self._database_path = database_path
         self._table_name = table_name or model_class.__name__.lower()
+        self._columns = {
+            field: sql_type
+            for field, sql_type in COLUMN_FIELDS.items()
+            if field in model_class.model_fields
+        }
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="duckdb")
         self._connection = duckdb.connect(database_path)
         
+        # The read cursors are opened up front on the writer thread, so the
+        # connection itself is never touched from a read thread
+        connection = self._connection
+        self._read_cursors: List[duckdb.DuckDBPyConnection] = self._executor.submit(
+            lambda: [connection.cursor() for _ in range(READ_WORKERS)]
+        ).result()
+        available: "queue.SimpleQueue[duckdb.DuckDBPyConnection]" = queue.SimpleQueue()
+        for cursor in self._read_cursors:
+            available.put(cursor)
+        self._read_local = threading.local()
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=READ_WORKERS,
+            thread_name_prefix="duckdb-read",
+            initializer=_take_read_cursor,
+            initargs=(self._read_local, available),
+        )
+        
         # Create table schema based on Pydantic model
         self._create_table_if_not_exists()
     
     def _create_table_if_not_exists(self) -> None:
-        """Create table schema based on Pydantic model."""
-        # For simplicity, store as JSON in a single column with ID index
-        # Production implementation would map Pydantic fields to columns
+        """Create table schema based on Pydantic model.
+        
+        The full model is stored as JSON, while the hot scalar fields in
+        COLUMN_FIELDS are mirrored into real columns so filters and
+        aggregates scan typed columns (and their zone maps) instead of
+        parsing JSON per row.
+        """
+        column_defs = "".join(
+            f"{field} {sql_type}, " for field, sql_type in self._columns.items()
+        )
         create_sql = f"""
             CREATE TABLE IF NOT EXISTS {self._table_name} (
                 id UUID PRIMARY KEY,
                 data JSON NOT NULL,
+                {column_defs}
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """
         self._connection.execute(create_sql)
         
-        # Create index on commonly queried fields (extracted from JSON)
-        index_sqls = [
-            f"CREATE INDEX IF NOT EXISTS idx_{self._table_name}_status ON {self._table_name} ((data ->> 'status'))",
-            f"CREATE INDEX IF NOT EXISTS idx_{self._table_name}_priority ON {self._table_name} ((data ->> 'priority'))",
-            f"CREATE INDEX IF NOT EXISTS idx_{self._table_name}_category ON {self._table_name} ((data ->> 'category'))"
+        # Tables created before the columns existed get them added and
+        # backfilled from the stored JSON
+        existing = {
+            row[0] for row in self._connection.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = ?",
+                [self._table_name]
+            ).fetchall()
+        }
+        missing = {
+            field: sql_type
+            for field, sql_type in self._columns.items()
+            if field not in existing
+        }
+        if missing:
+            for field, sql_type in missing.items():
+                self._connection.execute(
+                    f"ALTER TABLE {self._table_name} ADD COLUMN {field} {sql_type}"
+                )
+            assignments = ", ".join(
+                f"{field} = {expr}"
+                for field, expr in zip(self._columns, self._json_column_exprs("data"))
+                if field in missing
+            )
+            self._connection.execute(f"UPDATE {self._table_name} SET {assignments}")
+        
+        # Tasks stored before dependencies were bare UUIDs hold
+        # {"task_id": ...} objects; rewrite them once so the stored JSON,
+        # and so exports, only ever use the current shape
+        if "dependencies" in self.model_class.model_fields:
+            self._connection.execute(self._unwrap_dependencies_sql)
+        
+        # Point lookups by name (e.g. the CLI's show/update) use an index
+        if "name" in self._columns:
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table_name}_name_idx "
+                f"ON {self._table_name} (name)"
+            )
+    
+    def _column_values(self, item: BaseModel) -> List[Any]:
+        """Extract the mirrored column values from an item."""
+        return [
+            getattr(value, 'value', value)
+            for value in (getattr(item, field) for field in self._columns)
+        ]
+    
+    def _json_column_exprs(self, source: str) -> List[str]:
+        """SQL expressions deriving each mirrored column from a JSON value."""
+        return [
+            f"TRY_CAST({source} ->> '{field}' AS {sql_type})"
+            for field, sql_type in self._columns.items()
         ]
+    
+    def _column_expr(self, field: str) -> str:
+        """SQL expression reading a field from its column or the JSON data."""
+        if field in self._columns:
+            return field
+        return f"data ->> '{field}'"
+    
+    # Statement texts depend only on the table and its columns, so they
+    # are built on first use and reused by every later write
+    
+    @cached_property
+    def _insert_sql(self) -> str:
+        """INSERT statement covering the JSON data and mirrored columns."""
+        columns = ", ".join(["id", "data", *self._columns])
+        placeholders = ", ".join("?" * (2 + len(self._columns)))
+        return f"INSERT INTO {self._table_name} ({columns}) VALUES ({placeholders})"
+    
+    @cached_property
+    def _unwrap_dependencies_sql(self) -> str:
+        """UPDATE rewriting {"task_id": ...} dependency entries as bare IDs.
         
-        for sql in index_sqls:
-            try:
-                self._connection.execute(sql)
-            except Exception:
-                # Index might already exist or field might not be applicable
-                pass
+        Only rows still holding wrapped entries are touched; extra
+        conditions can be appended with AND.
+        """
+        return f"""
+            UPDATE {self._table_name}
+            SET data = json_merge_patch(data, json_object('dependencies', to_json(
+                list_transform(
+                    CAST(data -> '$.dependencies[*]' AS JSON[]),
+                    dep -> coalesce(dep ->> 'task_id', dep ->> '$')
+                )
+            )))
+            WHERE len(data -> '$.dependencies[*].task_id') > 0
+        """
     
-    async def create(self, item: BaseModel) -> BaseModel:
-        """Create new item in DuckDB table."""
-        # Check if item already exists
-        if await self.exists(item.id):
-            raise ValueError(f"Item with ID {item.id} already exists")
+    @cached_property
+    def _update_sql(self) -> str:
+        """UPDATE statement rewriting the JSON data and mirrored columns.
         
-        # Insert item
-        item_json = item.model_dump_json()
-        insert_sql = f"""
-            INSERT INTO {self._table_name} (id, data)
-            VALUES (?, ?)
+        It returns the ID, so a missing item shows as an empty result
+        instead of needing its own existence check first.
         """
+        column_sets = "".join(f", {field} = ?" for field in self._columns)
+        return f"""
+            UPDATE {self._table_name} 
+            SET data = ?{column_sets}, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            RETURNING id
+        """
+    
+    async def _run(self, fn: Callable[[], R]) -> R:
+        """Run a blocking DuckDB call on the storage's worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
+    
+    async def _read(self, fn: Callable[[duckdb.DuckDBPyConnection], R]) -> R:
+        """Run a blocking query on a read thread, passing it that thread's cursor."""
+        local = self._read_local
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, lambda: fn(local.cursor))
+    
+    # The worker-side callables only capture the connection, never self, so
+    # the storage can't be finalized (and join its own thread) on the worker
+    
+    async def _execute(self, sql: str, params: Optional[List] = None) -> None:
+        """Execute a statement without fetching results."""
+        connection = self._connection
+        await self._run(lambda: connection.execute(sql, params or []))
+    
+    async def _execute_fetchone(self, sql: str, params: Optional[List] = None) -> Optional[tuple]:
+        """Execute a write statement and fetch the first row it returns."""
+        connection = self._connection
+        return await self._run(lambda: connection.execute(sql, params or []).fetchone())
+    
+    async def _fetchone(self, sql: str, params: Optional[List] = None) -> Optional[tuple]:
+        """Execute a read query and fetch its first row."""
+        return await self._read(lambda cursor: cursor.execute(sql, params or []).fetchone())
+    
+    async def _fetchall(self, sql: str, params: Optional[List] = None) -> List[tuple]:
+        """Execute a read query and fetch all rows."""
+        return await self._read(lambda cursor: cursor.execute(sql, params or []).fetchall())
+    
+    def _rows_to_items(self, rows: List[tuple]) -> List[BaseModel]:
+        """Build models from (data,) rows.
+        
+        The JSON text is handed straight to pydantic-core, which parses and
+        validates it in one pass without building intermediate dicts.
+        """
+        validate_json = self.model_class.model_validate_json
+        return [validate_json(row[0]) for row in rows]
+    
+    async def create(self, item: BaseModel) -> BaseModel:
+        """Create new item in DuckDB table.
         
-        self._connection.execute(insert_sql, [str(item.id), item_json])
+        Duplicates are caught by the primary key on insert rather than by
+        a separate existence check, so concurrent creates can't race.
+        """
+        item_json = item.model_dump_json()
+        try:
+            await self._execute(
+                self._insert_sql, [str(item.id), item_json, *self._column_values(item)]
+            )
+        except duckdb.ConstraintException as e:
+            raise ValueError(f"Item with ID {item.id} already exists") from e
         return item
     
     async def get_by_id(self, item_id: UUID) -> Optional[BaseModel]:
@@ -85,43 +295,159 @@ class DuckDBTableStorage(AbstractTableStorage):
             WHERE id = ?
         """
         
-        result = self._connection.execute(select_sql, [str(item_id)]).fetchone()
+        result = await self._fetchone(select_sql, [str(item_id)])
         if not result:
             return None
         
         # Deserialize JSON back to Pydantic model
-        item_data = json.loads(result[0])
-        return self.model_class.model_validate(item_data)
+        return self.model_class.model_validate_json(result[0])
+    
+    async def get_many(self, item_ids: List[UUID]) -> Dict[UUID, BaseModel]:
+        """Retrieve several items by ID with a single query.
+        
+        IDs that do not exist are simply absent from the result.
+        """
+        if not item_ids:
+            return {}
+        
+        select_sql = f"""
+            SELECT data FROM {self._table_name}
+            WHERE id = ANY(?::UUID[])
+        """
+        
+        rows = await self._fetchall(select_sql, [[str(item_id) for item_id in item_ids]])
+        return {item.id: item for item in self._rows_to_items(rows)}
+    
+    async def get_fields(
+        self,
+        item_ids: List[UUID],
+        fields: List[str],
+        max_lengths: Optional[Dict[str, int]] = None,
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """Retrieve selected fields of several items without rebuilding models.
+        
+        Args:
+            item_ids: IDs of the items to read
+            fields: Field names to return for each item
+            max_lengths: Per-field character limits; longer strings are cut
+                to the limit in SQL and end with "..."
+        
+        Returns:
+            Mapping of item ID to {field: value}; missing IDs are absent
+        """
+        if not item_ids:
+            return {}
+        
+        max_lengths = max_lengths or {}
+        for field in fields:
+            if not field.isidentifier():
+                raise ValueError(f"Invalid field name: {field}")
+        
+        projections = []
+        for field in fields:
+            expr = self._column_expr(field)
+            if field in max_lengths:
+                limit = int(max_lengths[field])
+                expr = (
+                    f"CASE WHEN length({expr}) > {limit} "
+                    f"THEN left({expr}, {limit}) || '...' ELSE {expr} END"
+                )
+            projections.append(expr)
+        
+        select_sql = f"""
+            SELECT id, {", ".join(projections)} FROM {self._table_name}
+            WHERE id = ANY(?::UUID[])
+        """
+        
+        rows = await self._fetchall(select_sql, [[str(item_id) for item_id in item_ids]])
+        return {row[0]: dict(zip(fields, row[1:])) for row in rows}
     
     async def list_all(self) -> List[BaseModel]:
         """Get all items."""
         select_sql = f"SELECT data FROM {self._table_name} ORDER BY created_at"
         
-        results = self._connection.execute(select_sql).fetchall()
-        items = []
-        
-        for result in results:
-            item_data = json.loads(result[0])
-            items.append(self.model_class.model_validate(item_data))
-        
-        return items
+        results = await self._fetchall(select_sql)
+        return self._rows_to_items(results)
     
     async def update(self, item: BaseModel) -> BaseModel:
         """Update existing item."""
-        # Check if item exists
-        if not await self.exists(item.id):
+        item_json = item.model_dump_json()
+        updated = await self._execute_fetchone(
+            self._update_sql, [item_json, *self._column_values(item), str(item.id)]
+        )
+        if updated is None:
             raise ValueError(f"Item with ID {item.id} doesn't exist")
+        return item
+    
+    async def patch(self, item_id: UUID, changes: Dict[str, Any]) -> Optional[BaseModel]:
+        """Update only the given fields of an item.
         
-        # Update item
-        item_json = item.model_dump_json()
-        update_sql = f"""
-            UPDATE {self._table_name} 
-            SET data = ?, updated_at = CURRENT_TIMESTAMP
+        The changes are merged into the stored JSON (a None value drops the
+        field back to its default) by one UPDATE ... RETURNING, together
+        with a fresh updated_at when the model has one. The merged document
+        is validated and the mirrored columns are then set from the
+        validated item, so they always agree with the model, defaults
+        included. Both statements run in one transaction; an invalid
+        combination of fields is rolled back instead of stored.
+        
+        Returns:
+            The updated item, or None if no item has that ID
+        """
+        connection = self._connection
+        if "updated_at" in self.model_class.model_fields:
+            changes = {"updated_at": datetime.now(timezone.utc), **changes}
+        patch_sql = f"""
+            UPDATE {self._table_name}
+            SET data = json_merge_patch(data, ?),
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
+            RETURNING data
         """
+        columns = tuple(self._columns)
+        columns_sql = (
+            f"UPDATE {self._table_name} SET "
+            + ", ".join(f"{field} = ?" for field in columns)
+            + " WHERE id = ?"
+        )
+        params = [to_json(changes).decode(), str(item_id)]
+        validate_json = self.model_class.model_validate_json
         
-        self._connection.execute(update_sql, [item_json, str(item.id)])
-        return item
+        def run_patch() -> Optional[BaseModel]:
+            connection.begin()
+            try:
+                row = connection.execute(patch_sql, params).fetchone()
+                item = validate_json(row[0]) if row else None
+                if item is not None and columns:
+                    values = [
+                        getattr(value, 'value', value)
+                        for value in (getattr(item, field) for field in columns)
+                    ]
+                    connection.execute(columns_sql, [*values, str(item_id)])
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+            return item
+        
+        return await self._run(run_patch)
+    
+    async def delete_many(self, item_ids: List[UUID]) -> int:
+        """Delete several items by ID with a single statement.
+        
+        Returns:
+            Number of items deleted; missing IDs are skipped
+        """
+        if not item_ids:
+            return 0
+        
+        delete_sql = f"""
+            DELETE FROM {self._table_name}
+            WHERE id = ANY(?::UUID[])
+            RETURNING id
+        """
+        connection = self._connection
+        params = [[str(item_id) for item_id in item_ids]]
+        return await self._run(lambda: len(connection.execute(delete_sql, params).fetchall()))
     
     async def delete(self, item_id: UUID) -> bool:
         """Delete item by ID."""
@@ -130,12 +456,17 @@ class DuckDBTableStorage(AbstractTableStorage):
             return False
         
         delete_sql = f"DELETE FROM {self._table_name} WHERE id = ?"
-        self._connection.execute(delete_sql, [str(item_id)])
+        await self._execute(delete_sql, [str(item_id)])
         return True
     
-    async def query(self, filters: Dict[str, Any]) -> List[BaseModel]:
-        """Query items with filters using JSON path expressions."""
-        if not filters:
+    async def query(
+        self, filters: Dict[str, Any], limit: Optional[int] = None
+    ) -> List[BaseModel]:
+        """Query items with filters using JSON path expressions.
+        
+        With a limit only that many matching rows are fetched and rebuilt.
+        """
+        if not filters and limit is None:
             return await self.list_all()
         
         # Build WHERE clause using JSON path expressions
@@ -143,48 +474,49 @@ class DuckDBTableStorage(AbstractTableStorage):
         params = []
         
         for field, value in filters.items():
-            # Use CAST to ensure string comparison for JSON fields
-            where_conditions.append(f"CAST(data ->> '{field}' AS VARCHAR) = ?")
-            
-            if hasattr(value, 'value'):
-                # Handle enum values
-                params.append(str(value.value))
+            if field in self._columns:
+                # Mirrored columns compare in their own type; values that
+                # can't be cast match nothing, as with string comparison
+                where_conditions.append(
+                    f"{field} = TRY_CAST(? AS {self._columns[field]})"
+                )
             else:
-                # Convert all other values to string
-                params.append(str(value) if value is not None else None)
+                # Use CAST to ensure string comparison for JSON fields
+                where_conditions.append(f"CAST(data ->> '{field}' AS VARCHAR) = ?")
+            
+            # Unwrap enum values, then compare everything as strings
+            value = getattr(value, 'value', value)
+            params.append(str(value) if value is not None else None)
         
-        where_clause = " AND ".join(where_conditions)
+        where_clause = " AND ".join(where_conditions) or "TRUE"
         select_sql = f"""
             SELECT data FROM {self._table_name}
             WHERE {where_clause}
             ORDER BY created_at
         """
+        if limit is not None:
+            select_sql += " LIMIT ?"
+            params.append(limit)
         
-        results = self._connection.execute(select_sql, params).fetchall()
-        items = []
-        
-        for result in results:
-            item_data = json.loads(result[0])
-            items.append(self.model_class.model_validate(item_data))
-        
-        return items
+        results = await self._fetchall(select_sql, params)
+        return self._rows_to_items(results)
     
     async def count(self) -> int:
         """Get total count of items."""
         count_sql = f"SELECT COUNT(*) FROM {self._table_name}"
-        result = self._connection.execute(count_sql).fetchone()
+        result = await self._fetchone(count_sql)
         return result[0] if result else 0
     
     async def exists(self, item_id: UUID) -> bool:
         """Check if item exists."""
         exists_sql = f"SELECT 1 FROM {self._table_name} WHERE id = ? LIMIT 1"
-        result = self._connection.execute(exists_sql, [str(item_id)]).fetchone()
+        result = await self._fetchone(exists_sql, [str(item_id)])
         return result is not None
     
     async def clear(self) -> None:
         """Remove all items from storage."""
         clear_sql = f"DELETE FROM {self._table_name}"
-        self._connection.execute(clear_sql)
+        await self._execute(clear_sql)
     
     # Additional DuckDB-specific methods
     
@@ -197,8 +529,14 @@ class DuckDBTableStorage(AbstractTableStorage):
         if self._table_name not in sql.lower():
             raise ValueError("SQL query must reference the correct table")
         
-        results = self._connection.execute(sql, params).fetchall()
-        columns = [desc[0] for desc in self._connection.description]
+        connection = self._connection
+        
+        def run_query() -> tuple:
+            cursor = connection.execute(sql, params)
+            return cursor.fetchall(), cursor.description
+        
+        results, description = await self._run(run_query)
+        columns = [desc[0] for desc in description]
         
         return [dict(zip(columns, row)) for row in results]
     
@@ -213,7 +551,7 @@ class DuckDBTableStorage(AbstractTableStorage):
             FROM {self._table_name}
         """
         
-        result = self._connection.execute(stats_sql).fetchone()
+        result = await self._fetchone(stats_sql)
         if not result:
             return {
                 "total_count": 0,
@@ -229,49 +567,244 @@ class DuckDBTableStorage(AbstractTableStorage):
             "latest_updated": result[3]
         }
     
+    async def count_facets(self, fields: List[str]) -> Dict[str, Dict[Any, int]]:
+        """Count items per distinct value of each field in a single table scan.
+        
+        Args:
+            fields: JSON field names to group by independently
+        
+        Returns:
+            Mapping of field name to {value: count}
+        """
+        if not fields:
+            return {}
+        
+        for field in fields:
+            if not field.isidentifier():
+                raise ValueError(f"Invalid field name: {field}")
+        
+        aliases = [f"f{i}" for i in range(len(fields))]
+        projections = ", ".join(
+            f"{self._column_expr(field)} AS {alias}" for field, alias in zip(fields, aliases)
+        )
+        groupings = ", ".join(f"GROUPING({alias})" for alias in aliases)
+        grouping_sets = ", ".join(f"({alias})" for alias in aliases)
+        facet_sql = f"""
+            SELECT {", ".join(aliases)}, {groupings}, COUNT(*)
+            FROM (SELECT {projections} FROM {self._table_name})
+            GROUP BY GROUPING SETS ({grouping_sets})
+        """
+        
+        counts: Dict[str, Dict[Any, int]] = {field: {} for field in fields}
+        width = len(fields)
+        for row in await self._fetchall(facet_sql):
+            # Exactly one facet column is grouped (GROUPING() == 0) per row
+            index = row[width:2 * width].index(0)
+            counts[fields[index]][row[index]] = row[-1]
+        
+        return counts
+    
     async def bulk_insert(self, items: List[BaseModel]) -> List[BaseModel]:
-        """Bulk insert multiple items for better performance."""
+        """Bulk insert multiple items with a single INSERT statement.
+        
+        The items travel as one JSON array parameter that DuckDB unnests
+        and splits into columns itself, which avoids binding parameters
+        row by row (the Python client has no appender API).
+        """
         if not items:
             return []
         
-        # Prepare bulk insert data
-        insert_data = []
-        for item in items:
-            if await self.exists(item.id):
-                raise ValueError(f"Item with ID {item.id} already exists")
-            insert_data.append([str(item.id), item.model_dump_json()])
+        payload = "[" + ",".join(item.model_dump_json() for item in items) + "]"
+        documents_sql = "SELECT unnest(CAST(? AS JSON[])) AS doc"
+        
+        # Check for existing IDs with one query instead of one per item
+        existing_sql = f"""
+            SELECT id FROM {self._table_name}
+            WHERE id IN (SELECT CAST(doc ->> 'id' AS UUID) FROM ({documents_sql}))
+            LIMIT 1
+        """
+        existing = await self._fetchone(existing_sql, [payload])
+        if existing:
+            raise ValueError(f"Item with ID {existing[0]} already exists")
         
         # Execute bulk insert
+        columns = ", ".join(["id", "data", *self._columns])
+        values = ", ".join([
+            "CAST(doc ->> 'id' AS UUID)",
+            "doc",
+            *self._json_column_exprs("doc"),
+        ])
         insert_sql = f"""
-            INSERT INTO {self._table_name} (id, data)
-            VALUES (?, ?)
+            INSERT INTO {self._table_name} ({columns})
+            SELECT {values} FROM ({documents_sql})
         """
-        
-        self._connection.executemany(insert_sql, insert_data)
+        await self._execute(insert_sql, [payload])
         return items
     
+    async def import_file(
+        self, file_path: str, defaults: Optional[Dict[str, str]] = None
+    ) -> List[UUID]:
+        """Bulk insert the rows of a CSV, Parquet or JSON lines file.
+        
+        DuckDB reads the file and builds each item's JSON document itself,
+        in a single INSERT ... SELECT. Columns are matched to model fields
+        by name; others are ignored. The inserted documents are returned
+        by the same statement and validated against the model before the
+        transaction commits, so a file with any invalid row is rolled back
+        as a whole and never reaches later reads. Dependencies given in the
+        legacy {"task_id": ...} shape are stored as bare IDs.
+        
+        Args:
+            file_path: File to import; its suffix selects the reader
+            defaults: SQL expressions per field, used where the column is
+                missing or NULL (e.g. to generate IDs and timestamps)
+        
+        Returns:
+            IDs of the inserted items
+        
+        Raises:
+            ValueError: If the file type is unsupported, a required field
+                is missing, a row fails validation, or an item already exists
+        """
+        reader = FILE_READERS.get(Path(file_path).suffix.lower())
+        if reader is None:
+            raise ValueError(
+                f"Unsupported file type: {file_path} "
+                f"(expected one of {', '.join(FILE_READERS)})"
+            )
+        defaults = defaults or {}
+        connection = self._connection
+        table_name = self._table_name
+        model_fields = self.model_class.model_fields
+        validate_json = self.model_class.model_validate_json
+        column_names = ", ".join(self._columns)
+        json_columns = ", ".join(self._json_column_exprs("doc"))
+        unwrap_sql = (
+            self._unwrap_dependencies_sql + " AND id = ANY(?::UUID[])"
+            if "dependencies" in model_fields else None
+        )
+        
+        def run_import() -> List[UUID]:
+            source = {
+                row[0] for row in
+                connection.execute(f"DESCRIBE SELECT * FROM {reader}", [file_path]).fetchall()
+            }
+            
+            values = {}
+            for field in model_fields:
+                if field in source and field in defaults:
+                    values[field] = f'COALESCE("{field}", {defaults[field]})'
+                elif field in source:
+                    values[field] = f'"{field}"'
+                elif field in defaults:
+                    values[field] = defaults[field]
+            
+            required = [
+                field for field, info in model_fields.items()
+                if info.is_required() and field not in defaults
+            ]
+            absent = [field for field in required if field not in source]
+            if absent:
+                raise ValueError(f"Missing required columns: {', '.join(absent)}")
+            if required:
+                null_check = " OR ".join(f'"{field}" IS NULL' for field in required)
+                nulls = connection.execute(
+                    f"SELECT count(*) FROM {reader} WHERE {null_check}", [file_path]
+                ).fetchone()[0]
+                if nulls:
+                    raise ValueError(f"{nulls} row(s) lack a required field")
+            
+            document = ", ".join(f"{field} := {expr}" for field, expr in values.items())
+            insert_sql = f"""
+                INSERT INTO {table_name} (id, data, {column_names})
+                SELECT CAST(doc ->> 'id' AS UUID), doc, {json_columns}
+                FROM (SELECT to_json(struct_pack({document})) AS doc FROM {reader})
+                RETURNING id, data
+            """
+            connection.begin()
+            try:
+                try:
+                    rows = connection.execute(insert_sql, [file_path]).fetchall()
+                except duckdb.ConstraintException as e:
+                    raise ValueError(f"Import would duplicate an existing item: {e}") from e
+                for number, (item_id, data) in enumerate(rows, start=1):
+                    try:
+                        validate_json(data)
+                    except ValueError as e:
+                        raise ValueError(f"Row {number} ({item_id}) is invalid: {e}") from e
+                if unwrap_sql is not None and rows:
+                    connection.execute(unwrap_sql, [[str(row[0]) for row in rows]])
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+            return [row[0] for row in rows]
+        
+        return await self._run(run_import)
+    
+    async def export_json(self, file: TextIO, batch_size: int = 10_000) -> int:
+        """Write all items to an open text file as one JSON array.
+        
+        The stored JSON is streamed out of DuckDB in batches and written
+        as-is, so items are never rebuilt as models or held in memory all
+        at once.
+        
+        Returns:
+            Number of items written
+        """
+        connection = self._connection
+        select_sql = f"SELECT data FROM {self._table_name} ORDER BY created_at"
+        
+        def write_rows() -> int:
+            cursor = connection.execute(select_sql)
+            count = 0
+            file.write("[")
+            while rows := cursor.fetchmany(batch_size):
+                if count:
+                    file.write(",")
+                file.write(",".join(row[0] for row in rows))
+                count += len(rows)
+            file.write("]")
+            return count
+        
+        return await self._run(write_rows)
+    
     async def create_backup(self, backup_path: str) -> None:
         """Create backup of the table."""
         backup_sql = f"""
             COPY {self._table_name} TO '{backup_path}' (FORMAT PARQUET)
         """
-        self._connection.execute(backup_sql)
+        await self._execute(backup_sql)
     
     async def optimize_table(self) -> None:
         """Optimize table performance."""
         # Analyze table for better query planning
         analyze_sql = f"ANALYZE {self._table_name}"
-        self._connection.execute(analyze_sql)
+        await self._execute(analyze_sql)
         
         # Vacuum if needed (not applicable to DuckDB, but could checkpoint)
         checkpoint_sql = "CHECKPOINT"
-        self._connection.execute(checkpoint_sql)
+        await self._execute(checkpoint_sql)
     
     def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
+        """Close database connections and stop the worker threads."""
+        self._shutdown(wait=True)
     
     def __del__(self) -> None:
-        """Cleanup on object destruction."""
-        self.close()
\ No newline at end of file
+        """Cleanup on object destruction.
+        
+        The garbage collector may finalize the storage on one of its own
+        worker threads, which can't join itself, so workers aren't waited
+        for here.
+        """
+        self._shutdown(wait=False)
+    
+    def _shutdown(self, wait: bool) -> None:
+        """Stop the worker threads, then close the cursors and connection."""
+        self._read_executor.shutdown(wait=wait)
+        for cursor in self._read_cursors:
+            cursor.close()
+        self._read_cursors.clear()
+        self._executor.shutdown(wait=wait)
+        if self._connection:
+            self._connection.close()
@@ -1,6 +1,9 @@
 """NetworkX-based graph storage implementation."""
 
-from typing import List, Optional
+import pickle
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 import networkx as nx
@@ -10,12 +13,89 @@ from .abstractions import AbstractGraphStorage
 
 
 class NetworkXGraphStorage(AbstractGraphStorage):
-    """NetworkX-based implementation of graph storage."""
+    """NetworkX-based implementation of graph storage.
     
-    def __init__(self) -> None:
-        """Initialize with directed graph."""
+    The NetworkX graph is keyed by small integer indices rather than the
+    node UUIDs, whose hash is computed in Python on every dict lookup.
+    UUIDs are mapped to indices on the way in and back on the way out, so
+    callers only ever see UUIDs. Indices of removed nodes are reused.
+    """
+    
+    def __init__(self, persist_path: Optional[str] = None) -> None:
+        """Initialize with directed graph.
+        
+        Args:
+            persist_path: Optional pickle file the graph is loaded from, if
+                it exists, and written to by save()
+        """
         self._graph = nx.DiGraph()
         self._nodes: dict[UUID, GraphNode] = {}
+        # Node UUID <-> graph index, and indices freed by removed nodes
+        self._n2i: Dict[UUID, int] = {}
+        self._i2n: List[Optional[UUID]] = []
+        self._free: List[int] = []
+        self._persist_path = Path(persist_path) if persist_path else None
+        # Caller's description of the data the loaded snapshot was built from
+        self._snapshot_stamp: Any = None
+        # Derived structures, reset whenever nodes or edges change
+        self._topo_cache: Optional[List[UUID]] = None
+        self._cycle_cache: Optional[bool] = None
+        self._bfs_parents: Dict[int, Dict[int, int]] = {}
+        self._metrics_cache: Optional[dict] = None
+        
+        if self._persist_path is not None and self._persist_path.exists():
+            try:
+                with open(self._persist_path, "rb") as f:
+                    state = pickle.load(f)
+                self._graph = state["graph"]
+                self._nodes = state["nodes"]
+                self._i2n = state["i2n"]
+                self._free = state["free"]
+                self._n2i = {
+                    node_id: index
+                    for index, node_id in enumerate(self._i2n)
+                    if node_id is not None
+                }
+                self._snapshot_stamp = state["stamp"]
+            except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+                # Unreadable snapshot, start empty and let the caller rebuild
+                self._graph = nx.DiGraph()
+                self._nodes = {}
+                self._n2i, self._i2n, self._free = {}, [], []
+                self._snapshot_stamp = None
+                self._invalidate_caches()
+    
+    @property
+    def snapshot_stamp(self) -> Any:
+        """Stamp saved with the loaded snapshot, or None without one.
+        
+        Callers compare it with the current stamp of their source data and
+        rebuild the graph when they differ.
+        """
+        return self._snapshot_stamp
+    
+    def save(self, stamp: Any = None) -> None:
+        """Write the graph to the persist path.
+        
+        Derived results such as the topological order are not saved; a
+        loaded graph computes them afresh on first use.
+        
+        Args:
+            stamp: Picklable description of the source data the graph
+                mirrors, returned by snapshot_stamp after loading
+        """
+        if self._persist_path is None:
+            return
+        
+        state = {
+            "stamp": stamp,
+            "graph": self._graph,
+            "nodes": self._nodes,
+            "i2n": self._i2n,
+            "free": self._free,
+        }
+        with open(self._persist_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
     
     async def add_node(self, node: GraphNode) -> bool:
         """Add node to NetworkX graph."""
@@ -23,9 +103,27 @@ class NetworkXGraphStorage(AbstractGraphStorage):
             return False
         
         self._nodes[node.id] = node
-        self._graph.add_node(node.id)
+        self._graph.add_node(self._assign_index(node.id))
+        self._invalidate_caches()
         return True
     
+    async def add_nodes(self, nodes: List[GraphNode]) -> List[bool]:
+        """Add multiple nodes with a single NetworkX call."""
+        added = []
+        new_ids = []
+        for node in nodes:
+            if node.id in self._nodes:
+                added.append(False)
+                continue
+            self._nodes[node.id] = node
+            new_ids.append(self._assign_index(node.id))
+            added.append(True)
+        
+        if new_ids:
+            self._graph.add_nodes_from(new_ids)
+            self._invalidate_caches()
+        return added
+    
     async def add_edge(self, edge: GraphEdge) -> bool:
         """Add edge to NetworkX graph."""
         # Check if nodes exist
@@ -37,10 +135,49 @@ class NetworkXGraphStorage(AbstractGraphStorage):
             return False
         
         self._graph.add_edge(
-            edge.from_id,
-            edge.to_id,
+            self._n2i[edge.from_id],
+            self._n2i[edge.to_id],
             relationship=edge.relationship
         )
+        self._invalidate_caches()
+        return True
+    
+    async def add_edges(self, edges: List[GraphEdge]) -> List[bool]:
+        """Add multiple edges, checking acyclicity once for the batch.
+        
+        When every edge joins known nodes and is new, the batch is added
+        with a single NetworkX call and validated with one DAG check. If
+        that check fails the batch is undone and the edges are added one
+        at a time, so each gets its own result.
+        """
+        if not edges:
+            return []
+        
+        n2i = self._n2i
+        if all(
+            edge.from_id in n2i
+            and edge.to_id in n2i
+            and not self._graph.has_edge(n2i[edge.from_id], n2i[edge.to_id])
+            for edge in edges
+        ):
+            pairs = [(n2i[edge.from_id], n2i[edge.to_id]) for edge in edges]
+            self._graph.add_edges_from(
+                (from_index, to_index, {"relationship": edge.relationship})
+                for (from_index, to_index), edge in zip(pairs, edges)
+            )
+            if nx.is_directed_acyclic_graph(self._graph):
+                self._invalidate_caches()
+                return [True] * len(edges)
+            self._graph.remove_edges_from(pairs)
+        
+        return [await self.add_edge(edge) for edge in edges]
+    
+    async def update_node(self, node: GraphNode) -> bool:
+        """Replace a node's data in place; the graph shape is unchanged."""
+        if node.id not in self._nodes:
+            return False
+        
+        self._nodes[node.id] = node
         return True
     
     async def get_node(self, node_id: UUID) -> Optional[GraphNode]:
@@ -53,50 +190,106 @@ class NetworkXGraphStorage(AbstractGraphStorage):
             return False
         
         # Remove from NetworkX graph (automatically removes edges)
-        self._graph.remove_node(node_id)
+        index = self._n2i.pop(node_id)
+        self._graph.remove_node(index)
+        self._i2n[index] = None
+        self._free.append(index)
         
         # Remove from our node storage
         del self._nodes[node_id]
+        self._invalidate_caches()
         return True
     
     async def remove_edge(self, edge: GraphEdge) -> bool:
         """Remove specific edge."""
-        if not self._graph.has_edge(edge.from_id, edge.to_id):
+        from_index = self._n2i.get(edge.from_id)
+        to_index = self._n2i.get(edge.to_id)
+        if not self._graph.has_edge(from_index, to_index):
             return False
         
         # Check if the relationship matches
-        edge_data = self._graph.get_edge_data(edge.from_id, edge.to_id)
+        edge_data = self._graph.get_edge_data(from_index, to_index)
         if edge_data and edge_data.get("relationship") == edge.relationship:
-            self._graph.remove_edge(edge.from_id, edge.to_id)
+            self._graph.remove_edge(from_index, to_index)
+            self._invalidate_caches()
             return True
         
         return False
     
     async def get_dependencies(self, node_id: UUID) -> List[UUID]:
         """Get nodes this node depends on (successors in NetworkX)."""
-        if node_id not in self._graph:
+        index = self._n2i.get(node_id)
+        if index is None:
             return []
-        return list(self._graph.successors(node_id))
+        return self._to_ids(self._graph.successors(index))
     
     async def get_dependents(self, node_id: UUID) -> List[UUID]:
         """Get nodes that depend on this node (predecessors in NetworkX)."""
-        if node_id not in self._graph:
+        index = self._n2i.get(node_id)
+        if index is None:
             return []
-        return list(self._graph.predecessors(node_id))
+        return self._to_ids(self._graph.predecessors(index))
     
     async def has_cycle(self) -> bool:
-        """Check if graph contains cycles using NetworkX."""
-        return not nx.is_directed_acyclic_graph(self._graph)
+        """Check if graph contains cycles using NetworkX.
+        
+        The graph is only traversed when no answer is cached; an acyclic
+        answer stays cached across mutations, so repeat checks are O(1).
+        """
+        if self._cycle_cache is None:
+            self._cycle_cache = not nx.is_directed_acyclic_graph(self._graph)
+        return self._cycle_cache
     
     async def topological_sort(self) -> List[UUID]:
-        """Return topologically sorted node IDs."""
-        if await self.has_cycle():
+        """Return topologically sorted node IDs.
+        
+        The order is cached until the graph is next modified; callers get
+        a copy they are free to mutate.
+        """
+        if self._topo_cache is None:
+            if await self.has_cycle():
+                raise ValueError("Graph contains cycles")
+            
+            try:
+                self._topo_cache = self._to_ids(nx.topological_sort(self._graph))
+            except nx.NetworkXError as e:
+                raise ValueError(f"Topological sort failed: {e}")
+        
+        return list(self._topo_cache)
+    
+    async def topological_sort_with_dependencies(
+        self,
+    ) -> Tuple[List[UUID], Dict[UUID, List[UUID]]]:
+        """Return topological order together with each node's dependencies.
+        
+        Runs Kahn's algorithm over in-degree counts and records every
+        node's dependencies while visiting it, so callers walking the
+        order don't need a get_dependencies() call per node.
+        """
+        in_degree = dict(self._graph.in_degree())
+        queue = deque(node for node, degree in in_degree.items() if degree == 0)
+        order: List[int] = []
+        successors: List[List[int]] = []
+        
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            node_dependencies = list(self._graph.successors(node))
+            successors.append(node_dependencies)
+            for dependency in node_dependencies:
+                in_degree[dependency] -= 1
+                if in_degree[dependency] == 0:
+                    queue.append(dependency)
+        
+        if len(order) != len(in_degree):
             raise ValueError("Graph contains cycles")
         
-        try:
-            return list(nx.topological_sort(self._graph))
-        except nx.NetworkXError as e:
-            raise ValueError(f"Topological sort failed: {e}")
+        order_ids = self._to_ids(order)
+        dependencies = {
+            node_id: self._to_ids(node_dependencies)
+            for node_id, node_dependencies in zip(order_ids, successors)
+        }
+        return order_ids, dependencies
     
     async def get_all_nodes(self) -> List[GraphNode]:
         """Get all nodes."""
@@ -104,11 +297,12 @@ class NetworkXGraphStorage(AbstractGraphStorage):
     
     async def get_all_edges(self) -> List[GraphEdge]:
         """Get all edges."""
+        i2n = self._i2n
         edges = []
-        for from_id, to_id, data in self._graph.edges(data=True):
+        for from_index, to_index, data in self._graph.edges(data=True):
             edge = GraphEdge(
-                from_id=from_id,
-                to_id=to_id,
+                from_id=i2n[from_index],
+                to_id=i2n[to_index],
                 relationship=data.get("relationship", "depends_on")
             )
             edges.append(edge)
@@ -118,53 +312,126 @@ class NetworkXGraphStorage(AbstractGraphStorage):
         """Clear all nodes and edges."""
         self._graph.clear()
         self._nodes.clear()
+        self._n2i.clear()
+        self._i2n.clear()
+        self._free.clear()
+        self._invalidate_caches()
     
-    async def _would_create_cycle(self, new_edge: GraphEdge) -> bool:
-        """Check if adding edge would create cycle."""
-        # Temporarily add edge
-        self._graph.add_edge(
-            new_edge.from_id,
-            new_edge.to_id,
-            relationship=new_edge.relationship
-        )
-        
-        # Check for cycles
-        has_cycle = not nx.is_directed_acyclic_graph(self._graph)
+    def _assign_index(self, node_id: UUID) -> int:
+        """Give a new node a graph index, reusing a freed one if possible."""
+        if self._free:
+            index = self._free.pop()
+            self._i2n[index] = node_id
+        else:
+            index = len(self._i2n)
+            self._i2n.append(node_id)
+        self._n2i[node_id] = index
+        return index
+    
+    def _to_ids(self, indices: Iterable[int]) -> List[UUID]:
+        """Map graph indices back to node UUIDs."""
+        i2n = self._i2n
+        return [i2n[index] for index in indices]
+    
+    def _invalidate_caches(self) -> None:
+        """Drop results derived from the current graph shape.
         
-        # Remove temporary edge
-        self._graph.remove_edge(new_edge.from_id, new_edge.to_id)
+        No mutation can make an acyclic graph cyclic, since add_edge()
+        refuses edges that would close a cycle, so a cached "no cycle"
+        answer is kept. Only a cyclic graph, which can come from a loaded
+        snapshot, is checked again.
+        """
+        self._topo_cache = None
+        if self._cycle_cache:
+            self._cycle_cache = None
+        self._bfs_parents.clear()
+        self._metrics_cache = None
+    
+    async def _would_create_cycle(self, new_edge: GraphEdge) -> bool:
+        """Check if adding edge would create cycle.
         
-        return has_cycle
+        The graph is kept acyclic, so the new edge closes a cycle exactly
+        when its source is already reachable from its target. Only that
+        reachable subgraph is searched instead of re-validating the whole
+        graph.
+        """
+        if new_edge.from_id == new_edge.to_id:
+            return True
+        return nx.has_path(
+            self._graph, self._n2i[new_edge.to_id], self._n2i[new_edge.from_id]
+        )
     
     # Additional NetworkX-specific methods
     
+    async def node_count(self) -> int:
+        """Get number of nodes without materializing them."""
+        return self._graph.number_of_nodes()
+    
+    async def edge_count(self) -> int:
+        """Get number of edges without materializing them."""
+        return self._graph.number_of_edges()
+    
     async def get_shortest_path(
         self, from_id: UUID, to_id: UUID
     ) -> Optional[List[UUID]]:
-        """Get shortest path between two nodes."""
-        try:
-            return nx.shortest_path(self._graph, from_id, to_id)
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        """Get shortest path between two nodes.
+        
+        The BFS parent tree of each source is cached until the graph
+        changes, so repeated lookups from the same node only walk parent
+        links back from the target.
+        """
+        from_index = self._n2i.get(from_id)
+        to_index = self._n2i.get(to_id)
+        if from_index is None or to_index is None:
             return None
+        
+        parents = self._bfs_parents.get(from_index)
+        if parents is None:
+            parents = dict(nx.bfs_predecessors(self._graph, from_index))
+            self._bfs_parents[from_index] = parents
+        
+        if to_index != from_index and to_index not in parents:
+            return None
+        
+        path = [to_index]
+        while path[-1] != from_index:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return self._to_ids(path)
     
     async def get_descendants(self, node_id: UUID) -> List[UUID]:
         """Get all descendants of a node."""
-        if node_id not in self._graph:
+        index = self._n2i.get(node_id)
+        if index is None:
             return []
-        return list(nx.descendants(self._graph, node_id))
+        return self._to_ids(nx.descendants(self._graph, index))
     
     async def get_ancestors(self, node_id: UUID) -> List[UUID]:
         """Get all ancestors of a node."""
-        if node_id not in self._graph:
+        index = self._n2i.get(node_id)
+        if index is None:
             return []
-        return list(nx.ancestors(self._graph, node_id))
+        return self._to_ids(nx.ancestors(self._graph, index))
     
     async def is_reachable(self, from_id: UUID, to_id: UUID) -> bool:
         """Check if to_id is reachable from from_id."""
-        return nx.has_path(self._graph, from_id, to_id)
+        for node_id in (from_id, to_id):
+            if node_id not in self._n2i:
+                raise nx.NodeNotFound(f"Node {node_id} is not in G")
+        return nx.has_path(self._graph, self._n2i[from_id], self._n2i[to_id])
     
     async def get_graph_metrics(self) -> dict:
-        """Get graph analysis metrics."""
+        """Get graph analysis metrics.
+        
+        Metrics are computed once per graph shape and served from cache
+        until the next mutation.
+        """
+        if self._metrics_cache is None:
+            self._metrics_cache = self._compute_graph_metrics()
+        return dict(self._metrics_cache)
+    
+    def _compute_graph_metrics(self) -> dict:
+        """Compute graph analysis metrics from scratch."""
         if len(self._graph) == 0:
             return {
                 "node_count": 0,
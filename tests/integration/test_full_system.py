@@ -1,12 +1,13 @@
 """Comprehensive integration tests for the full task management system."""
 
+import json
 import pytest
 import tempfile
 import os
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from src.models.task import ComplexityLevel, Priority, Task, TaskStatus, RelatedFile, RelatedFileType
+from src.models.task import ComplexityLevel, Priority, Task, TaskDependency, TaskStatus, RelatedFile, RelatedFileType
 from src.services.task_service import TaskService
 from src.storage.duckdb_table import DuckDBTableStorage
 from src.storage.networkx_graph import NetworkXGraphStorage
@@ -195,6 +196,161 @@ class TestFullSystemIntegration:
         assert stats["graph_nodes"] == 5
         assert stats["graph_edges"] == 0  # No dependencies added yet
     
+    async def test_bulk_create_with_dependencies(self, integrated_service: TaskService):
+        """Test bulk creation wires dependencies within and outside the batch."""
+        base = Task(name="Base", description="Foundation task", implementation_guide="Base implementation")
+        await integrated_service.create_task(base)
+        
+        first = Task(name="First", description="Depends on base", implementation_guide="First implementation",
+                     dependencies=[TaskDependency(task_id=base.id)])
+        # Listed before the task it depends on
+        second = Task(name="Second", description="Depends on third", implementation_guide="Second implementation")
+        third = Task(name="Third", description="Depends on first", implementation_guide="Third implementation",
+                     dependencies=[TaskDependency(task_id=first.id)])
+        second.dependencies = [TaskDependency(task_id=third.id)]
+        await integrated_service.bulk_create_tasks([second, first, third])
+        
+        order = await integrated_service.get_execution_order()
+        assert [task.id for task in order] == [base.id, first.id, third.id, second.id]
+        
+        orphan = Task(name="Orphan", description="Depends on a missing task", implementation_guide="Orphan implementation",
+                      dependencies=[TaskDependency(task_id=UUID('00000000-0000-0000-0000-000000000000'))])
+        with pytest.raises(ValueError, match="not found"):
+            await integrated_service.bulk_create_tasks([orphan])
+
+    async def test_bulk_create_task_batches(self, integrated_service: TaskService):
+        """Test batched creation wires dependencies on tasks from later batches."""
+        first = Task(name="First", description="Foundation task", implementation_guide="First implementation")
+        second = Task(name="Second", description="Depends on first", implementation_guide="Second implementation",
+                      dependencies=[TaskDependency(task_id=first.id)])
+        # The first batch depends on a task that only arrives in the second
+        earlier = Task(name="Earlier", description="Depends on second", implementation_guide="Earlier implementation",
+                       dependencies=[TaskDependency(task_id=second.id)])
+
+        count = await integrated_service.bulk_create_task_batches(
+            iter([[earlier], [first, second]])
+        )
+        assert count == 3
+
+        order = await integrated_service.get_execution_order()
+        assert [task.id for task in order] == [first.id, second.id, earlier.id]
+
+    async def test_bulk_import(self, integrated_service: TaskService, tmp_path):
+        """Test bulk import of tabular files, with SQL defaults and dependencies."""
+        csv_path = tmp_path / "tasks.csv"
+        csv_path.write_text(
+            "name,description,implementation_guide,priority\n"
+            "CSV task,Imported from CSV,CSV implementation,P1\n"
+        )
+        assert await integrated_service.bulk_import(str(csv_path)) == 1
+        
+        [imported] = await integrated_service.list_tasks()
+        assert imported.name == "CSV task"
+        assert imported.priority == Priority.P1
+        assert imported.status == TaskStatus.PENDING
+        assert (await integrated_service.get_task(imported.id)).id == imported.id
+        
+        base_id, child_id = uuid4(), uuid4()
+        jsonl_path = tmp_path / "tasks.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps(row) for row in [
+            {"id": str(base_id), "name": "Base", "description": "Foundation task",
+             "implementation_guide": "Base implementation", "dependencies": []},
+            {"id": str(child_id), "name": "Child", "description": "Depends on base",
+             "implementation_guide": "Child implementation", "dependencies": [str(base_id)]},
+        ]))
+        assert await integrated_service.bulk_import(str(jsonl_path)) == 2
+        
+        assert await integrated_service.graph_storage.get_dependencies(child_id) == [base_id]
+        with pytest.raises(ValueError, match="duplicate"):
+            await integrated_service.bulk_import(str(jsonl_path))
+        
+        missing_path = tmp_path / "missing.csv"
+        missing_path.write_text("name\nNo description\n")
+        with pytest.raises(ValueError, match="Missing required columns"):
+            await integrated_service.bulk_import(str(missing_path))
+        
+        # A file with any invalid row is rolled back as a whole
+        invalid_path = tmp_path / "invalid.csv"
+        invalid_path.write_text(
+            "name,description,implementation_guide,status,complexity,estimated_hours\n"
+            "Valid row,Valid description,Valid implementation,PENDING,,\n"
+            "Bad status,Valid description,Valid implementation,DONE,,\n"
+            "Too long,Valid description,Valid implementation,PENDING,SIMPLE,99\n"
+        )
+        with pytest.raises(ValueError, match="invalid"):
+            await integrated_service.bulk_import(str(invalid_path))
+        assert len(await integrated_service.list_tasks()) == 3
+        await integrated_service.get_project_statistics()
+        
+        # An unknown dependency takes the imported rows and nodes back out
+        orphan_id = uuid4()
+        unknown_path = tmp_path / "unknown.jsonl"
+        unknown_path.write_text("\n".join(json.dumps(row) for row in [
+            {"id": str(orphan_id), "name": "Orphan", "description": "Depends on nothing real",
+             "implementation_guide": "Orphan implementation", "dependencies": [str(uuid4())]},
+            {"name": "Sibling", "description": "Imported alongside",
+             "implementation_guide": "Sibling implementation", "dependencies": []},
+        ]))
+        with pytest.raises(ValueError, match="not found"):
+            await integrated_service.bulk_import(str(unknown_path))
+        assert len(await integrated_service.list_tasks()) == 3
+        assert await integrated_service.graph_storage.node_count() == 3
+        
+        # Legacy {"task_id": ...} dependencies are stored and linked as bare IDs
+        legacy_id = uuid4()
+        legacy_path = tmp_path / "legacy.jsonl"
+        legacy_path.write_text(json.dumps({
+            "id": str(legacy_id), "name": "Legacy", "description": "Wrapped dependency",
+            "implementation_guide": "Legacy implementation",
+            "dependencies": [{"task_id": str(base_id)}]
+        }))
+        assert await integrated_service.bulk_import(str(legacy_path)) == 1
+        assert await integrated_service.graph_storage.get_dependencies(legacy_id) == [base_id]
+        [row] = await integrated_service.table_storage.query_sql(
+            "SELECT data ->> 'dependencies' AS deps FROM task WHERE id = ?", [str(legacy_id)]
+        )
+        assert json.loads(row["deps"]) == [str(base_id)]
+        
+        # Rows without the list keys other rows have get empty lists
+        mixed_id = uuid4()
+        mixed_path = tmp_path / "mixed.jsonl"
+        mixed_path.write_text("\n".join(json.dumps(row) for row in [
+            {"id": str(mixed_id), "name": "With lists", "description": "Has both lists",
+             "implementation_guide": "Mixed implementation", "dependencies": [str(base_id)],
+             "related_files": [{"path": "a.py", "type": "CREATE", "description": "New module"}]},
+            {"name": "Without lists", "description": "Has neither list",
+             "implementation_guide": "Mixed implementation"},
+        ]))
+        assert await integrated_service.bulk_import(str(mixed_path)) == 2
+        bare = await integrated_service.get_task_by_name("Without lists")
+        assert bare.dependencies == [] and bare.related_files == []
+        with_lists = await integrated_service.get_task(mixed_id)
+        assert with_lists.dependencies == [base_id]
+        assert with_lists.related_files[0].path == "a.py"
+
+    async def test_interactive_flush_keeps_tasks_on_failure(
+        self, integrated_service: TaskService, monkeypatch
+    ):
+        """Test the interactive buffer survives a failed bulk insert."""
+        from src import cli
+        
+        monkeypatch.setattr(cli, "service", integrated_service)
+        stored = await integrated_service.create_task(
+            Task(name="Stored", description="Already stored", implementation_guide="Stored guide")
+        )
+        fresh = Task(name="Fresh", description="Not stored yet", implementation_guide="Fresh guide")
+        
+        session = cli._InteractiveSession()
+        session.pending = [stored, fresh]
+        with pytest.raises(ValueError, match="already exists"):
+            await session.flush()
+        assert session.pending == [stored, fresh]
+        
+        session.pending.remove(stored)
+        assert await session.flush() == 1
+        assert session.pending == []
+        assert (await integrated_service.get_task(fresh.id)).name == "Fresh"
+
     async def test_complex_dependency_scenarios(self, integrated_service: TaskService):
         """Test complex dependency scenarios and cycle detection."""
         # Create a diamond dependency pattern:
@@ -242,6 +398,91 @@ class TestFullSystemIntegration:
         has_cycles = await integrated_service.detect_circular_dependencies()
         assert has_cycles is False
     
+    async def test_bulk_dependencies(self, integrated_service: TaskService):
+        """Test adding several dependencies in one call."""
+        task_a = Task(name="Task A", description="First task in chain", implementation_guide="A implementation")
+        task_b = Task(name="Task B", description="Second task in chain", implementation_guide="B implementation")
+        task_c = Task(name="Task C", description="Third task in chain", implementation_guide="C implementation")
+        await integrated_service.bulk_create_tasks([task_a, task_b, task_c])
+        
+        results = await integrated_service.add_dependencies([
+            (task_b.id, task_a.id),
+            (task_c.id, task_b.id),
+            (task_a.id, task_c.id),  # Would close a cycle
+        ])
+        assert results == [True, True, False]
+        
+        stored_c = await integrated_service.get_task(task_c.id)
+        assert stored_c.dependencies == [task_b.id]
+        
+        stored_a = await integrated_service.get_task(task_a.id)
+        assert stored_a.dependencies == []
+        
+        with pytest.raises(ValueError, match="not found"):
+            await integrated_service.add_dependencies([
+                (task_a.id, UUID('00000000-0000-0000-0000-000000000000'))
+            ])
+    
+    async def test_ready_tasks_with_status_filter(self, integrated_service: TaskService):
+        """Test ready-task detection combined with a status filter."""
+        base = Task(name="Base", description="Foundation task", implementation_guide="Base implementation",
+                    status=TaskStatus.COMPLETED)
+        next_up = Task(name="Next", description="Depends on base", implementation_guide="Next implementation")
+        blocked = Task(name="Blocked", description="Depends on next", implementation_guide="Blocked implementation")
+        await integrated_service.bulk_create_tasks([base, next_up, blocked])
+        await integrated_service.add_dependencies([(next_up.id, base.id), (blocked.id, next_up.id)])
+        
+        ready_pending = await integrated_service.get_ready_tasks(TaskStatus.PENDING)
+        assert [task.id for task in ready_pending] == [next_up.id]
+        
+        ready_completed = await integrated_service.get_ready_tasks(TaskStatus.COMPLETED)
+        assert [task.id for task in ready_completed] == [base.id]
+    
+    async def test_get_task_by_name(self, integrated_service: TaskService):
+        """Test looking a task up by its name."""
+        task = Task(name="Named Task", description="Task found by name", implementation_guide="Named implementation")
+        await integrated_service.create_task(task)
+        
+        found = await integrated_service.get_task_by_name("Named Task")
+        assert found is not None and found.id == task.id
+        assert await integrated_service.get_task_by_name("Unknown Task") is None
+    
+    async def test_patch_task(self, integrated_service: TaskService):
+        """Test partial updates keep the task's graph edges."""
+        task_a = Task(name="Task A", description="First task in chain", implementation_guide="A implementation")
+        task_b = Task(name="Task B", description="Second task in chain", implementation_guide="B implementation")
+        task_c = Task(name="Task C", description="Third task in chain", implementation_guide="C implementation")
+        await integrated_service.bulk_create_tasks([task_a, task_b, task_c])
+        await integrated_service.add_dependencies([(task_b.id, task_a.id), (task_c.id, task_b.id)])
+        
+        patched = await integrated_service.patch_task(task_b.id, {"status": TaskStatus.COMPLETED})
+        assert patched.status == TaskStatus.COMPLETED
+        assert patched.updated_at > task_b.updated_at
+        assert patched.dependencies == [task_a.id]
+        
+        node = await integrated_service.graph_storage.get_node(task_b.id)
+        assert node.data["status"] == "COMPLETED"
+        assert await integrated_service.graph_storage.get_dependencies(task_b.id) == [task_a.id]
+        assert await integrated_service.graph_storage.get_dependents(task_b.id) == [task_c.id]
+        
+        missing = UUID('00000000-0000-0000-0000-000000000000')
+        assert await integrated_service.patch_task(missing, {"notes": "Missing"}) is None
+    
+    async def test_rebuild_graph(self, integrated_service: TaskService):
+        """Test restoring the dependency graph from table storage."""
+        task_a = Task(name="Task A", description="First task in chain", implementation_guide="A implementation")
+        task_b = Task(name="Task B", description="Second task in chain", implementation_guide="B implementation")
+        await integrated_service.bulk_create_tasks([task_a, task_b])
+        await integrated_service.add_dependency(task_b.id, task_a.id)
+        
+        await integrated_service.graph_storage.clear()
+        await integrated_service.rebuild_graph()
+        
+        assert len(await integrated_service.graph_storage.get_all_nodes()) == 2
+        assert await integrated_service.graph_storage.get_dependencies(task_b.id) == [task_a.id]
+        order = await integrated_service.get_execution_order()
+        assert [task.id for task in order] == [task_a.id, task_b.id]
+    
     async def test_task_filtering_and_queries(self, integrated_service: TaskService):
         """Test advanced querying and filtering across storage systems."""
         # Create diverse set of tasks
@@ -1,7 +1,7 @@
 """Comprehensive tests for enhanced task models."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
 from pydantic import ValidationError
@@ -16,6 +16,7 @@ from src.models.task import (
     Task,
     TaskDependency,
     TaskStatus,
+    TaskView,
 )
 
 
@@ -237,6 +238,10 @@ class TestTask:
         assert len(task.related_files) == 0
         assert isinstance(task.created_at, datetime)
         assert isinstance(task.updated_at, datetime)
+        
+        # Default timestamps are UTC, truncated to milliseconds
+        assert task.created_at.tzinfo == timezone.utc
+        assert task.created_at.microsecond % 1000 == 0
     
     def test_task_with_all_fields(self):
         """Test creating task with all optional fields."""
@@ -256,7 +261,7 @@ class TestTask:
             priority=Priority.P1,
             complexity=ComplexityLevel.MODERATE,
             estimated_hours=6,
-            dependencies=[TaskDependency(task_id=dependency_id)],
+            dependencies=[dependency_id],
             related_files=[related_file],
             category="Development",
             notes="Important task notes"
@@ -268,7 +273,7 @@ class TestTask:
         assert task.complexity == ComplexityLevel.MODERATE
         assert task.estimated_hours == 6
         assert len(task.dependencies) == 1
-        assert task.dependencies[0].task_id == dependency_id
+        assert task.dependencies[0] == dependency_id
         assert len(task.related_files) == 1
         assert task.category == "Development"
         assert task.notes == "Important task notes"
@@ -440,24 +445,63 @@ class TestTask:
         
         assert task.updated_at > original_updated_at
     
+    def test_task_view(self):
+        """Test the read-only task view."""
+        task = Task(
+            name="Test Task",
+            description="A test task for validation",
+            implementation_guide="Test implementation guide",
+            priority=Priority.P1,
+            dependencies=[uuid4()]
+        )
+        
+        view = task.view()
+        
+        assert isinstance(view, TaskView)
+        assert view.id == task.id
+        assert view.name == task.name
+        assert view.priority == "P1"
+        assert view.updated_at == task.updated_at
+        assert not hasattr(view, "__dict__")
+        
+        # Lists are copied, so later changes to the task don't show through
+        assert view.dependencies == tuple(task.dependencies)
+        task.dependencies.append(uuid4())
+        assert len(view.dependencies) == 1
+        
+        with pytest.raises(AttributeError):
+            view.name = "Changed"
+    
     def test_task_with_dependencies(self):
         """Test task with multiple dependencies."""
         dep1_id = uuid4()
         dep2_id = uuid4()
         
+        task = Task(
+            name="Dependent Task",
+            description="Task with dependencies",
+            implementation_guide="Implement after dependencies",
+            dependencies=[dep1_id, dep2_id]
+        )
+        
+        assert task.dependencies == [dep1_id, dep2_id]
+    
+    def test_task_legacy_dependencies(self):
+        """Test TaskDependency objects and mappings are unwrapped to IDs."""
+        dep1_id = uuid4()
+        dep2_id = uuid4()
+        
         task = Task(
             name="Dependent Task",
             description="Task with dependencies",
             implementation_guide="Implement after dependencies",
             dependencies=[
                 TaskDependency(task_id=dep1_id),
-                TaskDependency(task_id=dep2_id)
+                {"task_id": str(dep2_id)}
             ]
         )
         
-        assert len(task.dependencies) == 2
-        assert task.dependencies[0].task_id == dep1_id
-        assert task.dependencies[1].task_id == dep2_id
+        assert task.dependencies == [dep1_id, dep2_id]
     
     def test_task_with_related_files(self):
         """Test task with multiple related files."""
@@ -5,11 +5,14 @@ Tests the core task splitting models, schemas, and validation logic
 following TDD principles.
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
 from typing import List, Dict, Any
 
+from pydantic import ValidationError
+
 from src.models.task_splitting import (
     UpdateMode,
     TaskSplitRequest,
@@ -17,13 +20,16 @@ from src.models.task_splitting import (
     SplitResult,
     SplitOperation,
     TaskDecomposition,
-    GranularityRules
+    GranularityRules,
+    DEFAULT_GRANULARITY_RULES
 )
 from src.models.task import Task, TaskStatus, Priority, ComplexityLevel
 from src.schemas.splitting_schemas import (
+    RawTaskSplitSchema,
     TaskSplitRequestSchema,
     TaskTemplateSchema,
-    SplitResultSchema
+    SplitResultSchema,
+    get_schema_json
 )
 
 class TestUpdateMode:
@@ -69,6 +75,23 @@ class TestGranularityRules:
         assert rules.max_task_duration_hours == 8
         assert rules.max_subtasks_per_split == 5
     
+    def test_default_rules_are_shared_and_frozen(self):
+        """Test requests share the frozen default rules."""
+        template = TaskTemplate(
+            name="Valid Task",
+            description="This is a valid task description with adequate length",
+            implementation_guide="Valid implementation guide"
+        )
+        request = TaskSplitRequest(task_templates=[template])
+        
+        assert request.granularity_rules is DEFAULT_GRANULARITY_RULES
+        with pytest.raises(ValidationError):
+            DEFAULT_GRANULARITY_RULES.max_subtasks_per_split = 5
+        
+        custom = DEFAULT_GRANULARITY_RULES.model_copy(update={"max_subtasks_per_split": 5})
+        assert custom.max_subtasks_per_split == 5
+        assert DEFAULT_GRANULARITY_RULES.max_subtasks_per_split == 10
+    
     def test_validate_task_count(self):
         """Test task count validation."""
         rules = GranularityRules(max_subtasks_per_split=3)
@@ -140,6 +163,30 @@ class TestTaskTemplate:
         assert template.notes == "Consider OAuth providers"
         assert template.verification_criteria == "User can successfully login and logout"
     
+    def test_template_strips_strings(self):
+        """Test surrounding whitespace is stripped without touching the input."""
+        data = {
+            "name": "  Padded Name  ",
+            "description": "Description long enough to pass validation",
+            "implementation_guide": "Implementation guide long enough",
+            "dependencies": [" First ", "First", "  "],
+            "category": "backend\n"
+        }
+        
+        template = TaskTemplate.model_validate(data)
+        
+        assert template.name == "Padded Name"
+        assert template.dependencies == ["First"]
+        assert template.category == "backend"
+        assert data["name"] == "  Padded Name  "
+        
+        with pytest.raises(ValidationError):
+            TaskTemplate(
+                name="   ",
+                description="Description long enough to pass validation",
+                implementation_guide="Implementation guide long enough"
+            )
+    
     def test_template_to_task_conversion(self):
         """Test converting template to actual Task."""
         template = TaskTemplate(
@@ -262,6 +309,20 @@ class TestTaskSplitRequest:
         )
         
         assert request.validate_granularity() is True
+    
+    def test_duplicate_task_names_rejected(self):
+        """Test duplicate names are caught ignoring case and whitespace."""
+        templates = [
+            TaskTemplate(
+                name=name,
+                description="This is a valid task description with adequate length",
+                implementation_guide="Valid implementation guide"
+            )
+            for name in ["Setup Database", "setup database "]
+        ]
+        
+        with pytest.raises(ValidationError, match="duplicate: 'setup database'"):
+            TaskSplitRequest(task_templates=templates)
 
 
 class TestSplitOperation:
@@ -344,6 +405,9 @@ class TestSplitResult:
         assert result.operation.tasks_added == 1
         assert result.message == "Successfully created 1 task"
         assert result.errors == []
+        assert result.task_count == 1
+        assert result.get_task_names() == ("Task 1",)
+        assert result.get_task_names() is result.get_task_names()
     
     def test_create_failed_result(self):
         """Test creating a failed split result."""
@@ -482,6 +546,61 @@ class TestSplittingSchemas:
         assert validated.name == "Valid Task Name"
         assert len(validated.dependencies) == 1
         assert validated.notes == "Additional notes"
+
+    def test_schema_aliases_keep_old_schema_rules(self):
+        """Test rules of the former schema copies hold on the canonical models."""
+        template_data = {
+            "name": "Valid Task Name",
+            "description": "This is a valid task description with sufficient length",
+            "implementation_guide": "Valid implementation guide with steps",
+            "priority": None
+        }
+    
+        template = TaskTemplateSchema.model_validate(template_data)
+        assert template.priority == Priority.P2
+    
+        request = TaskSplitRequestSchema.model_validate({
+            "task_templates": [template_data],
+            "granularity_rules": None
+        })
+        assert request.granularity_rules is DEFAULT_GRANULARITY_RULES
+    
+        # More than 20 templates still fail, through the granularity check
+        # (max_subtasks_per_split is capped at 20) rather than a length limit
+        templates = [
+            dict(template_data, name=f"Task {i}") for i in range(21)
+        ]
+        lenient_rules = GranularityRules(max_subtasks_per_split=20)
+        request = TaskSplitRequestSchema.model_validate({
+            "task_templates": templates,
+            "granularity_rules": lenient_rules
+        })
+        assert request.validate_granularity() is False
+    
+        # Related files follow the stored Task rule: a single-line range is valid
+        template = TaskTemplateSchema.model_validate(dict(
+            template_data,
+            related_files=[{
+                "path": "src/main.py",
+                "type": "TO_MODIFY",
+                "description": "Entry point",
+                "line_start": 10,
+                "line_end": 10
+            }]
+        ))
+        assert template.related_files[0].line_end == 10
+    
+        with pytest.raises(ValidationError):
+            TaskTemplateSchema.model_validate(dict(
+                template_data,
+                related_files=[{
+                    "path": "src/main.py",
+                    "type": "TO_MODIFY",
+                    "description": "Entry point",
+                    "line_start": 10,
+                    "line_end": 9
+                }]
+            ))
     
     def test_split_result_schema(self):
         """Test SplitResult schema validation."""
@@ -506,4 +625,27 @@ class TestSplittingSchemas:
         
         assert validated.success is True
         assert validated.message == "Success"
-        assert len(validated.errors) == 0
\ No newline at end of file
+        assert len(validated.errors) == 0
+    
+    def test_raw_task_split_schema_parses_once(self):
+        """Test RawTaskSplitSchema keeps the decoded task list."""
+        raw = RawTaskSplitSchema.model_validate({
+            "updateMode": "append",
+            "tasksRaw": '[{"name": "Test Task"}]'
+        })
+        
+        assert raw.parsed == [{"name": "Test Task"}]
+        
+        with pytest.raises(ValidationError, match="JSON array"):
+            RawTaskSplitSchema.model_validate({"tasksRaw": '{"name": "Test Task"}'})
+        with pytest.raises(ValidationError, match="valid JSON"):
+            RawTaskSplitSchema.model_validate({"tasksRaw": '[{"name": "Test Task"'})
+        with pytest.raises(ValidationError, match="JSON array"):
+            RawTaskSplitSchema.model_validate({"tasksRaw": "not json at all"})
+    
+    def test_schema_json_is_cached(self):
+        """Test JSON schemas are built once and match the model's schema."""
+        schema_json = get_schema_json(RawTaskSplitSchema)
+        
+        assert get_schema_json(RawTaskSplitSchema) is schema_json
+        assert json.loads(schema_json) == RawTaskSplitSchema.model_json_schema()
@@ -125,8 +125,8 @@ class TestDependencyResolver:
         
         # Dependencies should be resolved to task IDs
         dep_names = [existing_tasks[0].name, existing_tasks[1].name]
-        for dep in resolved_task.dependencies:
-            assert any(task.id == dep.task_id for task in existing_tasks)
+        for dep_id in resolved_task.dependencies:
+            assert any(task.id == dep_id for task in existing_tasks)
     
     def test_resolve_dependencies_by_id(self):
         """Test resolving dependencies by task IDs."""
@@ -151,7 +151,7 @@ class TestDependencyResolver:
         assert len(resolved_task.dependencies) == 2
         
         # Check that the correct task IDs were resolved
-        resolved_ids = {dep.task_id for dep in resolved_task.dependencies}
+        resolved_ids = set(resolved_task.dependencies)
         expected_ids = {task_a.id, task_b.id}
         assert resolved_ids == expected_ids
     
@@ -177,7 +177,7 @@ class TestDependencyResolver:
         resolved_task = resolved[0]
         # Only the existing dependency should be resolved
         assert len(resolved_task.dependencies) == 1
-        assert resolved_task.dependencies[0].task_id == existing_tasks[0].id
+        assert resolved_task.dependencies[0] == existing_tasks[0].id
     
     def test_circular_dependency_detection(self):
         """Test detection of circular dependencies."""
@@ -407,6 +407,24 @@ class TestAbstractGraphStorage:
         edges = await graph_storage.get_all_edges()
         assert len(edges) == 0
     
+    async def test_update_node_keeps_edges(
+        self, graph_storage: MockGraphStorage
+    ) -> None:
+        """Test that the default node update restores the node's edges."""
+        task1_id, task2_id, task3_id = uuid4(), uuid4(), uuid4()
+        for task_id in (task1_id, task2_id, task3_id):
+            await graph_storage.add_node(GraphNode(id=task_id, data={"name": "task"}))
+        await graph_storage.add_edge(GraphEdge(from_id=task2_id, to_id=task1_id))
+        await graph_storage.add_edge(GraphEdge(from_id=task3_id, to_id=task2_id))
+        
+        updated = GraphNode(id=task2_id, data={"name": "renamed"})
+        assert await graph_storage.update_node(updated) is True
+        assert await graph_storage.get_node(task2_id) == updated
+        assert await graph_storage.get_dependencies(task2_id) == [task1_id]
+        assert await graph_storage.get_dependents(task2_id) == [task3_id]
+        
+        assert await graph_storage.update_node(GraphNode(id=uuid4())) is False
+    
     async def test_clear_graph(self, graph_storage: MockGraphStorage) -> None:
         """Test clearing entire graph."""
         # Add some nodes and edges
@@ -1,6 +1,9 @@
 """Tests for DuckDB table storage implementation."""
 
+import asyncio
+import io
 import json
+import duckdb
 import pytest
 from pathlib import Path
 from uuid import uuid4
@@ -72,6 +75,26 @@ class TestDuckDBTableStorage:
         with pytest.raises(ValueError, match="already exists"):
             await table_storage.create(task)
     
+    async def test_concurrent_duplicate_creation(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test that only one of several concurrent creates of an item succeeds."""
+        task = Task(
+            name="Test Task",
+            description="A test task for storage testing",
+            implementation_guide="Test implementation guide"
+        )
+        
+        results = await asyncio.gather(
+            *(table_storage.create(task) for _ in range(5)), return_exceptions=True
+        )
+        
+        assert sum(result is task for result in results) == 1
+        assert all(
+            isinstance(result, ValueError) for result in results if result is not task
+        )
+        assert await table_storage.count() == 1
+    
     async def test_update_nonexistent_fails(
         self, table_storage: DuckDBTableStorage
     ) -> None:
@@ -222,6 +245,128 @@ class TestDuckDBTableStorage:
         assert len(pending_p1_tasks) == 1
         assert pending_p1_tasks[0].id == task1.id
     
+    async def test_query_by_name_with_limit(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test name lookups and limiting query results."""
+        tasks = [
+            Task(
+                name="Shared Name" if i < 2 else f"Task {i}",
+                description=f"Description {i}",
+                implementation_guide=f"Implementation {i}"
+            )
+            for i in range(4)
+        ]
+        for task in tasks:
+            await table_storage.create(task)
+        
+        named = await table_storage.query({"name": "Shared Name"}, limit=1)
+        assert [task.id for task in named] == [tasks[0].id]
+        assert len(await table_storage.query({"name": "Shared Name"})) == 2
+        assert len(await table_storage.query({}, limit=3)) == 3
+        assert await table_storage.query({"name": "Missing"}, limit=1) == []
+    
+    async def test_count_facets(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test per-field value counts from a single grouped query."""
+        await table_storage.bulk_insert([
+            Task(
+                name=f"Task {i}",
+                description=f"Description {i}",
+                implementation_guide=f"Implementation {i}",
+                status=status,
+                category=category
+            )
+            for i, (status, category) in enumerate([
+                (TaskStatus.PENDING, "Backend"),
+                (TaskStatus.PENDING, "Frontend"),
+                (TaskStatus.COMPLETED, "Backend"),
+                (TaskStatus.IN_PROGRESS, None),
+            ])
+        ])
+        
+        counts = await table_storage.count_facets(["status", "category"])
+        assert counts["status"] == {"PENDING": 2, "COMPLETED": 1, "IN_PROGRESS": 1}
+        assert counts["category"] == {"Backend": 2, "Frontend": 1, None: 1}
+        
+        assert await table_storage.count_facets([]) == {}
+        with pytest.raises(ValueError, match="Invalid field name"):
+            await table_storage.count_facets(["status'; DROP TABLE task; --"])
+    
+    async def test_get_many(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test fetching several items by ID in one query."""
+        tasks = [
+            Task(
+                name=f"Task {i}",
+                description=f"Description {i}",
+                implementation_guide=f"Implementation {i}"
+            )
+            for i in range(3)
+        ]
+        await table_storage.bulk_insert(tasks)
+        
+        missing_id = uuid4()
+        found = await table_storage.get_many([tasks[2].id, tasks[0].id, missing_id])
+        assert set(found) == {tasks[0].id, tasks[2].id}
+        assert found[tasks[2].id].name == "Task 2"
+        
+        assert await table_storage.get_many([]) == {}
+    
+    async def test_get_fields(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test reading selected fields, truncating long strings in SQL."""
+        short = Task(name="Short", description="Brief task", implementation_guide="Short guide")
+        long = Task(name="Long", description="x" * 100, implementation_guide="Long guide")
+        await table_storage.bulk_insert([short, long])
+        
+        rows = await table_storage.get_fields(
+            [short.id, long.id, uuid4()], ["name", "description"],
+            max_lengths={"description": 10}
+        )
+        assert rows == {
+            short.id: {"name": "Short", "description": "Brief task"},
+            long.id: {"name": "Long", "description": "x" * 10 + "..."},
+        }
+        
+        assert await table_storage.get_fields([], ["name"]) == {}
+        with pytest.raises(ValueError, match="Invalid field name"):
+            await table_storage.get_fields([short.id], ["name) FROM task; --"])
+    
+    async def test_concurrent_operations(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test concurrent writes and reads across the storage's workers."""
+        tasks = [
+            Task(
+                name=f"Concurrent Task {i}",
+                description=f"Description {i}",
+                implementation_guide=f"Implementation {i}"
+            )
+            for i in range(10)
+        ]
+        
+        await asyncio.gather(*(table_storage.create(task) for task in tasks))
+        counts = await asyncio.gather(*(table_storage.count() for _ in range(5)))
+        assert counts == [10] * 5
+        
+        # Different read queries awaited together each use a read cursor
+        count, items, stats, facets = await asyncio.gather(
+            table_storage.count(),
+            table_storage.list_all(),
+            table_storage.get_statistics(),
+            table_storage.count_facets(["status"]),
+        )
+        assert count == len(items) == stats["total_count"] == 10
+        assert facets["status"] == {"PENDING": 10}
+        
+        # A write is visible to the very next read
+        await table_storage.delete(tasks[0].id)
+        assert await table_storage.get_by_id(tasks[0].id) is None
+    
     async def test_count_operations(
         self, table_storage: DuckDBTableStorage
     ) -> None:
@@ -317,6 +462,24 @@ class TestDuckDBTableStorage:
         all_ids = {task.id for task in all_tasks}
         expected_ids = {task.id for task in tasks}
         assert all_ids == expected_ids
+        
+        # Documents round-trip unchanged and fill the mirrored columns
+        assert await table_storage.get_by_id(tasks[0].id) == tasks[0]
+        assert len(await table_storage.query({"status": TaskStatus.PENDING})) == 5
+    
+    async def test_bulk_insert_is_atomic(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test that a batch with a repeated ID inserts nothing."""
+        task = Task(
+            name="Repeated Task",
+            description="Appears twice in one batch",
+            implementation_guide="Repeated implementation"
+        )
+        
+        with pytest.raises(duckdb.ConstraintException):
+            await table_storage.bulk_insert([task, task])
+        assert await table_storage.count() == 0
     
     async def test_bulk_insert_with_duplicate_fails(
         self, table_storage: DuckDBTableStorage
@@ -340,6 +503,68 @@ class TestDuckDBTableStorage:
         with pytest.raises(ValueError, match="already exists"):
             await table_storage.bulk_insert([existing_task, new_task])
     
+    async def test_export_json(
+        self, table_storage: DuckDBTableStorage, tmp_path: Path
+    ) -> None:
+        """Test streaming all items to a JSON array file."""
+        tasks = [
+            Task(
+                name=f"Export Task {i}",
+                description=f"Export description {i}",
+                implementation_guide=f"Export implementation {i}"
+            )
+            for i in range(5)
+        ]
+        await table_storage.bulk_insert(tasks)
+        
+        export_path = tmp_path / "export.json"
+        with open(export_path, "w") as f:
+            count = await table_storage.export_json(f, batch_size=2)
+        assert count == 5
+        
+        exported = [Task.model_validate(data) for data in json.loads(export_path.read_text())]
+        assert {task.id for task in exported} == {task.id for task in tasks}
+        
+        # An empty table still produces a valid document
+        await table_storage.clear()
+        with open(export_path, "w") as f:
+            assert await table_storage.export_json(f) == 0
+        assert json.loads(export_path.read_text()) == []
+    
+    async def test_patch(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test updating selected fields without rewriting the item."""
+        task = Task(
+            name="Patch Task",
+            description="Patch description",
+            implementation_guide="Patch implementation",
+            estimated_hours=4
+        )
+        await table_storage.create(task)
+        
+        patched = await table_storage.patch(
+            task.id, {"status": TaskStatus.COMPLETED, "notes": "Done"}
+        )
+        assert patched.status == TaskStatus.COMPLETED
+        assert patched.notes == "Done"
+        assert patched.name == task.name
+        assert await table_storage.get_by_id(task.id) == patched
+        assert len(await table_storage.query({"status": TaskStatus.COMPLETED})) == 1
+        assert patched.updated_at > task.updated_at
+        
+        # None falls back to the model default, in the columns as well
+        reset = await table_storage.patch(task.id, {"status": None})
+        assert reset.status == TaskStatus.PENDING
+        assert len(await table_storage.query({"status": TaskStatus.PENDING})) == 1
+        
+        # Invalid results are rolled back
+        with pytest.raises(ValueError):
+            await table_storage.patch(task.id, {"complexity": "EPIC"})
+        assert await table_storage.get_by_id(task.id) == reset
+        
+        assert await table_storage.patch(uuid4(), {"notes": "Missing"}) is None
+    
     async def test_get_statistics(
         self, table_storage: DuckDBTableStorage
     ) -> None:
@@ -382,6 +607,100 @@ class TestDuckDBTableStorage:
         all_tasks = await table_storage.query({})
         assert len(all_tasks) == 3
     
+    async def test_scalar_fields_mirrored_in_columns(
+        self, table_storage: DuckDBTableStorage
+    ) -> None:
+        """Test hot scalar fields are kept in sync in their own columns."""
+        task = Task(
+            name="Column Task",
+            description="Task with mirrored columns",
+            implementation_guide="Column implementation",
+            priority=Priority.P0,
+            category="Backend",
+            estimated_hours=8
+        )
+        await table_storage.create(task)
+        
+        task.status = TaskStatus.COMPLETED
+        await table_storage.update(task)
+        
+        rows = await table_storage.query_sql(
+            "SELECT status, priority, category, estimated_hours FROM task"
+        )
+        assert rows == [{
+            "status": "COMPLETED",
+            "priority": "P0",
+            "category": "Backend",
+            "estimated_hours": 8
+        }]
+        
+        assert len(await table_storage.query({"estimated_hours": 8})) == 1
+        assert len(await table_storage.query({"estimated_hours": "8"})) == 1
+        assert await table_storage.query({"estimated_hours": "eight"}) == []
+    
+    async def test_existing_table_gets_columns_backfilled(
+        self, tmp_path: Path
+    ) -> None:
+        """Test tables from before the column mirror are migrated on open."""
+        task = Task(
+            name="Legacy Task",
+            description="Stored with JSON only",
+            implementation_guide="Legacy implementation",
+            status=TaskStatus.IN_PROGRESS,
+            estimated_hours=4
+        )
+        db_path = str(tmp_path / "legacy.duckdb")
+        connection = duckdb.connect(db_path)
+        connection.execute("""
+            CREATE TABLE task (
+                id UUID PRIMARY KEY,
+                data JSON NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        connection.execute(
+            "INSERT INTO task (id, data) VALUES (?, ?)",
+            [str(task.id), task.model_dump_json()]
+        )
+        connection.close()
+        
+        storage = DuckDBTableStorage(Task, database_path=db_path)
+        in_progress = await storage.query({"status": TaskStatus.IN_PROGRESS})
+        assert [item.id for item in in_progress] == [task.id]
+        assert (await storage.count_facets(["estimated_hours"]))["estimated_hours"] == {4: 1}
+        storage.close()
+    
+    async def test_legacy_dependencies_rewritten_on_open(
+        self, tmp_path: Path
+    ) -> None:
+        """Test stored {"task_id": ...} dependencies become bare UUIDs."""
+        dep_id = uuid4()
+        task = Task(
+            name="Legacy Task",
+            description="Stored with wrapped dependencies",
+            implementation_guide="Legacy implementation",
+            dependencies=[dep_id]
+        )
+        legacy = json.loads(task.model_dump_json())
+        legacy["dependencies"] = [{"task_id": str(dep_id)}]
+        
+        db_path = str(tmp_path / "legacy.duckdb")
+        storage = DuckDBTableStorage(Task, database_path=db_path)
+        await storage.create(task)
+        await storage.query_sql(
+            "UPDATE task SET data = ? WHERE id = ?", [json.dumps(legacy), str(task.id)]
+        )
+        storage.close()
+        
+        storage = DuckDBTableStorage(Task, database_path=db_path)
+        buffer = io.StringIO()
+        await storage.export_json(buffer)
+        [exported] = json.loads(buffer.getvalue())
+        assert exported["dependencies"] == [str(dep_id)]
+        assert (await storage.get_by_id(task.id)).dependencies == [dep_id]
+        storage.close()
+    
     async def test_custom_table_name(self) -> None:
         """Test creating storage with custom table name."""
         custom_storage = DuckDBTableStorage(
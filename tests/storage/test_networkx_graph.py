@@ -1,5 +1,6 @@
 """Tests for NetworkX graph storage implementation."""
 
+import networkx as nx
 import pytest
 from uuid import uuid4
 
@@ -34,6 +35,54 @@ class TestNetworkXGraphStorage:
         result = await graph_storage.add_node(node)
         assert result is False
     
+    async def test_bulk_node_operations(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test adding several nodes at once."""
+        existing = GraphNode(id=uuid4(), data={"name": "existing"})
+        await graph_storage.add_node(existing)
+        
+        new_nodes = [GraphNode(id=uuid4(), data={"name": f"task{i}"}) for i in range(3)]
+        
+        result = await graph_storage.add_nodes([existing] + new_nodes)
+        assert result == [False, True, True, True]
+        
+        nodes = await graph_storage.get_all_nodes()
+        assert len(nodes) == 4
+        assert await graph_storage.get_node(new_nodes[0].id) == new_nodes[0]
+    
+    async def test_bulk_edge_operations(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test adding several edges at once."""
+        node1_id, node2_id, node3_id = uuid4(), uuid4(), uuid4()
+        await graph_storage.add_nodes([
+            GraphNode(id=node_id, data={"name": f"task{i}"})
+            for i, node_id in enumerate([node1_id, node2_id, node3_id], 1)
+        ])
+        
+        result = await graph_storage.add_edges([
+            GraphEdge(from_id=node1_id, to_id=node2_id),
+            GraphEdge(from_id=node2_id, to_id=node3_id, relationship="blocks")
+        ])
+        assert result == [True, True]
+        assert await graph_storage.topological_sort() == [node1_id, node2_id, node3_id]
+        assert await graph_storage.edge_count() == 2
+        
+        # A batch that closes a cycle falls back to per-edge results
+        result = await graph_storage.add_edges([
+            GraphEdge(from_id=node1_id, to_id=node3_id),
+            GraphEdge(from_id=node3_id, to_id=node1_id),
+            GraphEdge(from_id=node1_id, to_id=uuid4())
+        ])
+        assert result == [True, False, False]
+        assert await graph_storage.has_cycle() is False
+        assert await graph_storage.edge_count() == 3
+        
+        edges = await graph_storage.get_all_edges()
+        relationships = {(edge.from_id, edge.to_id): edge.relationship for edge in edges}
+        assert relationships[(node2_id, node3_id)] == "blocks"
+    
     async def test_basic_edge_operations(
         self, graph_storage: NetworkXGraphStorage
     ) -> None:
@@ -81,6 +130,10 @@ class TestNetworkXGraphStorage:
         result = await graph_storage.add_edge(cycle_edge)
         assert result is False  # Should be rejected
         
+        # Self-loops are cycles too, but shortcut edges are not
+        assert await graph_storage.add_edge(GraphEdge(from_id=node2_id, to_id=node2_id)) is False
+        assert await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node3_id)) is True
+        
         # Graph should still be acyclic
         assert await graph_storage.has_cycle() is False
     
@@ -111,6 +164,95 @@ class TestNetworkXGraphStorage:
         # In topological order: dependencies come after their dependents
         assert node1_idx < node2_idx < node3_idx
     
+    async def test_topological_sort_with_dependencies(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test topological order is returned with each node's dependencies."""
+        node1_id, node2_id, node3_id = uuid4(), uuid4(), uuid4()
+        await graph_storage.add_nodes([
+            GraphNode(id=node_id, data={"name": f"task{i}"})
+            for i, node_id in enumerate([node1_id, node2_id, node3_id], 1)
+        ])
+        
+        # node1 depends on node2 and node3, node2 depends on node3
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node3_id))
+        await graph_storage.add_edge(GraphEdge(from_id=node2_id, to_id=node3_id))
+        
+        order, dependencies = await graph_storage.topological_sort_with_dependencies()
+        assert order == [node1_id, node2_id, node3_id]
+        assert set(dependencies[node1_id]) == {node2_id, node3_id}
+        assert dependencies[node2_id] == [node3_id]
+        assert dependencies[node3_id] == []
+    
+    async def test_topological_sort_cache_invalidation(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test cached topological order is refreshed after mutations."""
+        node1_id, node2_id = uuid4(), uuid4()
+        await graph_storage.add_nodes([
+            GraphNode(id=node1_id, data={"name": "task1"}),
+            GraphNode(id=node2_id, data={"name": "task2"})
+        ])
+        
+        edge = GraphEdge(from_id=node2_id, to_id=node1_id)
+        await graph_storage.add_edge(edge)
+        first = await graph_storage.topological_sort()
+        assert first == [node2_id, node1_id]
+        
+        # Mutating the returned list must not corrupt the cached order
+        first.reverse()
+        assert await graph_storage.topological_sort() == [node2_id, node1_id]
+        
+        # Reversing the dependency must produce a fresh order
+        await graph_storage.remove_edge(edge)
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        assert await graph_storage.topological_sort() == [node1_id, node2_id]
+        
+        node3_id = uuid4()
+        await graph_storage.add_node(GraphNode(id=node3_id, data={"name": "task3"}))
+        assert node3_id in await graph_storage.topological_sort()
+        
+        await graph_storage.remove_node(node3_id)
+        assert node3_id not in await graph_storage.topological_sort()
+    
+    async def test_cycle_cache(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test the cached cycle check and node data follow mutations."""
+        node1_id, node2_id = uuid4(), uuid4()
+        await graph_storage.add_node(GraphNode(id=node1_id, data={"name": "task1"}))
+        await graph_storage.add_node(GraphNode(id=node2_id, data={"name": "task2"}))
+        
+        assert await graph_storage.has_cycle() is False
+        assert await graph_storage.has_cycle() is False
+        
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        assert await graph_storage.has_cycle() is False
+        
+        # Replacing node data keeps the node's edges
+        await graph_storage.update_node(GraphNode(id=node1_id, data={"name": "renamed"}))
+        assert (await graph_storage.get_node(node1_id)).data == {"name": "renamed"}
+        assert await graph_storage.get_dependencies(node1_id) == [node2_id]
+    
+    async def test_acyclic_answer_survives_mutations(
+        self, graph_storage: NetworkXGraphStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an acyclic graph is not traversed again after it changes."""
+        node1_id, node2_id, node3_id = uuid4(), uuid4(), uuid4()
+        for node_id in (node1_id, node2_id, node3_id):
+            await graph_storage.add_node(GraphNode(id=node_id, data={}))
+        assert await graph_storage.has_cycle() is False
+        
+        def fail(graph: nx.DiGraph) -> bool:
+            raise AssertionError("graph traversed again")
+        
+        monkeypatch.setattr(nx, "is_directed_acyclic_graph", fail)
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        assert not await graph_storage.add_edge(GraphEdge(from_id=node2_id, to_id=node1_id))
+        await graph_storage.remove_node(node3_id)
+        assert await graph_storage.has_cycle() is False
+    
     async def test_remove_node_removes_edges(
         self, graph_storage: NetworkXGraphStorage
     ) -> None:
@@ -137,6 +279,26 @@ class TestNetworkXGraphStorage:
         # All edges involving node2 should be removed
         edges = await graph_storage.get_all_edges()
         assert len(edges) == 0
+    
+    async def test_removed_node_slot_is_reused(
+        self, graph_storage: NetworkXGraphStorage
+    ) -> None:
+        """Test a node added after a removal gets none of the old node's edges."""
+        node1_id, node2_id, node3_id = uuid4(), uuid4(), uuid4()
+        for node_id in (node1_id, node2_id):
+            await graph_storage.add_node(GraphNode(id=node_id, data={}))
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        
+        await graph_storage.remove_node(node2_id)
+        await graph_storage.add_node(GraphNode(id=node3_id, data={}))
+        assert await graph_storage.get_dependencies(node1_id) == []
+        assert await graph_storage.get_dependencies(node2_id) == []
+        
+        await graph_storage.add_edge(GraphEdge(from_id=node3_id, to_id=node1_id))
+        assert await graph_storage.get_dependents(node1_id) == [node3_id]
+        assert await graph_storage.topological_sort() == [node3_id, node1_id]
+        edges = await graph_storage.get_all_edges()
+        assert [(edge.from_id, edge.to_id) for edge in edges] == [(node3_id, node1_id)]
         
         # Node2 should not exist
         assert await graph_storage.get_node(node2_id) is None
@@ -167,6 +329,14 @@ class TestNetworkXGraphStorage:
         # Path that doesn't exist
         path = await graph_storage.get_shortest_path(node4_id, node1_id)
         assert path is None
+        
+        # Cached BFS results are dropped when the graph changes
+        await graph_storage.remove_edge(GraphEdge(from_id=node1_id, to_id=node4_id))
+        path = await graph_storage.get_shortest_path(node1_id, node4_id)
+        assert path == [node1_id, node2_id, node3_id, node4_id]
+        
+        assert await graph_storage.get_shortest_path(node2_id, node2_id) == [node2_id]
+        assert await graph_storage.get_shortest_path(node1_id, uuid4()) is None
     
     async def test_descendants_and_ancestors(
         self, graph_storage: NetworkXGraphStorage
@@ -220,6 +390,8 @@ class TestNetworkXGraphStorage:
         assert metrics["node_count"] == 0
         assert metrics["edge_count"] == 0
         assert metrics["is_dag"] is True
+        assert await graph_storage.node_count() == 0
+        assert await graph_storage.edge_count() == 0
         
         # Add nodes and edges
         node1_id, node2_id, node3_id = uuid4(), uuid4(), uuid4()
@@ -235,10 +407,18 @@ class TestNetworkXGraphStorage:
         metrics = await graph_storage.get_graph_metrics()
         assert metrics["node_count"] == 3
         assert metrics["edge_count"] == 2
+        assert await graph_storage.node_count() == 3
+        assert await graph_storage.edge_count() == 2
         assert metrics["is_dag"] is True
         assert metrics["density"] > 0.0
         assert "strongly_connected_components" in metrics
         assert "weakly_connected_components" in metrics
+        
+        # Cached metrics are refreshed after the graph changes
+        await graph_storage.remove_edge(GraphEdge(from_id=node2_id, to_id=node3_id))
+        metrics = await graph_storage.get_graph_metrics()
+        assert metrics["edge_count"] == 1
+        assert metrics["weakly_connected_components"] == 2
     
     async def test_edge_with_custom_relationship(
         self, graph_storage: NetworkXGraphStorage
@@ -303,4 +483,30 @@ class TestNetworkXGraphStorage:
         
         metrics = await graph_storage.get_graph_metrics()
         assert metrics["node_count"] == 0
-        assert metrics["edge_count"] == 0
\ No newline at end of file
+        assert metrics["edge_count"] == 0
+    
+    async def test_persist_and_reload(self, tmp_path) -> None:
+        """Test saving the graph and loading it in a new instance."""
+        persist_path = str(tmp_path / "graph.pkl")
+        graph_storage = NetworkXGraphStorage(persist_path=persist_path)
+        
+        node1_id, node2_id = uuid4(), uuid4()
+        await graph_storage.add_node(GraphNode(id=node1_id, data={"name": "task1"}))
+        await graph_storage.add_node(GraphNode(id=node2_id, data={"name": "task2"}))
+        await graph_storage.add_edge(GraphEdge(from_id=node1_id, to_id=node2_id))
+        order = await graph_storage.topological_sort()
+        assert graph_storage.snapshot_stamp is None
+        graph_storage.save(stamp=(2, "v1"))
+        
+        reloaded = NetworkXGraphStorage(persist_path=persist_path)
+        assert reloaded.snapshot_stamp == (2, "v1")
+        assert await reloaded.node_count() == 2
+        assert await reloaded.topological_sort() == order
+        assert (await reloaded.get_node(node1_id)).data == {"name": "task1"}
+        assert await reloaded.get_dependencies(node1_id) == [node2_id]
+        
+        # An unreadable snapshot leaves the graph empty
+        (tmp_path / "graph.pkl").write_bytes(b"")
+        unreadable = NetworkXGraphStorage(persist_path=persist_path)
+        assert await unreadable.node_count() == 0
+        assert unreadable.snapshot_stamp is None